@@ -31,10 +31,10 @@ from modules.upload_coordinator import UploadCoordinator, GroupContext
 from modules.utils import ContextUtils
 from modules.path_validator import PathValidator, PathValidationError
 from modules.error_handler import get_error_handler, ErrorSeverity
-from modules.app_state import AppState, StateManager
+from modules.app_state import AppState, StateManager, drain_queue
 from modules.config_loader import get_config_loader
 from modules.thumbnail_cache import get_thumbnail_cache
-from modules.plugin_adapter import get_service_registry
+from modules.plugin_adapter import init_service_registry
 from loguru import logger
 
 # Load user configuration (YAML-based, optional)
@@ -83,8 +83,8 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper):
         self.settings = self.settings_mgr.load()
         self.template_mgr = TemplateManager()
 
-        # Plugin System - Initialize service registry
-        self.service_registry = get_service_registry()
+        # Plugin System - Initialize service registry (plugin discovery happens here)
+        self.service_registry = init_service_registry()
         logger.info(f"Loaded services: {self.service_registry.get_service_names()}")
 
         # Centralized State Management (replaces 30+ scattered variables)
@@ -920,12 +920,10 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper):
                     shown += 1
 
             # 2. Process Result Queue (Images finished uploading)
-            try:
-                while True:
-                    fp, img, thumb = self.result_queue.get_nowait()
-                    with self.lock:
-                        self.results.append((fp, img, thumb))
-            except queue.Empty: pass
+            finished = drain_queue(self.result_queue)
+            if finished:
+                with self.lock:
+                    self.results.extend(finished)
 
             # 3. Process UI Queue (Thumbnails generation)
             ui_limit = _app_config.performance.ui_queue_batch_size
@@ -0,0 +1,83 @@
+# modules/_json_io.py
+"""
+Shared JSON (de)serialisation for the settings and template files, plugin
+schemas and API responses.
+
+Uses orjson when it is installed and falls back to the stdlib otherwise.
+Both paths work on bytes so callers can read and write files in binary mode.
+"""
+import os
+import tempfile
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+    import json
+
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj) -> bytes:
+        """Serialise obj to indented UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def dumps_compact(obj) -> bytes:
+        """Serialise obj to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+else:
+    loads = json.loads
+
+    def dumps(obj) -> bytes:
+        """Serialise obj to indented UTF-8 JSON bytes."""
+        # Same layout as orjson's OPT_INDENT_2, so files match byte for byte
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def dumps_compact(obj) -> bytes:
+        """Serialise obj to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# Mode open() would give a new file. os.umask() can only be read by setting
+# it, so do that once at import rather than racing other threads per write.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_NEW_FILE_MODE = 0o666 & ~_UMASK
+
+
+def write_atomic(filepath, payload: bytes) -> None:
+    """
+    Write payload to filepath via a temp file and an atomic rename.
+
+    A crash mid-write leaves the previous file intact instead of a
+    truncated one. The temp file is created next to the target with a
+    unique name, and an existing target's permission bits are kept; a new
+    file gets the umask-derived mode, as with open().
+
+    Args:
+        filepath: Destination path
+        payload: Bytes to write
+    """
+    directory = os.path.dirname(os.fspath(filepath)) or '.'
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        try:
+            mode = os.stat(filepath).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = _NEW_FILE_MODE  # mkstemp creates 0600
+        os.chmod(tmp, mode)
+        with os.fdopen(fd, 'wb') as f:
+            fd = None
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, filepath)
+    except BaseException:
+        if fd is not None:
+            os.close(fd)
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -8,14 +8,16 @@ import os
 import mimetypes
 import abc
 import re
+import functools
 import random
 from urllib.parse import urlparse, parse_qs
 from typing import Dict, Tuple, Optional, Any
 
 import httpx
-from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
 from bs4 import BeautifulSoup
+
 from . import config
+from . import _json_io
 from .config_loader import get_config_loader
 from .error_handler import handle_authentication_error, handle_network_error, ErrorContext, ErrorSeverity, get_error_handler
 from loguru import logger
@@ -23,6 +25,39 @@ from loguru import logger
 # Load application configuration
 _app_config = get_config_loader().config
 
+# Fast MIME lookup for the formats we actually upload; mimetypes is the fallback
+_MIME_FAST = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.bmp': 'image/bmp',
+}
+
+# Vipr result page patterns
+_VIPR_FN_RE = re.compile(r"<textarea name=['\"]fn['\"]>([^<]+)</textarea>", re.IGNORECASE)
+_VIPR_OP_RE = re.compile(r"<textarea name=['\"]op['\"]>upload_result</textarea>", re.IGNORECASE)
+_VIPR_CF520_RE = re.compile(r"<title[^>]*>[^<]*520", re.IGNORECASE)
+_VIPR_THUMB_RE = re.compile(r'https?://(?:[a-z0-9]+\.)?vipr\.im/th/[^"\s\'<>]+\.(?:jpg|jpeg|png|gif|bmp|webp)', re.IGNORECASE)
+_VIPR_LINK_RE = re.compile(r'href=["\']([^"\']*vipr\.im[^"\']*)["\']', re.IGNORECASE)
+_VIPR_DIRECT_RE = re.compile(r'https?://vipr\.im/[a-z0-9]+', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=2048)
+def _vipr_name_re(clean_name: str) -> re.Pattern:
+    """Compiled filename matcher for the soup fallback; names repeat across retries."""
+    return re.compile(re.escape(clean_name), re.IGNORECASE)
+
+def fast_json(r: httpx.Response) -> Any:
+    """
+    Decode a JSON response body.
+
+    Uses orjson on the raw bytes when installed (noticeably faster than
+    r.json()); falls back to the stdlib json module otherwise.
+    """
+    return _json_io.loads(r.content)
+
 def create_resilient_client(retries=None):
     """
     Creates an httpx.Client with automatic retries and HTTP/2 support.
@@ -47,11 +82,22 @@ def create_async_client(retries=None):
     Benefits:
     - Non-blocking I/O for better concurrency
     - Lower resource usage than threads
-    - Built-in connection pooling
+    - Built-in connection pooling (sized from NetworkConfig)
     """
+    net = _app_config.network
     if retries is None:
-        retries = _app_config.network.retry_count
-    transport = httpx.AsyncHTTPTransport(retries=retries)
+        retries = net.retry_count
+    limits = httpx.Limits(
+        max_connections=net.max_connections,
+        max_keepalive_connections=net.max_keepalive_connections,
+        keepalive_expiry=net.keepalive_expiry_seconds
+    )
+    # Pool limits and HTTP/2 only take effect when set on the transport
+    transport = httpx.AsyncHTTPTransport(
+        retries=retries,
+        http2=net.http2_enabled,
+        limits=limits
+    )
 
     client = httpx.AsyncClient(
         transport=transport,
@@ -220,7 +266,7 @@ def create_pixhost_gallery(name: str, client: httpx.Client = None) -> Optional[D
     try:
         r = client.post(config.PIX_GALLERIES_URL, data={"gallery_name": name or "Untitled"})
         if r.status_code == 200:
-            return r.json()
+            return fast_json(r)
         logger.error(f"Pixhost Gallery Create Failed: {r.status_code} {r.text}")
         return None
     except Exception as e:
@@ -229,6 +275,18 @@ def create_pixhost_gallery(name: str, client: httpx.Client = None) -> Optional[D
     finally:
         if should_close: client.close()
 
+async def create_pixhost_gallery_async(name: str, client: httpx.AsyncClient) -> Optional[Dict[str, str]]:
+    """Async variant of create_pixhost_gallery for the async upload manager."""
+    try:
+        r = await client.post(config.PIX_GALLERIES_URL, data={"gallery_name": name or "Untitled"})
+        if r.status_code == 200:
+            return fast_json(r)
+        logger.error(f"Pixhost Gallery Create Failed: {r.status_code} {r.text}")
+        return None
+    except Exception as e:
+        logger.error(f"Pixhost Gallery Create Error: {e}")
+        return None
+
 def finalize_pixhost_gallery(upload_hash: str, gallery_hash: str, client: httpx.Client = None) -> bool:
     should_close = False
     if not client:
@@ -281,27 +339,129 @@ def create_imx_gallery(user, password, name, client: httpx.Client = None):
         if should_close: client.close()
         return None
 
+async def create_imx_gallery_async(user, password, name, client: httpx.AsyncClient = None):
+    """
+    Async variant of create_imx_gallery.
+
+    Without a client, a short-lived one is used so the login cookies
+    don't end up on a shared upload client.
+    """
+    if not client:
+        async with create_async_client() as own_client:
+            return await create_imx_gallery_async(user, password, name, own_client)
+
+    # 1. Login
+    login_data = {"usr_email": user, "pwd": password, "remember": "1", "doLogin": "Login"}
+    try:
+        await client.post(config.IMX_LOGIN_URL, data=login_data, follow_redirects=True)
+    except Exception as e:
+        logger.error(f"IMX Login Error: {e}")
+        return None
+
+    # 2. Create
+    try:
+        data = {"gallery_name": name, "submit_new_gallery": "Add"}
+        resp = await client.post(config.IMX_GALLERY_ADD_URL, data=data, follow_redirects=True)
+        if "id=" in str(resp.url):
+            return parse_qs(urlparse(str(resp.url)).query).get("id", [None])[0]
+        logger.error(f"IMX Create Failed. URL: {resp.url}")
+        return None
+    except Exception as e:
+        logger.error(f"IMX Gallery Create Error: {e}")
+        return None
+
 # --- Base Uploader Class ---
 
+class ProgressFile:
+    """
+    Binary file wrapper that reports read progress for multipart uploads.
+
+    httpx reads the file directly while streaming the request body, so this
+    replaces MultipartEncoderMonitor. It exposes the same bytes_read/len
+    attributes so existing progress callbacks keep working.
+    """
+
+    def __init__(self, file_obj, callback: Any, length: int, chunk_size: Optional[int] = None):
+        self._file = file_obj
+        self.callback = callback
+        self.len = length
+        self.bytes_read = 0
+        self.chunk_size = chunk_size
+
+    def read(self, size: int = -1) -> bytes:
+        if self.chunk_size and size > 0:
+            size = self.chunk_size
+        chunk = self._file.read(size)
+        self.bytes_read += len(chunk)
+        if self.callback:
+            self.callback(self)
+        return chunk
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        # httpx rewinds the file before each attempt; restart progress with it
+        pos = self._file.seek(offset, whence)
+        self.bytes_read = pos
+        return pos
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def fileno(self) -> int:
+        return self._file.fileno()
+
+    def close(self) -> None:
+        self._file.close()
+
+
 class BaseUploader(abc.ABC):
     def __init__(self, file_path: str, monitor_callback: Any):
         self.file_path = file_path
         self.basename = os.path.basename(file_path)
-        self.mime_type = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+        ext = os.path.splitext(file_path)[1].lower()
+        self.mime_type = (_MIME_FAST.get(ext)
+                          or mimetypes.guess_type(file_path)[0]
+                          or 'application/octet-stream')
         self.file_obj = None
         self.monitor_callback = monitor_callback
         self.headers: Dict[str, str] = {
             'User-Agent': config.USER_AGENT
         }
 
-    def get_monitor(self, fields: Dict[str, Any]) -> MultipartEncoderMonitor:
-        encoder = MultipartEncoder(fields=fields)
-        monitor = MultipartEncoderMonitor(encoder, self.monitor_callback)
-        self.headers['Content-Type'] = monitor.content_type
-        return monitor
+    def open_file(self) -> ProgressFile:
+        """Open the upload file wrapped for progress reporting."""
+        self.file_obj = ProgressFile(
+            open(self.file_path, 'rb'),
+            self.monitor_callback,
+            os.path.getsize(self.file_path),
+            _app_config.network.chunk_size
+        )
+        return self.file_obj
+
+    def build_request(self, fields: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Split multipart fields into httpx ``data=`` and ``files=`` arguments.
+
+        File parts are (filename, file_obj, mime_type) tuples; everything else
+        is a plain form value. httpx sets the multipart Content-Type itself.
+        """
+        data = {}
+        files = {}
+        for key, value in fields.items():
+            if isinstance(value, tuple):
+                files[key] = value
+            else:
+                data[key] = value
+        return {'data': data, 'files': files}
 
     @abc.abstractmethod
-    def get_request_params(self) -> Tuple[str, MultipartEncoderMonitor, Dict[str, str]]:
+    def get_request_params(self) -> Tuple[str, Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """
+        Build the upload request.
+
+        Returns:
+            (url, body, headers), where body holds the ``data`` and ``files``
+            dicts from build_request(), passed straight to httpx's post().
+        """
         pass
 
     @abc.abstractmethod
@@ -327,19 +487,19 @@ class TurboUploader(BaseUploader):
         self.client = client if client else create_resilient_client()
 
     def get_request_params(self):
-        self.file_obj = open(self.file_path, 'rb')
+        self.open_file()
         fields = {
             "qqfile": (self.basename, self.file_obj, self.mime_type),
             "qquuid": str(random.randint(100000, 999999)),
             "qqfilename": self.basename,
-            "qqtotalfilesize": str(os.path.getsize(self.file_path)),
+            "qqtotalfilesize": str(self.file_obj.len),
             "imcontent": self.imcontent,
             "thumb_size": self.thumb_size,
             "upload_id": self.upload_id,
         }
         if self.gallery_id:
             fields["album"] = self.gallery_id
-        return self.endpoint, self.get_monitor(fields), self.headers
+        return self.endpoint, self.build_request(fields), self.headers
 
     def parse_response(self, data):
         # Turbo returns JSON sometimes, HTML others depending on endpoint
@@ -384,7 +544,7 @@ class ImxUploader(BaseUploader):
         self.gallery_id = gallery_id
 
     def get_request_params(self):
-        self.file_obj = open(self.file_path, 'rb')
+        self.open_file()
         url = config.IMX_URL
         self.headers['X-API-KEY'] = self.api_key or ""
         fields = {
@@ -395,7 +555,7 @@ class ImxUploader(BaseUploader):
         }
         if self.gallery_id:
             fields["gallery_id"] = self.gallery_id
-        return url, self.get_monitor(fields), self.headers
+        return url, self.build_request(fields), self.headers
 
     def parse_response(self, data):
         if data.get("status") == "success":
@@ -416,7 +576,7 @@ class PixhostUploader(BaseUploader):
         self.thumb_size = thumb_size_str if thumb_size_str in valid_thumbs else "200"
 
     def get_request_params(self):
-        self.file_obj = open(self.file_path, 'rb')
+        self.open_file()
         if self.is_cover:
             url = config.PIX_COVERS_URL
             fields = {
@@ -436,7 +596,7 @@ class PixhostUploader(BaseUploader):
         if self.gallery_upload_hash:
             fields["gallery_upload_hash"] = self.gallery_upload_hash
             
-        return url, self.get_monitor(fields), self.headers
+        return url, self.build_request(fields), self.headers
 
     def parse_response(self, data):
         if "show_url" in data:
@@ -458,7 +618,7 @@ class ViprUploader(BaseUploader):
         self.headers['Origin'] = config.VIPR_HOME_URL
 
     def get_request_params(self):
-        self.file_obj = open(self.file_path, 'rb')
+        self.open_file()
         uid = "".join([str(random.randint(0, 9)) for _ in range(12)])
         base_url = self.upload_url.split('?')[0]
         final_url = f"{base_url}?upload_id={uid}&js_on=1&utype=reg&upload_type=file"
@@ -473,14 +633,12 @@ class ViprUploader(BaseUploader):
             "submit_btn": "Upload"
         }
         
-        return final_url, self.get_monitor(fields), self.headers
+        return final_url, self.build_request(fields), self.headers
 
     def parse_response(self, data):
-        soup = BeautifulSoup(data, 'html.parser')
-        
         # XFS Redirect Handling
-        fn_match = re.search(r"<textarea name=['\"]fn['\"]>([^<]+)</textarea>", data, re.IGNORECASE)
-        op_match = re.search(r"<textarea name=['\"]op['\"]>upload_result</textarea>", data, re.IGNORECASE)
+        fn_match = _VIPR_FN_RE.search(data)
+        op_match = _VIPR_OP_RE.search(data)
         
         if op_match and fn_match:
             code = fn_match.group(1)
@@ -493,33 +651,26 @@ class ViprUploader(BaseUploader):
                 return (f"{config.VIPR_HOME_URL}i/{code}/{self.basename}", 
                         f"{config.VIPR_HOME_URL}th/{code}/{self.basename}")
 
-        if soup.find('title') and "520" in soup.find('title').text:
+        if _VIPR_CF520_RE.search(data):
              raise ValueError("Server returned Cloudflare 520 Error (Rejected).")
         
-        img_url = None
-        thumb_url = None
-        
         clean_name = self.basename.replace(" ", "_")
-        name_div = soup.find('div', string=re.compile(re.escape(clean_name), re.IGNORECASE))
-        
-        if name_div:
-            block = name_div.find_parent('div', class_='grey_block')
-            if block:
-                img_tag = block.find('img', src=True)
-                if img_tag and "/th/" in img_tag['src']:
-                    thumb_url = img_tag['src']
-                
-                link_tag = block.find('a', href=True)
-                if link_tag and "vipr.im" in link_tag['href']:
-                    img_url = link_tag['href']
+
+        # Fast path: locate the file's grey_block by plain string scan.
+        # BeautifulSoup is only built if the block can't be found that way.
+        block = self._find_result_block(data, clean_name)
+        if block is not None:
+            img_url, thumb_url = self._parse_result_block(block)
+        else:
+            img_url, thumb_url = self._parse_result_soup(data, clean_name)
 
         if not thumb_url:
-            thumb_match = re.search(r'https?://(?:[a-z0-9]+\.)?vipr\.im/th/[^"\s\'<>]+\.(?:jpg|jpeg|png|gif|bmp|webp)', data, re.IGNORECASE)
+            thumb_match = _VIPR_THUMB_RE.search(data)
             if thumb_match:
                 thumb_url = thumb_match.group(0)
         
         if not img_url:
-             direct_match = re.search(r'https?://vipr\.im/[a-z0-9]+', data, re.IGNORECASE)
+             direct_match = _VIPR_DIRECT_RE.search(data)
              if direct_match:
                  img_url = direct_match.group(0)
             
@@ -528,4 +679,46 @@ class ViprUploader(BaseUploader):
             logger.error(f"Vipr Parse Fail. Response snippet: {snippet}")
             raise ValueError("Could not parse upload result page (No links found).")
             
-        return img_url, thumb_url or img_url
\ No newline at end of file
+        return img_url, thumb_url or img_url
+
+    @staticmethod
+    def _find_result_block(data: str, clean_name: str) -> Optional[str]:
+        """Return the raw HTML of the grey_block containing clean_name, if any."""
+        idx = data.lower().find(clean_name.lower())
+        if idx < 0:
+            return None
+        start = data.rfind("grey_block", 0, idx)
+        if start < 0:
+            return None
+        end = data.find("grey_block", idx)
+        return data[start:end] if end >= 0 else data[start:]
+
+    @staticmethod
+    def _parse_result_block(block: str) -> Tuple[Optional[str], Optional[str]]:
+        img_url = None
+        thumb_url = None
+        thumb_match = _VIPR_THUMB_RE.search(block)
+        if thumb_match:
+            thumb_url = thumb_match.group(0)
+        link_match = _VIPR_LINK_RE.search(block)
+        if link_match:
+            img_url = link_match.group(1)
+        return img_url, thumb_url
+
+    def _parse_result_soup(self, data: str, clean_name: str) -> Tuple[Optional[str], Optional[str]]:
+        img_url = None
+        thumb_url = None
+        soup = BeautifulSoup(data, 'html.parser')
+        name_div = soup.find('div', string=_vipr_name_re(clean_name))
+        
+        if name_div:
+            block = name_div.find_parent('div', class_='grey_block')
+            if block:
+                img_tag = block.find('img', src=True)
+                if img_tag and "/th/" in img_tag['src']:
+                    thumb_url = img_tag['src']
+                
+                link_tag = block.find('a', href=True)
+                if link_tag and "vipr.im" in link_tag['href']:
+                    img_url = link_tag['href']
+        return img_url, thumb_url
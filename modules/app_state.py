@@ -10,6 +10,24 @@ import threading
 import queue
 
 
+def drain_queue(q: queue.Queue) -> List[Any]:
+    """
+    Remove and return every item currently in a queue.
+
+    Takes the queue mutex once instead of looping over get_nowait()
+    until queue.Empty is raised. The drained items count as done; items
+    other consumers took earlier still need their task_done() calls.
+    """
+    with q.mutex:
+        items = list(q.queue)
+        q.queue.clear()
+        q.unfinished_tasks -= len(items)
+        if q.unfinished_tasks == 0:
+            q.all_tasks_done.notify_all()
+        q.not_full.notify_all()
+    return items
+
+
 @dataclass
 class UploadState:
     """State related to upload operations"""
@@ -117,24 +135,9 @@ class QueueState:
 
     def clear_all(self):
         """Clear all queues"""
-        # Empty the queues
-        while not self.progress_queue.empty():
-            try:
-                self.progress_queue.get_nowait()
-            except queue.Empty:
-                break
-
-        while not self.ui_queue.empty():
-            try:
-                self.ui_queue.get_nowait()
-            except queue.Empty:
-                break
-
-        while not self.result_queue.empty():
-            try:
-                self.result_queue.get_nowait()
-            except queue.Empty:
-                break
+        drain_queue(self.progress_queue)
+        drain_queue(self.ui_queue)
+        drain_queue(self.result_queue)
 
 
 @dataclass
@@ -223,8 +226,7 @@ class StateManager:
 
     def is_upload_complete(self) -> bool:
         """Thread-safe check if upload is complete"""
-        with self.state.lock:
-            return self.state.upload.is_complete()
+        return self.state.upload.is_complete()
 
     def get_pending_files(self) -> Dict[Any, List[str]]:
         """Get pending files for upload"""
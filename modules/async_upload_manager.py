@@ -7,20 +7,114 @@ Significantly better resource utilization than ThreadPoolExecutor.
 """
 
 import asyncio
+import atexit
 import os
+import random
+import sys
+import threading
+import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from . import api
 from . import config
 from .config_loader import get_config_loader
 from .error_handler import handle_upload_error, handle_network_error
-from .retry_utils import is_retryable_error
+from .retry_utils import is_retryable_error, get_retry_after, RETRYABLE_STATUS_CODES
 from .plugin_adapter import get_service_registry
 from loguru import logger
 
+# Optional faster event loop implementations
+if sys.platform == 'win32':
+    try:
+        import winloop as _fast_loop
+    except ImportError:
+        _fast_loop = None
+else:
+    try:
+        import uvloop as _fast_loop
+    except ImportError:
+        _fast_loop = None
 
-# Load application configuration
-_app_config = get_config_loader().config
+
+# Application configuration, loaded on first use rather than at import
+_app_config = None
+
+
+def _cfg():
+    """Return the application config, loading it on first access."""
+    global _app_config
+    if _app_config is None:
+        _app_config = get_config_loader().config
+    return _app_config
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create the upload event loop.
+
+    Uses uvloop (winloop on Windows) when installed, otherwise the default
+    asyncio loop. Eager task execution is enabled on Python 3.12+ either way.
+    """
+    loop = _fast_loop.new_event_loop() if _fast_loop else asyncio.new_event_loop()
+    if sys.version_info >= (3, 12):
+        # Tasks run synchronously until their first real suspension point
+        loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
+# Minimum seconds between progress updates for one file
+_PROGRESS_INTERVAL = config.UI_UPDATE_INTERVAL_MS / 1000
+
+_TURBO_HOME_URL = config.TURBO_HOME_URL
+_VIPR_HOME_URL = config.VIPR_HOME_URL
+
+
+def _build_imx(fp, is_cover, cfg, pix_data, callback, client):
+    th = "600" if (is_cover and cfg['imx_cover']) else cfg['imx_thumb']
+    return api.ImxUploader(
+        cfg['api_key'], fp, callback, th,
+        cfg.get('imx_format', 'Fixed Width'),
+        cfg.get('gallery_id')
+    )
+
+
+def _build_pixhost(fp, is_cover, cfg, pix_data, callback, client):
+    is_cov = (is_cover and cfg['pix_cover'])
+    return api.PixhostUploader(
+        fp, callback, cfg['pix_content'], cfg['pix_thumb'],
+        pix_data.get('gallery_hash'),
+        pix_data.get('gallery_upload_hash'),
+        is_cov
+    )
+
+
+def _build_turbo(fp, is_cover, cfg, pix_data, callback, client):
+    th = "600" if (is_cover and cfg.get('turbo_cover')) else cfg['turbo_thumb']
+    return api.TurboUploader(
+        fp, callback, _TURBO_HOME_URL,
+        api.generate_turbo_upload_id(),
+        cfg['turbo_content'], th, cfg['turbo_gal_id'],
+        client=client
+    )
+
+
+def _build_vipr(fp, is_cover, cfg, pix_data, callback, client):
+    th = "800x800" if (is_cover and cfg.get('vipr_cover')) else cfg['vipr_thumb']
+    return api.ViprUploader(
+        fp, callback,
+        cfg.get('vipr_meta', {}).get('upload_url', _VIPR_HOME_URL),
+        "", th, cfg['vipr_gal_id'],
+        client=client
+    )
+
+
+# Built-in service name -> uploader builder
+_UPLOADER_BUILDERS = {
+    'imx.to': _build_imx,
+    'pixhost.to': _build_pixhost,
+    'turboimagehost': _build_turbo,
+    'vipr.im': _build_vipr,
+}
 
 
 class AsyncUploadManager:
@@ -32,6 +126,10 @@ class AsyncUploadManager:
     - Better CPU utilization
     - Easier to control concurrency
     - More scalable for high concurrency
+
+    All batches run on one long-lived event loop thread so that a single
+    httpx.AsyncClient (and its connection pool, TLS sessions and HTTP/2
+    connections) is reused from batch to batch.
     """
 
     def __init__(self, progress_queue, result_queue, cancel_event):
@@ -39,29 +137,70 @@ class AsyncUploadManager:
         self.result_queue = result_queue
         self.cancel_event = cancel_event
         self.service_registry = get_service_registry()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._client = None
 
     def start_batch(self, pending_by_group, cfg, creds):
         """
-        Start async upload batch in a separate thread.
+        Start async upload batch on the background event loop.
 
-        Uses asyncio.run() in a thread to avoid blocking the tkinter UI.
+        Returns immediately so the tkinter UI is never blocked.
         """
-        import threading
-
-        def run_async_batch():
-            """Wrapper to run async code in a thread."""
+        future = asyncio.run_coroutine_threadsafe(
+            self._run_async_uploads(pending_by_group, cfg, creds),
+            self._ensure_loop()
+        )
+        future.add_done_callback(self._on_batch_done)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the upload event loop thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = _new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="AsyncUploadLoop",
+                    daemon=True
+                ).start()
+                self._loop = loop
+                atexit.register(self.shutdown)
+            return self._loop
+
+    @staticmethod
+    def _on_batch_done(future):
+        """Log errors from a finished batch (runs on the loop thread)."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error:
+            logger.error(f"Async batch error: {error}")
+
+    def _get_client(self):
+        """Return the shared AsyncClient, creating it on the loop thread."""
+        if self._client is None or self._client.is_closed:
+            self._client = api.create_async_client()
+        return self._client
+
+    def shutdown(self):
+        """Close the shared client and stop the upload event loop."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        if self._client is not None:
             try:
-                asyncio.run(self._run_async_uploads(pending_by_group, cfg, creds))
+                asyncio.run_coroutine_threadsafe(self._client.aclose(), loop).result(timeout=5)
             except Exception as e:
-                logger.error(f"Async batch error: {e}")
-
-        threading.Thread(target=run_async_batch, daemon=True).start()
+                logger.warning(f"Failed to close upload client: {e}")
+            self._client = None
+        loop.call_soon_threadsafe(loop.stop)
 
     async def _run_async_uploads(self, pending_by_group, base_cfg, creds):
         """
         Main async upload orchestrator.
 
-        Creates an AsyncClient and runs concurrent uploads with controlled concurrency.
+        Runs concurrent uploads over the shared AsyncClient with controlled concurrency.
         """
         # Determine concurrency based on service
         service_prefix = base_cfg['service'].split('.')[0]
@@ -72,28 +211,41 @@ class AsyncUploadManager:
 
         logger.info(f"Starting async uploads with max_concurrent={max_concurrent}")
 
-        # Create async HTTP client
-        async with api.create_async_client() as client:
+        client = self._get_client()
+        cancelled = asyncio.Event()
+        watcher = asyncio.ensure_future(self._bridge_cancel(cancelled))
+        try:
             for group, files in pending_by_group.items():
-                if self.cancel_event.is_set():
+                if cancelled.is_set():
                     break
 
                 # Prepare configuration for this group
                 current_cfg = base_cfg.copy()
                 current_pix_data = {}
 
-                # --- Gallery Creation Logic (sync operations) ---
+                # --- Gallery Creation Logic ---
                 await self._handle_gallery_creation(
                     base_cfg, group, current_cfg, current_pix_data, creds, client
                 )
 
                 # --- Concurrent File Uploads ---
+                # The group's first file is its cover, even if it is not pending
+                cover_fp = group.files[0] if group.files else None
                 await self._upload_files_concurrently(
-                    files, group, current_cfg, current_pix_data, creds, client, max_concurrent
+                    files, cover_fp, current_cfg, current_pix_data, creds, client,
+                    max_concurrent, cancelled
                 )
+        finally:
+            watcher.cancel()
 
         logger.info("Async batch execution finished.")
 
+    async def _bridge_cancel(self, cancelled: asyncio.Event):
+        """Set the loop-side cancelled event once the thread-level cancel_event is set."""
+        while not self.cancel_event.is_set():
+            await asyncio.sleep(0.1)
+        cancelled.set()
+
     async def _handle_gallery_creation(self, base_cfg, group, current_cfg, current_pix_data, creds, client):
         """Handle gallery creation for different services."""
         service = base_cfg['service']
@@ -103,10 +255,7 @@ class AsyncUploadManager:
                 clean_title = group.title.replace('[', '').replace(']', '').strip()
                 logger.info(f"Creating Pixhost gallery: {clean_title}")
 
-                # Gallery creation is sync for now (could be async later)
-                new_data = await asyncio.to_thread(
-                    api.create_pixhost_gallery, clean_title
-                )
+                new_data = await api.create_pixhost_gallery_async(clean_title, client)
 
                 if new_data:
                     current_pix_data.update(new_data)
@@ -120,9 +269,8 @@ class AsyncUploadManager:
                 group.gallery_id = base_cfg['pix_gallery_hash']
 
         elif service == "imx.to" and base_cfg.get('auto_gallery'):
-            # IMX gallery creation (sync for now)
-            gid = await asyncio.to_thread(
-                api.create_imx_gallery,
+            # Login cookies stay on a short-lived client, not the shared one
+            gid = await api.create_imx_gallery_async(
                 creds.get('imx_user'),
                 creds.get('imx_pass'),
                 group.title
@@ -131,59 +279,87 @@ class AsyncUploadManager:
                 current_cfg['gallery_id'] = gid
                 group.gallery_id = gid
 
-    async def _upload_files_concurrently(self, files, group, cfg, pix_data, creds, client, max_concurrent):
+    async def _upload_files_concurrently(self, files, cover_fp, cfg, pix_data, creds, client,
+                                         max_concurrent, cancelled):
         """
-        Upload files concurrently with semaphore-controlled concurrency.
+        Upload files with at most max_concurrent uploads in flight.
 
-        Uses asyncio.Semaphore to limit concurrent uploads.
+        Tasks are started on demand as earlier ones finish, so a large batch
+        never materializes one task per file. No new uploads are started
+        once the batch is cancelled, and uploads waiting out a retry
+        backoff give up immediately.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def upload_with_semaphore(fp, is_first):
-            """Wrapper to control concurrency."""
-            async with semaphore:
-                if self.cancel_event.is_set():
-                    return
-                await self._upload_task_async(fp, is_first, cfg, pix_data, creds, client)
-
-        # Create tasks for all files
-        tasks = [
-            upload_with_semaphore(fp, fp == group.files[0])
-            for fp in files
-        ]
-
-        # Run concurrently
-        await asyncio.gather(*tasks, return_exceptions=True)
-
-    async def _upload_task_async(self, fp, is_first, cfg, pix_data, creds, client):
+        # Tag the cover once up front; == short-circuits on identity
+        pending = ((fp, fp == cover_fp) for fp in files)
+        in_flight = set()
+
+        def start_next() -> bool:
+            if cancelled.is_set():
+                return False
+            item = next(pending, None)
+            if item is None:
+                return False
+            fp, is_cover = item
+            in_flight.add(asyncio.ensure_future(
+                self._upload_task_async(fp, is_cover, cfg, pix_data, creds, client, cancelled)
+            ))
+            return True
+
+        for _ in range(max(1, max_concurrent)):
+            if not start_next():
+                break
+
+        while in_flight:
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if not task.cancelled() and task.exception():
+                    logger.error(f"Upload task error: {task.exception()}")
+                start_next()
+
+    async def _upload_task_async(self, fp, is_cover, cfg, pix_data, creds, client, cancelled):
         """
         Async upload task for a single file.
 
         Main upload logic with async HTTP and retry handling.
         """
-        if self.cancel_event.is_set():
+        if cancelled.is_set():
             return
 
         self.progress_queue.put(('status', fp, 'Uploading'))
 
+        uploader = None
         try:
-            # Progress callback
+            # Progress callback, throttled to what the UI loop can display
+            last_emit = 0.0
+            last_ratio = 0.0
+
             def progress_callback(monitor):
+                nonlocal last_emit, last_ratio
                 if self.cancel_event.is_set():
                     raise Exception("Cancelled")
                 if monitor.len > 0:
-                    self.progress_queue.put(('prog', fp, (monitor.bytes_read / monitor.len)))
+                    ratio = monitor.bytes_read / monitor.len
+                    now = time.monotonic()
+                    if (now - last_emit >= _PROGRESS_INTERVAL
+                            or ratio - last_ratio >= 0.01 or ratio >= 1.0):
+                        last_emit = now
+                        last_ratio = ratio
+                        self.progress_queue.put(('prog', fp, ratio))
 
             # Instantiate uploader (sync operation)
             uploader = self._create_uploader(
-                cfg['service'], fp, is_first, cfg, pix_data, progress_callback, client
+                cfg['service'], fp, is_cover, cfg, pix_data, progress_callback, client
             )
 
             if not uploader:
                 raise Exception(f"Unsupported service: {cfg['service']}")
 
             # Perform async upload with retry
-            img, thumb = await self._perform_async_upload(uploader, fp, cfg, client)
+            img, thumb = await self._perform_async_upload(uploader, fp, cfg, client, cancelled)
+
+            # Release the file handle before queueing the result
+            self._close_uploader(uploader)
+            uploader = None
 
             # Success
             self.result_queue.put((fp, img, thumb))
@@ -197,10 +373,18 @@ class AsyncUploadManager:
                 service=cfg.get('service', 'unknown')
             )
         finally:
-            if uploader:
-                uploader.close()
+            if uploader is not None:
+                self._close_uploader(uploader)
+
+    @staticmethod
+    def _close_uploader(uploader):
+        """Close an uploader without letting cleanup errors mask the upload result."""
+        try:
+            uploader.close()
+        except Exception as e:
+            logger.warning(f"Failed to close uploader: {e}")
 
-    def _create_uploader(self, service, fp, is_first, cfg, pix_data, callback, client):
+    def _create_uploader(self, service, fp, is_cover, cfg, pix_data, callback, client):
         """Create appropriate uploader instance based on service."""
         # Check if this is a plugin service
         if self.service_registry.is_plugin_service(service):
@@ -208,50 +392,18 @@ class AsyncUploadManager:
             return self._create_plugin_uploader(service, fp, cfg, callback)
 
         # Built-in services
-        if service == "imx.to":
-            th = "600" if (is_first and cfg['imx_cover']) else cfg['imx_thumb']
-            return api.ImxUploader(
-                cfg['api_key'], fp, callback, th,
-                cfg.get('imx_format', 'Fixed Width'),
-                cfg.get('gallery_id')
-            )
-
-        elif service == "pixhost.to":
-            is_cov = (is_first and cfg['pix_cover'])
-            return api.PixhostUploader(
-                fp, callback, cfg['pix_content'], cfg['pix_thumb'],
-                pix_data.get('gallery_hash'),
-                pix_data.get('gallery_upload_hash'),
-                is_cov
-            )
-
-        elif service == "turboimagehost":
-            th = "600" if (is_first and cfg.get('turbo_cover')) else cfg['turbo_thumb']
-            return api.TurboUploader(
-                fp, callback, config.TURBO_HOME_URL,
-                api.generate_turbo_upload_id(),
-                cfg['turbo_content'], th, cfg['turbo_gal_id'],
-                client=client
-            )
-
-        elif service == "vipr.im":
-            th = "800x800" if (is_first and cfg.get('vipr_cover')) else cfg['vipr_thumb']
-            return api.ViprUploader(
-                fp, callback,
-                cfg.get('vipr_meta', {}).get('upload_url', config.VIPR_HOME_URL),
-                "", th, cfg['vipr_gal_id'],
-                client=client
-            )
-
-        return None
+        builder = _UPLOADER_BUILDERS.get(service)
+        if builder is None:
+            return None
+        return builder(fp, is_cover, cfg, pix_data, callback, client)
 
     def _create_plugin_uploader(self, service_name, fp, cfg, callback):
         """Create a plugin uploader wrapped in an adapter."""
         # Get plugin credentials from config
         plugin_creds = cfg.get('plugin_credentials', {}).get(service_name, {})
 
-        # Create plugin instance
-        plugin = self.service_registry.get_plugin_instance(
+        # Reuse the pooled instance (and its HTTP connections) across files
+        plugin, pooled = self.service_registry.acquire_plugin(
             service_name,
             credentials=plugin_creds,
             config=cfg
@@ -261,60 +413,72 @@ class AsyncUploadManager:
             raise Exception(f"Failed to create plugin instance for {service_name}")
 
         # Wrap plugin in adapter to match existing uploader interface
-        return PluginUploaderAdapter(plugin, fp, callback)
+        return PluginUploaderAdapter(plugin, fp, callback, pooled=pooled)
 
-    async def _perform_async_upload(self, uploader, fp, cfg, client):
+    async def _perform_async_upload(self, uploader, fp, cfg, client, cancelled):
         """
         Perform async HTTP upload with retry logic.
 
-        Retries on network errors with exponential backoff.
+        The file is streamed by httpx's multipart writer straight from the
+        uploader's ProgressFile, so there is no per-chunk executor hop.
+        Retries on network errors with jittered exponential backoff,
+        honouring Retry-After on 429/503. A 408 is not retried, since that
+        would resubmit the whole multipart body to a server that timed out.
+        Plugin adapters upload on their own and skip the HTTP request here.
         """
-        url, data, headers = uploader.get_request_params()
+        if isinstance(uploader, PluginUploaderAdapter):
+            return await uploader.upload()
 
-        # Add Content-Length if not present
-        if 'Content-Length' not in headers and hasattr(data, 'len'):
-            headers['Content-Length'] = str(data.len)
+        url, body, headers = uploader.get_request_params()
 
-        max_attempts = _app_config.network.retry_count
+        net = _cfg().network
+        max_attempts = net.retry_count
+        upload_timeout = net.upload_timeout_seconds
         base_delay = 2.0
         service = cfg['service']
 
         for attempt in range(1, max_attempts + 1):
             try:
-                self.progress_queue.put(('status', fp, 'Uploading'))
-
-                # Read data chunks (async generator)
-                async def read_chunks():
-                    chunk_size = _app_config.network.chunk_size
-                    while True:
-                        # Read in executor to avoid blocking
-                        chunk = await asyncio.to_thread(data.read, chunk_size)
-                        if not chunk:
-                            break
-                        yield chunk
-
-                # Perform async upload
+                # 'Uploading' was already posted by the caller; only retries need a status
+                if attempt > 1:
+                    self.progress_queue.put(('status', fp, f'Retry {attempt}'))
+
+                # Perform async upload (httpx streams the multipart body itself)
                 response = await client.post(
                     url,
                     headers=headers,
-                    content=read_chunks(),
-                    timeout=_app_config.network.upload_timeout_seconds
+                    data=body.get('data'),
+                    files=body.get('files'),
+                    timeout=upload_timeout
                 )
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    response.raise_for_status()
 
                 # Parse response
-                resp_data = response.text if service == 'vipr.im' else response.json()
+                resp_data = response.text if service == 'vipr.im' else api.fast_json(response)
                 img, thumb = uploader.parse_response(resp_data)
 
                 return img, thumb
 
             except Exception as e:
-                if attempt < max_attempts and is_retryable_error(e):
-                    delay = min(base_delay * (2 ** (attempt - 1)), 30.0)
-                    logger.warning(f"Upload attempt {attempt} failed for {fp}, retrying in {delay}s: {e}")
-                    await asyncio.sleep(delay)
+                status = getattr(getattr(e, 'response', None), 'status_code', None)
+                retryable = status != 408 and is_retryable_error(e)
+                if attempt < max_attempts and retryable:
+                    # Jitter keeps concurrent uploads from retrying in lockstep
+                    delay = min(base_delay * (2 ** (attempt - 1)), 30.0) * random.uniform(0.5, 1.5)
+                    if status in (429, 503):
+                        retry_after = get_retry_after(e)
+                        if retry_after is not None:
+                            delay = max(retry_after, delay)
+                    logger.warning(f"Upload attempt {attempt} failed for {fp}, retrying in {delay:.1f}s: {e}")
+                    try:
+                        await asyncio.wait_for(cancelled.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        continue
+                    raise Exception("Cancelled")
                 else:
                     # Last attempt or non-retryable error
-                    if is_retryable_error(e):
+                    if retryable:
                         handle_network_error(e, "Upload", service)
                     raise
 
@@ -327,7 +491,7 @@ class PluginUploaderAdapter:
     translates between the two.
     """
 
-    def __init__(self, plugin, file_path, progress_callback):
+    def __init__(self, plugin, file_path, progress_callback, pooled=False):
         """
         Initialize adapter.
 
@@ -335,36 +499,30 @@ class PluginUploaderAdapter:
             plugin: ImageHostPlugin instance
             file_path: Path to file to upload
             progress_callback: Progress callback function
+            pooled: Whether the registry owns the plugin (close() leaves it open)
         """
         self.plugin = plugin
+        self.pooled = pooled
         self.file_path = Path(file_path)
         self.progress_callback = progress_callback
         self._result = None
 
-    def get_request_params(self):
+    async def upload(self):
         """
-        Get upload request parameters.
-
-        For plugins, we perform the upload directly in this method
-        and store the result for later retrieval by parse_response().
+        Upload the file through the plugin.
 
-        This is a workaround to adapt the plugin interface to the existing
-        uploader interface which expects separate get_request_params() and
-        parse_response() calls.
+        Plugins talk to their host themselves, so there is no request for
+        the manager to send; the result is kept for parse_response().
 
         Returns:
-            Dummy values (upload is already done)
+            Tuple of (image_url, thumb_url)
         """
         try:
-            # Plugins handle upload internally, so we call upload here
-            self._result = self.plugin.upload(self.file_path, self._progress_wrapper)
-
-            # Return dummy values since upload is already done
-            return ("https://dummy.com", b"", {})
-
+            self._result = await self.plugin.upload_async(self.file_path, self._progress_wrapper)
         except Exception as e:
             logger.error(f"Plugin upload failed: {e}")
             raise
+        return self.parse_response(None)
 
     def _progress_wrapper(self, bytes_sent, total_bytes):
         """Wrap plugin progress callback to match expected interface."""
@@ -382,8 +540,8 @@ class PluginUploaderAdapter:
         """
         Parse upload response.
 
-        Since the upload was already done in get_request_params(),
-        we just return the stored result here.
+        Since the upload was already done in upload(), we just return
+        the stored result here.
 
         Args:
             response_data: Ignored (upload already done)
@@ -397,8 +555,8 @@ class PluginUploaderAdapter:
         raise Exception("Plugin upload failed: no result available")
 
     def close(self):
-        """Cleanup plugin resources."""
-        if self.plugin:
+        """Cleanup plugin resources, unless the plugin is pooled."""
+        if self.plugin and not self.pooled:
             try:
                 self.plugin.cleanup()
             except Exception as e:
@@ -38,7 +38,7 @@ DEFAULT_THREAD_LIMITS = {
 HTTP_TIMEOUT_SECONDS = 60.0    # Default timeout for HTTP requests
 HTTP_RETRY_COUNT = 3           # Number of retries for failed requests
 UPLOAD_TIMEOUT_SECONDS = 300   # Extended timeout for large file uploads
-UPLOAD_CHUNK_SIZE = 8192       # Bytes to read per chunk during upload
+UPLOAD_CHUNK_SIZE = 2 * 1024 * 1024  # Bytes to read per chunk during upload (2 MiB)
 
 # --- Constants ---
 IMX_URL = "https://api.imx.to/v1/upload.php"
@@ -3,12 +3,19 @@
 User-configurable settings loader with YAML support.
 Provides runtime configuration separate from hardcoded constants.
 """
+import functools
 import os
 import yaml
 from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from loguru import logger
 
+# libyaml's C loader/dumper are several times faster; fall back to pure Python
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
 
 @dataclass
 class NetworkConfig:
@@ -16,8 +23,12 @@ class NetworkConfig:
     timeout_seconds: float = 60.0
     retry_count: int = 3
     upload_timeout_seconds: float = 300.0
-    chunk_size: int = 8192
+    # Large chunks cut per-read syscall and progress-callback overhead
+    chunk_size: int = 2 * 1024 * 1024
     http2_enabled: bool = True
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 60.0
 
 
 @dataclass
@@ -73,11 +84,13 @@ class AppConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for YAML serialization"""
+        # Sections only hold primitives, so a shallow copy is enough
+        # (asdict() would deep-copy every value)
         result = {
-            'network': asdict(self.network),
-            'ui': asdict(self.ui),
-            'threading': asdict(self.threading),
-            'performance': asdict(self.performance)
+            'network': dict(vars(self.network)),
+            'ui': dict(vars(self.ui)),
+            'threading': dict(vars(self.threading)),
+            'performance': dict(vars(self.performance))
         }
 
         # Convert tuples to lists for YAML compatibility
@@ -119,7 +132,7 @@ class ConfigLoader:
         if config_file:
             try:
                 with open(config_file, 'r') as f:
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=_SafeLoader)
                     if data:
                         config = self._merge_config(config, data)
                         logger.info(f"Loaded configuration from: {config_file}")
@@ -131,19 +144,7 @@ class ConfigLoader:
 
     def _find_config_file(self) -> Optional[str]:
         """Find config file in order of precedence"""
-        # 1. Explicitly specified path
-        if self.config_path and os.path.exists(self.config_path):
-            return self.config_path
-
-        # 2. Current directory
-        if os.path.exists(self.DEFAULT_CONFIG_PATH):
-            return self.DEFAULT_CONFIG_PATH
-
-        # 3. User home directory
-        if os.path.exists(self.USER_CONFIG_PATH):
-            return self.USER_CONFIG_PATH
-
-        return None
+        return _resolve_config_path(self.config_path, os.getcwd())
 
     def _merge_config(self, base: AppConfig, overrides: Dict[str, Any]) -> AppConfig:
         """Merge override values into base config"""
@@ -193,8 +194,11 @@ class ConfigLoader:
             os.makedirs(os.path.dirname(save_path) or '.', exist_ok=True)
 
             with open(save_path, 'w') as f:
-                yaml.dump(self.config.to_dict(), f, default_flow_style=False, sort_keys=False)
+                yaml.dump(self.config.to_dict(), f, Dumper=_SafeDumper,
+                          default_flow_style=False, sort_keys=False)
 
+            # The file may not have existed when the path was last resolved
+            _resolve_config_path.cache_clear()
             logger.info(f"Configuration saved to: {save_path}")
             return True
 
@@ -206,6 +210,9 @@ class ConfigLoader:
         """
         Create an example configuration file with all options and comments.
 
+        Loading works with pure-Python PyYAML, but a PyYAML build with
+        libyaml is recommended since it parses the file much faster.
+
         Args:
             path: Path to save example config
 
@@ -220,8 +227,11 @@ network:
   timeout_seconds: 60.0          # Default timeout for HTTP requests
   retry_count: 3                  # Number of retries for failed requests
   upload_timeout_seconds: 300.0   # Extended timeout for large file uploads
-  chunk_size: 8192                # Bytes to read per chunk during upload
+  chunk_size: 2097152             # Bytes to read per chunk during upload (2 MiB)
   http2_enabled: true             # Enable HTTP/2 support
+  max_connections: 100            # Connection pool size shared by all uploads
+  max_keepalive_connections: 20   # Idle connections kept open between batches
+  keepalive_expiry_seconds: 60.0  # Seconds an idle connection stays open
 
 # UI Settings
 ui:
@@ -301,6 +311,37 @@ performance:
 _config_loader: Optional[ConfigLoader] = None
 
 
+@functools.lru_cache(maxsize=32)
+def _resolve_config_path(explicit: Optional[str], cwd: str) -> Optional[str]:
+    """
+    Resolve which config file to load, in order of precedence.
+
+    Results are cached; call _resolve_config_path.cache_clear() when config
+    files may have been created or removed.
+
+    Args:
+        explicit: Explicitly requested config path, if any
+        cwd: Current working directory. Only used as part of the cache key,
+            since DEFAULT_CONFIG_PATH is relative to it
+
+    Returns:
+        Path of the first existing config file, or None
+    """
+    # 1. Explicitly specified path
+    if explicit and os.path.exists(explicit):
+        return explicit
+
+    # 2. Current directory
+    if os.path.exists(ConfigLoader.DEFAULT_CONFIG_PATH):
+        return ConfigLoader.DEFAULT_CONFIG_PATH
+
+    # 3. User home directory
+    if os.path.exists(ConfigLoader.USER_CONFIG_PATH):
+        return ConfigLoader.USER_CONFIG_PATH
+
+    return None
+
+
 def get_config_loader() -> ConfigLoader:
     """Get the global config loader instance (singleton)"""
     global _config_loader
@@ -312,5 +353,6 @@ def get_config_loader() -> ConfigLoader:
 def reload_config(config_path: Optional[str] = None):
     """Reload configuration from file"""
     global _config_loader
+    _resolve_config_path.cache_clear()
     _config_loader = ConfigLoader(config_path)
     return _config_loader
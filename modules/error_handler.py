@@ -2,13 +2,28 @@
 """
 Centralized error handling framework for consistent error management.
 """
-import queue
+import collections
+import functools
+import re
+import sys
+import threading
+import time
 import traceback
 from enum import Enum
-from typing import Optional, Callable
+from typing import Optional, Callable, Union
 from datetime import datetime
 from loguru import logger
 
+# Error message classifiers, compiled once
+_NETWORK_RE = re.compile(r"Connection|Timeout")
+_AUTH_RE = re.compile(r"401|Unauthorized|(?i:credentials)")
+_PERMISSION_RE = re.compile(r"Permission")
+_NOT_FOUND_RE = re.compile(r"Not found")
+
+# Caps so a long-running session cannot grow these without bound
+_MAX_HANDLERS = 512
+_MAX_NOTIFICATIONS = 1000
+
 
 class ErrorSeverity(Enum):
     """Error severity levels"""
@@ -18,6 +33,11 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
+# Severity groupings used on every handle() call
+_ERROR_SEVERITIES = frozenset({ErrorSeverity.ERROR, ErrorSeverity.CRITICAL})
+_NOTIFY_SEVERITIES = frozenset({ErrorSeverity.ERROR, ErrorSeverity.CRITICAL, ErrorSeverity.WARNING})
+
+
 class ErrorContext:
     """Context information for errors"""
     def __init__(self, operation: str, file_path: Optional[str] = None,
@@ -26,9 +46,21 @@ class ErrorContext:
         self.file_path = file_path
         self.service = service
         self.details = details or {}
-        self.timestamp = datetime.now()
+        self._wall = time.time()
+        self._str = None
+
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock time the context was created."""
+        return datetime.fromtimestamp(self._wall)
 
     def __str__(self):
+        # Built once; used by both the log line and the technical details
+        if self._str is None:
+            self._str = self._format()
+        return self._str
+
+    def _format(self) -> str:
         parts = [f"Operation: {self.operation}"]
         if self.file_path:
             parts.append(f"File: {self.file_path}")
@@ -42,13 +74,25 @@ class ErrorContext:
 class UserNotification:
     """User-facing notification"""
     def __init__(self, title: str, message: str, severity: ErrorSeverity,
-                 details: str = "", show_details_button: bool = False):
+                 details: Union[str, Callable[[], str]] = "", show_details_button: bool = False):
         self.title = title
         self.message = message
         self.severity = severity
-        self.details = details
+        self._details = details
         self.show_details_button = show_details_button
-        self.timestamp = datetime.now()
+        self._wall = time.time()
+
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock time the notification was created."""
+        return datetime.fromtimestamp(self._wall)
+
+    @property
+    def details(self) -> str:
+        """Technical details; a callable is formatted on first access and cached."""
+        if callable(self._details):
+            self._details = self._details()
+        return self._details
 
 
 class ErrorHandler:
@@ -58,10 +102,15 @@ class ErrorHandler:
     """
 
     def __init__(self):
-        self.notification_queue = queue.Queue()
+        # Single producer/consumer: deque append/popleft are atomic, the
+        # event only exists to wake blocking get_notification() callers
+        # Oldest notifications are dropped once _MAX_NOTIFICATIONS are pending
+        self.notification_queue = collections.deque(maxlen=_MAX_NOTIFICATIONS)
+        self._notify_event = threading.Event()
         self.error_count = 0
         self.warning_count = 0
-        self.custom_handlers = {}
+        # (operation, severity) -> handler
+        self.custom_handlers = collections.OrderedDict()
 
     def handle(self,
                error: Exception,
@@ -82,28 +131,35 @@ class ErrorHandler:
             log_traceback: Whether to log full traceback
         """
         # Update counters
-        if severity == ErrorSeverity.ERROR or severity == ErrorSeverity.CRITICAL:
+        if severity in _ERROR_SEVERITIES:
             self.error_count += 1
-        elif severity == ErrorSeverity.WARNING:
+        elif severity is ErrorSeverity.WARNING:
             self.warning_count += 1
 
-        # Log the error
-        log_msg = f"{context} | Error: {str(error)}"
-
-        if log_traceback and severity in [ErrorSeverity.ERROR, ErrorSeverity.CRITICAL]:
-            logger.exception(log_msg)
+        # Log the error; the message is only built if a sink accepts the level
+        ctx_str = lambda: str(context)
+        err_str = lambda: str(error)
+        # Attach the error's own traceback; exceptions that were never raised have none
+        tb = getattr(error, '__traceback__', None)
+        if log_traceback and tb is not None and severity in _ERROR_SEVERITIES:
+            exc_info = (type(error), error, tb)
         else:
-            log_level = severity.value
-            getattr(logger, log_level)(log_msg)
+            exc_info = None
+        logger.opt(lazy=True, exception=exc_info).log(
+            severity.value.upper(), "{} | Error: {}", ctx_str, err_str
+        )
 
         # Generate user notification if requested
-        if notify_user and severity in [ErrorSeverity.ERROR, ErrorSeverity.CRITICAL, ErrorSeverity.WARNING]:
+        if notify_user and severity in _NOTIFY_SEVERITIES:
             self._queue_user_notification(error, context, severity, user_message)
 
         # Call custom handler if registered
-        handler_key = f"{context.operation}:{severity.value}"
-        if handler_key in self.custom_handlers:
-            self.custom_handlers[handler_key](error, context)
+        if self.custom_handlers:
+            handler_key = (context.operation, severity)
+            handler = self.custom_handlers.get(handler_key)
+            if handler is not None:
+                self.custom_handlers.move_to_end(handler_key)
+                handler(error, context)
 
     def _queue_user_notification(self,
                                   error: Exception,
@@ -132,60 +188,33 @@ class ErrorHandler:
             show_details_button=True
         )
 
-        self.notification_queue.put(notification)
+        self.notification_queue.append(notification)
+        self._notify_event.set()
 
     def _generate_user_message(self, error: Exception, context: ErrorContext) -> str:
         """Generate user-friendly error message"""
-
-        # Network errors
-        if "Connection" in str(error) or "Timeout" in str(error):
-            return "Network connection failed. Please check your internet connection and try again."
-
-        # Authentication errors
-        if "401" in str(error) or "Unauthorized" in str(error) or "credentials" in str(error).lower():
-            return "Authentication failed. Please check your credentials in Settings."
-
-        # File errors
-        if context.file_path:
-            if "Permission" in str(error):
-                return f"Cannot access file: {context.file_path}\nPermission denied."
-            elif "Not found" in str(error):
-                return f"File not found: {context.file_path}"
-            else:
-                return f"Error processing file: {context.file_path}\n{str(error)}"
-
-        # Service-specific errors
-        if context.service:
-            return f"{context.service} error: {str(error)}"
-
-        # Generic fallback
-        return f"{context.operation} failed: {str(error)}"
+        return _user_message(str(error), context.operation, context.file_path, context.service)
 
     def _generate_title(self, context: ErrorContext, severity: ErrorSeverity) -> str:
         """Generate notification title"""
-        if severity == ErrorSeverity.CRITICAL:
+        if severity is ErrorSeverity.CRITICAL:
             return "Critical Error"
-        elif severity == ErrorSeverity.ERROR:
+        elif severity is ErrorSeverity.ERROR:
             return f"{context.operation} Failed"
-        elif severity == ErrorSeverity.WARNING:
+        elif severity is ErrorSeverity.WARNING:
             return f"{context.operation} Warning"
         else:
             return "Information"
 
-    def _generate_technical_details(self, error: Exception, context: ErrorContext) -> str:
-        """Generate technical details for debugging"""
-        details = []
-        details.append(f"Error Type: {type(error).__name__}")
-        details.append(f"Error Message: {str(error)}")
-        details.append(f"Context: {context}")
-        details.append(f"Timestamp: {context.timestamp}")
-
-        # Add traceback if available
-        tb = traceback.format_exc()
-        if tb and "NoneType" not in tb:
-            details.append(f"\nTraceback:\n{tb}")
+    def _generate_technical_details(self, error: Exception, context: ErrorContext) -> Callable[[], str]:
+        """
+        Generate technical details for debugging.
 
-        return "\n".join(details)
+        Formatting (including the traceback) is deferred until the details
+        are actually shown, so the traceback is captured from the exception
+        itself rather than from sys.exc_info() at display time.
+        """
+        return functools.partial(_format_technical_details, error, context, error.__traceback__)
 
     def register_custom_handler(self, operation: str, severity: ErrorSeverity,
                                 handler: Callable) -> None:
@@ -197,8 +226,12 @@ class ErrorHandler:
             severity: The error severity to handle
             handler: Callable that takes (error, context) as arguments
         """
-        key = f"{operation}:{severity.value}"
+        key = (sys.intern(operation), severity)
+        if key not in self.custom_handlers and len(self.custom_handlers) >= _MAX_HANDLERS:
+            # Evict the least recently used handler
+            self.custom_handlers.popitem(last=False)
         self.custom_handlers[key] = handler
+        self.custom_handlers.move_to_end(key)
 
     def get_notification(self, block: bool = False, timeout: Optional[float] = None) -> Optional[UserNotification]:
         """
@@ -211,21 +244,33 @@ class ErrorHandler:
         Returns:
             UserNotification or None if queue is empty
         """
-        try:
-            return self.notification_queue.get(block=block, timeout=timeout)
-        except queue.Empty:
-            return None
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self.notification_queue.popleft()
+            except IndexError:
+                if not block:
+                    return None
+
+            self._notify_event.clear()
+            if self.notification_queue:
+                continue  # Appended before the clear
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            if not self._notify_event.wait(remaining):
+                return None
 
     def has_notifications(self) -> bool:
         """Check if there are pending notifications"""
-        return not self.notification_queue.empty()
+        return bool(self.notification_queue)
 
     def get_stats(self) -> dict:
         """Get error statistics"""
         return {
             'errors': self.error_count,
             'warnings': self.warning_count,
-            'pending_notifications': self.notification_queue.qsize()
+            'pending_notifications': len(self.notification_queue)
         }
 
     def reset_stats(self) -> None:
@@ -234,14 +279,56 @@ class ErrorHandler:
         self.warning_count = 0
 
 
-# Global error handler instance
-_error_handler = None
+def _format_technical_details(error: Exception, context: ErrorContext, tb) -> str:
+    """Format the technical details text for an error."""
+    details = []
+    details.append(f"Error Type: {type(error).__name__}")
+    details.append(f"Error Message: {str(error)}")
+    details.append(f"Context: {context}")
+    details.append(f"Timestamp: {context.timestamp}")
+
+    # Add traceback if available
+    if tb is not None:
+        formatted = "".join(traceback.format_exception(type(error), error, tb))
+        details.append(f"\nTraceback:\n{formatted}")
+
+    return "\n".join(details)
+
+
+@functools.lru_cache(maxsize=512)
+def _user_message(error_text: str, operation: str, file_path: Optional[str],
+                  service: Optional[str]) -> str:
+    """Classify an error message; cached since the same errors tend to repeat."""
+    # Network errors
+    if _NETWORK_RE.search(error_text):
+        return "Network connection failed. Please check your internet connection and try again."
+
+    # Authentication errors
+    if _AUTH_RE.search(error_text):
+        return "Authentication failed. Please check your credentials in Settings."
+
+    # File errors
+    if file_path:
+        if _PERMISSION_RE.search(error_text):
+            return f"Cannot access file: {file_path}\nPermission denied."
+        elif _NOT_FOUND_RE.search(error_text):
+            return f"File not found: {file_path}"
+        else:
+            return f"Error processing file: {file_path}\n{error_text}"
+
+    # Service-specific errors
+    if service:
+        return f"{service} error: {error_text}"
+
+    # Generic fallback
+    return f"{operation} failed: {error_text}"
+
+
+# Global error handler instance (cheap to build, so created at import)
+_error_handler = ErrorHandler()
 
 def get_error_handler() -> ErrorHandler:
     """Get the global error handler instance (singleton)"""
-    global _error_handler
-    if _error_handler is None:
-        _error_handler = ErrorHandler()
     return _error_handler
 
 
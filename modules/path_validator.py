@@ -2,12 +2,23 @@
 """
 Secure path validation to prevent path traversal and other file system attacks.
 """
+import functools
 import os
 import pathlib
-from typing import Optional, List
+import re
+import stat
+import time
+from typing import Optional, List, Iterator
 from loguru import logger
 from . import config
 
+# safe_filename(): ASCII names go through a translate table, others a regex.
+# \w is Unicode-aware, so both keep exactly the str.isalnum() characters.
+_SAFE_FILENAME_TABLE = str.maketrans({
+    c: '_' for c in map(chr, range(128)) if not (c.isalnum() or c in ' _-.')
+})
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w .\-]')
+
 
 class PathValidationError(Exception):
     """Raised when path validation fails"""
@@ -43,6 +54,16 @@ class PathValidator:
         '/usr/sbin',
     ]
 
+    # Both lists as one prefix tuple for a single str.startswith() call,
+    # normalized to forward slashes and lower case (Windows and default
+    # macOS filesystems are case-insensitive)
+    _FORBIDDEN_PREFIXES = tuple(sorted({
+        d.replace('\\', '/').lower() for d in FORBIDDEN_DIRS_WINDOWS + FORBIDDEN_DIRS_UNIX
+    }))
+
+    # Seconds a successful validate_input_path() result may be reused for
+    _CACHE_TTL = 5.0
+
     @staticmethod
     def validate_input_path(path: str, must_exist: bool = True,
                            allow_directories: bool = True,
@@ -65,21 +86,39 @@ class PathValidator:
         if not path or not isinstance(path, str):
             raise PathValidationError("Path must be a non-empty string")
 
+        # Results expire when the time bucket rolls over; failures are never cached
+        ttl_bucket = int(time.monotonic() // PathValidator._CACHE_TTL)
+        return PathValidator._validate_input_path_cached(
+            path, must_exist, allow_directories, allow_files, ttl_bucket
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _validate_input_path_cached(path: str, must_exist: bool, allow_directories: bool,
+                                    allow_files: bool, ttl_bucket: int) -> pathlib.Path:
+        """Uncached body of validate_input_path(); ttl_bucket only keys the cache."""
         try:
             # Resolve to absolute path, following symlinks
             p = pathlib.Path(path).resolve(strict=must_exist)
         except (OSError, RuntimeError) as e:
             raise PathValidationError(f"Invalid path: {e}")
 
+        # One stat of the target and one lstat of the original path
+        # answer every existence/type/symlink question below
+        try:
+            st = os.stat(p)
+        except (OSError, ValueError):
+            st = None
+
         # Check if path exists (if required)
-        if must_exist and not p.exists():
+        if must_exist and st is None:
             raise PathValidationError(f"Path does not exist: {path}")
 
         # Check if it's the right type
-        if p.exists():
-            if p.is_dir() and not allow_directories:
+        if st is not None:
+            if stat.S_ISDIR(st.st_mode) and not allow_directories:
                 raise PathValidationError(f"Directories not allowed: {path}")
-            if p.is_file() and not allow_files:
+            if stat.S_ISREG(st.st_mode) and not allow_files:
                 raise PathValidationError(f"Files not allowed: {path}")
 
         # Check for forbidden directories
@@ -87,9 +126,12 @@ class PathValidator:
             raise PathValidationError(f"Access to system directories is forbidden: {path}")
 
         # Warn about symlinks but allow them (they've been resolved)
-        original_path = pathlib.Path(path)
-        if original_path.exists() and original_path.is_symlink():
-            target = original_path.readlink()
+        try:
+            is_link = st is not None and stat.S_ISLNK(os.lstat(path).st_mode)
+        except (OSError, ValueError):
+            is_link = False
+        if is_link:
+            target = pathlib.Path(path).readlink()
             logger.warning(f"Following symlink: {path} -> {target}")
 
             # Validate the symlink target
@@ -98,6 +140,11 @@ class PathValidator:
 
         return p
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget cached validate_input_path() results, e.g. after files were moved."""
+        PathValidator._validate_input_path_cached.cache_clear()
+
     @staticmethod
     def validate_image_file(path: str) -> pathlib.Path:
         """
@@ -119,6 +166,28 @@ class PathValidator:
             allow_files=True
         )
 
+        try:
+            # May be a cached validation of a file that has since gone away
+            file_size = p.stat().st_size
+        except OSError as e:
+            raise PathValidationError(f"Invalid path: {e}")
+
+        PathValidator._check_image_file(p, file_size, path)
+        return p
+
+    @staticmethod
+    def _check_image_file(p: pathlib.Path, file_size: int, path: str) -> None:
+        """
+        Image checks that need no path resolution: extension, size and readability.
+
+        Args:
+            p: Resolved path to the file
+            file_size: File size in bytes
+            path: Path as given by the caller, for error messages
+
+        Raises:
+            PathValidationError: If not a valid image file
+        """
         # Check file extension
         if not p.suffix.lower() in config.SUPPORTED_EXTENSIONS:
             raise PathValidationError(
@@ -128,7 +197,6 @@ class PathValidator:
 
         # Check file size (prevent loading huge files into memory)
         max_size = 100 * 1024 * 1024  # 100MB
-        file_size = p.stat().st_size
         if file_size > max_size:
             raise PathValidationError(
                 f"File too large: {file_size / (1024*1024):.1f}MB (max {max_size / (1024*1024)}MB)"
@@ -138,8 +206,6 @@ class PathValidator:
         if not os.access(p, os.R_OK):
             raise PathValidationError(f"File not readable: {path}")
 
-        return p
-
     @staticmethod
     def validate_directory(path: str) -> pathlib.Path:
         """
@@ -217,29 +283,19 @@ class PathValidator:
         Returns:
             True if path is forbidden
         """
-        path_str = str(p).replace('\\', '/')
-
-        # Check Windows forbidden dirs
-        for forbidden in PathValidator.FORBIDDEN_DIRS_WINDOWS:
-            forbidden_normalized = forbidden.replace('\\', '/')
-            if path_str.startswith(forbidden_normalized):
-                return True
-
-        # Check Unix forbidden dirs
-        for forbidden in PathValidator.FORBIDDEN_DIRS_UNIX:
-            if path_str.startswith(forbidden):
-                return True
-
-        return False
+        return str(p).replace('\\', '/').lower().startswith(PathValidator._FORBIDDEN_PREFIXES)
 
     @staticmethod
-    def scan_directory_for_images(directory: str, recursive: bool = True) -> List[pathlib.Path]:
+    def scan_directory_for_images(directory: str, recursive: bool = True,
+                                  max_files: Optional[int] = None) -> List[pathlib.Path]:
         """
         Safely scan a directory for image files.
 
         Args:
             directory: Directory to scan
             recursive: If True, scan subdirectories
+            max_files: If set, stop walking once this many valid images were
+                found (the first ones encountered, not the first in sort order)
 
         Returns:
             List of validated image file paths
@@ -249,33 +305,70 @@ class PathValidator:
         """
         dir_path = PathValidator.validate_directory(directory)
 
-        image_files = []
-
         try:
-            if recursive:
-                # Use rglob for recursive search
-                for ext in config.SUPPORTED_EXTENSIONS:
-                    image_files.extend(dir_path.rglob(f"*{ext}"))
-            else:
-                # Use glob for non-recursive search
-                for ext in config.SUPPORTED_EXTENSIONS:
-                    image_files.extend(dir_path.glob(f"*{ext}"))
-
-            # Validate each file
+            # Validate each file, keeping (sort key, path) pairs
             validated = []
-            for img_path in image_files:
+            for entry in PathValidator._iter_image_entries(str(dir_path), recursive):
+                img_path = entry.path
                 try:
-                    validated_path = PathValidator.validate_image_file(str(img_path))
-                    validated.append(validated_path)
-                except PathValidationError as e:
+                    if entry.is_symlink():
+                        # Symlink targets need the full resolve-and-check path
+                        validated_path = PathValidator.validate_image_file(img_path)
+                    else:
+                        # Resolved root, no symlinked dirs walked: already a real path
+                        validated_path = pathlib.Path(img_path)
+                        if PathValidator._is_forbidden_path(validated_path):
+                            raise PathValidationError(
+                                f"Access to system directories is forbidden: {img_path}")
+                        PathValidator._check_image_file(
+                            validated_path, entry.stat().st_size, img_path)
+                    validated.append((str(validated_path).lower(), validated_path))
+                except (PathValidationError, OSError) as e:
                     logger.warning(f"Skipping invalid file {img_path}: {e}")
                     continue
 
-            return sorted(validated, key=lambda p: str(p).lower())
+                if max_files is not None and len(validated) >= max_files:
+                    logger.info(f"Stopped scanning {directory} after {max_files} images")
+                    break
+
+            validated.sort()
+            return [p for _, p in validated]
 
         except Exception as e:
             raise PathValidationError(f"Error scanning directory {directory}: {e}")
 
+    @staticmethod
+    def _iter_image_entries(root: str, recursive: bool) -> Iterator[os.DirEntry]:
+        """
+        Walk a directory tree once, yielding entries with a supported image extension.
+
+        Symlinked directories are not descended into, matching Path.rglob().
+        Unreadable subdirectories are skipped with a warning.
+
+        Args:
+            root: Directory to scan
+            recursive: If True, descend into subdirectories
+
+        Yields:
+            os.DirEntry for each candidate image file
+        """
+        exts = tuple(config.SUPPORTED_EXTENSIONS)
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                        elif entry.name.lower().endswith(exts) and entry.is_file():
+                            yield entry
+            except OSError as e:
+                if current == root:
+                    raise
+                logger.warning(f"Skipping unreadable directory {current}: {e}")
+
     @staticmethod
     def safe_filename(filename: str, max_length: int = 100) -> str:
         """
@@ -289,12 +382,10 @@ class PathValidator:
             Safe filename string
         """
         # Remove or replace dangerous characters
-        safe = ""
-        for char in filename:
-            if char.isalnum() or char in (' ', '_', '-', '.'):
-                safe += char
-            else:
-                safe += '_'
+        if filename.isascii():
+            safe = filename.translate(_SAFE_FILENAME_TABLE)
+        else:
+            safe = _UNSAFE_FILENAME_RE.sub('_', filename)
 
         # Remove leading/trailing dots and spaces
         safe = safe.strip('. ')
@@ -6,13 +6,36 @@ and the new plugin system, allowing both legacy built-in services and new
 plugins to coexist.
 """
 
+import asyncio
+import atexit
+import functools
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Dict, List, Any, Callable
+from typing import Optional, Dict, List, Any, Callable, Tuple, Union
 from loguru import logger
 
-from .plugin_manager import PluginManager
+from . import _json_io
 from .plugin_interface import ImageHostPlugin, UploadResult, UploadException
 
+# Built-in (legacy) services
+_BUILTIN_NAMES = frozenset({'imx.to', 'pixhost.to', 'turboimagehost', 'vipr.im'})
+_GALLERY_BUILTINS = frozenset({'pixhost.to', 'imx.to', 'vipr.im'})
+_BUILTIN_THREAD_COUNTS = {
+    'imx.to': 5,
+    'pixhost.to': 3,
+    'turboimagehost': 2,
+    'vipr.im': 1
+}
+
+# _resolve() results for built-in names and for names that are neither
+# built-in nor a plugin
+_BUILTIN_SERVICE = ('builtin', None)
+_UNKNOWN_SERVICE = ('none', None)
+
+# How long a successful credential validation is trusted, in seconds
+_VALIDATION_TTL = 300.0
+
 
 class ServiceRegistry:
     """
@@ -29,7 +52,13 @@ class ServiceRegistry:
         Args:
             plugin_dir: Directory containing plugin files
         """
-        self.plugin_manager = PluginManager(plugin_dir, auto_load=True)
+        # Imported here so importing this module does not pull in plugin discovery
+        from .plugin_manager import PluginManager
+
+        # Plugin files are only discovered here; each one is imported the
+        # first time its service is resolved (see _resolve)
+        self.plugin_manager = PluginManager(plugin_dir, auto_load=False)
+        self._load_lock = threading.Lock()
 
         # Built-in services (legacy)
         self.builtin_services = {
@@ -38,18 +67,97 @@ class ServiceRegistry:
             'turboimagehost': {'name': 'turboimagehost', 'is_plugin': False},
             'vipr.im': {'name': 'vipr.im', 'is_plugin': False}
         }
+        self._builtin_names = tuple(self.builtin_services)
+
+        # Built-in metadata is static, so build it once
+        self._builtin_metadata: Dict[str, Dict] = {
+            name: {
+                'name': name,
+                'version': '2.5.0',
+                'author': 'Connie Combs',
+                'description': f'Built-in {name} uploader',
+                'supports_galleries': name in _GALLERY_BUILTINS,
+                'requires_authentication': True,
+                'max_concurrent_uploads': self._get_builtin_thread_count(name)
+            }
+            for name in self.builtin_services
+        }
+        self._builtin_metadata_list: List[Dict] = list(self._builtin_metadata.values())
+        # Scheduling flags per service; plugin entries are added by _resolve()
+        self._supports_galleries: Dict[str, bool] = {}
+        self._max_concurrent: Dict[str, int] = {}
+        self._reset_service_flags()
+        self._plugin_metadata_cached = functools.lru_cache(maxsize=None)(
+            self.plugin_manager.get_plugin_metadata
+        )
+
+        # Plugin UI schemas, by service name
+        self._cred_fields_cache: Dict[str, Dict] = {}
+        self._options_cache: Dict[str, Dict] = {}
+        # The same schemas, JSON-encoded for the UI
+        self._cred_fields_json: Dict[str, bytes] = {}
+        self._options_json: Dict[str, bytes] = {}
+
+        # Service listings only change on reload_plugins()
+        self._names_cache: Optional[List[str]] = None
+        self._all_services_cache: Optional[List[Dict]] = None
+        # plugin name -> ('plugin', plugin_class), filled in as names are resolved
+        self._service_index: Dict[str, Tuple[str, Optional[type]]] = {}
+
+        # Live plugin instances, reused so their HTTP connections stay open
+        self._plugin_pool: Dict[Tuple[str, frozenset], ImageHostPlugin] = {}
+        # Instances replaced after a config change, cleaned up with the pool
+        self._retired_plugins: List[ImageHostPlugin] = []
+        self._pool_lock = threading.Lock()
+
+        # (service, frozenset of credentials) -> expiry on the monotonic clock;
+        # only successful validations are kept, so a network error is retried
+        self._validation_cache: Dict[Tuple[str, frozenset], float] = {}
+        self._validation_lock = threading.Lock()
+
+    def _resolve(self, service_name: str) -> Tuple[str, Optional[type]]:
+        """
+        Look up what kind of service a name refers to.
+
+        Args:
+            service_name: Name of service
+
+        Returns:
+            ('builtin', None), ('plugin', plugin_class) or ('none', None)
+        """
+        # Built-in names never touch the plugin manager; a plugin cannot
+        # shadow a built-in service
+        if service_name in _BUILTIN_NAMES:
+            return _BUILTIN_SERVICE
+
+        entry = self._service_index.get(service_name)
+        if entry is None:
+            with self._load_lock:
+                plugin_class = self.plugin_manager.get_plugin(service_name)
+            if plugin_class is None:
+                return _UNKNOWN_SERVICE
+            entry = ('plugin', plugin_class)
+            self._supports_galleries[service_name] = plugin_class.supports_galleries
+            self._max_concurrent[service_name] = plugin_class.max_concurrent_uploads
+            self._service_index[service_name] = entry
+        return entry
 
     def get_service_names(self) -> List[str]:
         """
         Get list of all available services (built-in + plugins).
 
+        Plugin names are class attributes, so listing them imports every
+        plugin file that has not been loaded yet.
+
         Returns:
-            List of service names
+            List of service names (cached; do not modify)
         """
-        builtin_names = list(self.builtin_services.keys())
-        plugin_names = self.plugin_manager.get_plugin_names()
-
-        return builtin_names + plugin_names
+        if self._names_cache is None:
+            self._names_cache = list(self._builtin_names) + [
+                name for name in self.plugin_manager.get_plugin_names()
+                if name not in _BUILTIN_NAMES
+            ]
+        return self._names_cache
 
     def is_plugin_service(self, service_name: str) -> bool:
         """
@@ -61,7 +169,7 @@ class ServiceRegistry:
         Returns:
             True if service is a plugin
         """
-        return self.plugin_manager.has_plugin(service_name)
+        return self._resolve(service_name)[0] == 'plugin'
 
     def is_builtin_service(self, service_name: str) -> bool:
         """
@@ -73,7 +181,7 @@ class ServiceRegistry:
         Returns:
             True if service is built-in
         """
-        return service_name in self.builtin_services
+        return service_name in _BUILTIN_NAMES
 
     def has_service(self, service_name: str) -> bool:
         """
@@ -85,7 +193,7 @@ class ServiceRegistry:
         Returns:
             True if service exists
         """
-        return self.is_builtin_service(service_name) or self.is_plugin_service(service_name)
+        return self._resolve(service_name)[0] != 'none'
 
     def get_plugin_instance(
         self,
@@ -104,14 +212,71 @@ class ServiceRegistry:
         Returns:
             Plugin instance if service is a plugin, None otherwise
         """
-        if not self.is_plugin_service(service_name):
+        kind, plugin_class = self._resolve(service_name)
+        if kind != 'plugin':
             return None
 
-        plugin_class = self.plugin_manager.get_plugin(service_name)
-        if plugin_class:
-            return plugin_class(credentials=credentials, config=config)
+        return plugin_class(credentials=credentials, config=config)
 
-        return None
+    def acquire_plugin(
+        self,
+        service_name: str,
+        credentials: Dict = None,
+        config: Dict = None
+    ) -> Tuple[Optional[ImageHostPlugin], bool]:
+        """
+        Return a pooled plugin instance for a service and credential set.
+
+        Instances are kept until reload_plugins() or close_plugin_instances(),
+        so callers must not call cleanup() on them; pass the returned flag to
+        release_plugin() when done. A pooled instance is reused only while its
+        config is unchanged. Credentials that cannot be hashed get a fresh,
+        unpooled instance.
+
+        Args:
+            service_name: Name of plugin service
+            credentials: Service credentials
+            config: Optional configuration
+
+        Returns:
+            (plugin instance or None if service is not a plugin, whether the
+            instance is owned by the pool)
+        """
+        try:
+            key = (service_name, frozenset((credentials or {}).items()))
+            hash(key)
+        except TypeError:
+            return self.get_plugin_instance(service_name, credentials, config), False
+
+        with self._pool_lock:
+            plugin = self._plugin_pool.get(key)
+            if plugin is not None and plugin.config != (config or {}):
+                # Other uploads may still hold the old instance; clean it up with the pool
+                self._retired_plugins.append(plugin)
+                plugin = None
+            if plugin is None:
+                plugin = self.get_plugin_instance(service_name, credentials, config)
+                if plugin is not None:
+                    self._plugin_pool[key] = plugin
+            return plugin, plugin is not None
+
+    def release_plugin(self, plugin: ImageHostPlugin, pooled: bool):
+        """Clean up a plugin instance from acquire_plugin() unless pooled."""
+        if not pooled:
+            plugin.cleanup()
+
+    def close_plugin_instances(self):
+        """Clean up all pooled plugin instances."""
+        with self._pool_lock:
+            plugins = list(self._plugin_pool.values()) + self._retired_plugins
+            self._plugin_pool.clear()
+            self._retired_plugins = []
+
+        for plugin in plugins:
+            try:
+                plugin.cleanup()
+            except Exception as e:
+                logger.warning(f"Plugin cleanup error: {e}")
 
     def get_credential_fields(self, service_name: str) -> Dict:
         """
@@ -123,14 +288,10 @@ class ServiceRegistry:
         Returns:
             Dictionary of credential field metadata
         """
-        if self.is_plugin_service(service_name):
-            plugin_class = self.plugin_manager.get_plugin(service_name)
-            if plugin_class:
-                # Create temporary instance to get field info
-                temp_instance = plugin_class()
-                fields = temp_instance.get_credential_fields()
-                temp_instance.cleanup()
-                return fields
+        kind, plugin_class = self._resolve(service_name)
+        if kind == 'plugin':
+            return self._get_plugin_schema(service_name, plugin_class, 'get_credential_fields',
+                                           self._cred_fields_cache)
 
         # Return empty for built-in services (they have hardcoded UI)
         return {}
@@ -145,52 +306,89 @@ class ServiceRegistry:
         Returns:
             Dictionary of upload option metadata
         """
-        if self.is_plugin_service(service_name):
-            plugin_class = self.plugin_manager.get_plugin(service_name)
-            if plugin_class:
-                # Create temporary instance to get option info
-                temp_instance = plugin_class()
-                options = temp_instance.get_upload_options()
-                temp_instance.cleanup()
-                return options
+        kind, plugin_class = self._resolve(service_name)
+        if kind == 'plugin':
+            return self._get_plugin_schema(service_name, plugin_class, 'get_upload_options',
+                                           self._options_cache)
 
         return {}
 
-    def get_service_metadata(self, service_name: str) -> Optional[Dict]:
+    def get_credential_fields_json(self, service_name: str) -> bytes:
         """
-        Get metadata for a service.
+        Get credential fields for a service as JSON-encoded bytes.
 
         Args:
             service_name: Name of service
 
         Returns:
-            Service metadata dictionary
+            UTF-8 JSON of get_credential_fields() (cached per service)
         """
-        if self.is_plugin_service(service_name):
-            return self.plugin_manager.get_plugin_metadata(service_name)
+        cached = self._cred_fields_json.get(service_name)
+        if cached is None:
+            cached = _json_io.dumps_compact(self.get_credential_fields(service_name))
+            self._cred_fields_json[service_name] = cached
+        return cached
 
-        if self.is_builtin_service(service_name):
-            return {
-                'name': service_name,
-                'version': '2.5.0',
-                'author': 'Connie Combs',
-                'description': f'Built-in {service_name} uploader',
-                'supports_galleries': service_name in ['pixhost.to', 'imx.to', 'vipr.im'],
-                'requires_authentication': True,
-                'max_concurrent_uploads': self._get_builtin_thread_count(service_name)
-            }
+    def get_upload_options_json(self, service_name: str) -> bytes:
+        """
+        Get upload options for a service as JSON-encoded bytes.
+
+        Args:
+            service_name: Name of service
 
+        Returns:
+            UTF-8 JSON of get_upload_options() (cached per service)
+        """
+        cached = self._options_json.get(service_name)
+        if cached is None:
+            cached = _json_io.dumps_compact(self.get_upload_options(service_name))
+            self._options_json[service_name] = cached
+        return cached
+
+    def _get_plugin_schema(self, service_name: str, plugin_class: type,
+                           method_name: str, cache: Dict) -> Dict:
+        """
+        Get a plugin UI schema, caching the result.
+
+        Uses the class-level schema when the plugin provides one and only
+        falls back to a temporary instance otherwise. Schemas do not depend
+        on credentials, so this happens at most once per reload.
+        """
+        if service_name in cache:
+            return cache[service_name]
+
+        schema = getattr(plugin_class, method_name + '_class')()
+        if schema is None:
+            # Only the instance method knows the schema
+            temp_instance = plugin_class()
+            try:
+                schema = getattr(temp_instance, method_name)()
+            finally:
+                temp_instance.cleanup()
+
+        cache[service_name] = schema
+        return schema
+
+    def get_service_metadata(self, service_name: str) -> Optional[Dict]:
+        """
+        Get metadata for a service.
+
+        Args:
+            service_name: Name of service
+
+        Returns:
+            Service metadata dictionary (cached; do not modify)
+        """
+        kind = self._resolve(service_name)[0]
+        if kind == 'plugin':
+            return self._plugin_metadata_cached(service_name)
+        if kind == 'builtin':
+            return self._builtin_metadata[service_name]
         return None
 
     def _get_builtin_thread_count(self, service_name: str) -> int:
         """Get default thread count for built-in services."""
-        defaults = {
-            'imx.to': 5,
-            'pixhost.to': 3,
-            'turboimagehost': 2,
-            'vipr.im': 1
-        }
-        return defaults.get(service_name, 2)
+        return _BUILTIN_THREAD_COUNTS.get(service_name, 2)
 
     def upload_via_plugin(
         self,
@@ -217,10 +415,10 @@ class ServiceRegistry:
             UploadException: If upload fails
             ValueError: If service is not a plugin
         """
-        if not self.is_plugin_service(service_name):
+        if self._resolve(service_name)[0] != 'plugin':
             raise ValueError(f"Service '{service_name}' is not a plugin")
 
-        plugin = self.get_plugin_instance(service_name, credentials, config)
+        plugin, pooled = self.acquire_plugin(service_name, credentials, config)
         if not plugin:
             raise UploadException(f"Failed to create plugin instance for {service_name}")
 
@@ -228,12 +426,64 @@ class ServiceRegistry:
             result = plugin.upload(file_path, progress_callback)
             return result
         finally:
-            plugin.cleanup()
+            self.release_plugin(plugin, pooled)
+
+    async def upload_many_via_plugin(
+        self,
+        service_name: str,
+        file_paths: List[Path],
+        credentials: Dict,
+        config: Dict = None,
+        concurrency: Optional[int] = None
+    ) -> List[Union[UploadResult, BaseException]]:
+        """
+        Upload several files concurrently using a plugin service.
+
+        Args:
+            service_name: Name of plugin service
+            file_paths: Paths of files to upload
+            credentials: Service credentials
+            config: Optional configuration
+            concurrency: Max simultaneous uploads (defaults to the service's
+                max_concurrent_uploads)
+
+        Returns:
+            One entry per file, in order: the UploadResult, or the exception
+            that file's upload raised
+
+        Raises:
+            UploadException: If the plugin instance cannot be created
+            ValueError: If service is not a plugin
+        """
+        if self._resolve(service_name)[0] != 'plugin':
+            raise ValueError(f"Service '{service_name}' is not a plugin")
+
+        plugin, pooled = self.acquire_plugin(service_name, credentials, config)
+        if not plugin:
+            raise UploadException(f"Failed to create plugin instance for {service_name}")
+
+        semaphore = asyncio.Semaphore(concurrency or self.get_max_concurrent_uploads(service_name))
+
+        async def _bounded(file_path):
+            async with semaphore:
+                return await plugin.upload_async(file_path)
+
+        try:
+            return await asyncio.gather(
+                *(_bounded(fp) for fp in file_paths), return_exceptions=True
+            )
+        finally:
+            self.release_plugin(plugin, pooled)
 
     def validate_credentials(self, service_name: str, credentials: Dict) -> bool:
         """
         Validate credentials for a service.
 
+        Successful plugin results are cached per credential set for
+        _VALIDATION_TTL seconds, so repeated checks do not hit the network.
+        Failures are not cached, since plugins also report network errors
+        as invalid credentials.
+
         Args:
             service_name: Name of service
             credentials: Credentials to validate
@@ -241,13 +491,29 @@ class ServiceRegistry:
         Returns:
             True if credentials are valid
         """
-        if self.is_plugin_service(service_name):
-            plugin = self.get_plugin_instance(service_name, credentials)
+        if self._resolve(service_name)[0] == 'plugin':
+            try:
+                key = (service_name, frozenset((credentials or {}).items()))
+                hash(key)
+            except TypeError:
+                key = None
+
+            if key is not None:
+                with self._validation_lock:
+                    expiry = self._validation_cache.get(key)
+                if expiry is not None and time.monotonic() < expiry:
+                    return True
+
+            plugin, pooled = self.acquire_plugin(service_name, credentials)
             if plugin:
                 try:
-                    return plugin.validate_credentials()
+                    is_valid = plugin.validate_credentials()
                 finally:
-                    plugin.cleanup()
+                    self.release_plugin(plugin, pooled)
+                if is_valid and key is not None:
+                    with self._validation_lock:
+                        self._validation_cache[key] = time.monotonic() + _VALIDATION_TTL
+                return is_valid
 
         # Built-in services use their own validation logic
         return True
@@ -271,13 +537,13 @@ class ServiceRegistry:
         Returns:
             Gallery URL if successful
         """
-        if self.is_plugin_service(service_name):
-            plugin = self.get_plugin_instance(service_name, credentials)
+        if self._resolve(service_name)[0] == 'plugin':
+            plugin, pooled = self.acquire_plugin(service_name, credentials)
             if plugin:
                 try:
                     return plugin.create_gallery(gallery_name, image_urls)
                 finally:
-                    plugin.cleanup()
+                    self.release_plugin(plugin, pooled)
 
         # Built-in services use their own gallery logic
         return None
@@ -292,10 +558,9 @@ class ServiceRegistry:
         Returns:
             True if service supports galleries
         """
-        metadata = self.get_service_metadata(service_name)
-        if metadata:
-            return metadata.get('supports_galleries', False)
-        return False
+        if service_name not in self._supports_galleries:
+            self._resolve(service_name)
+        return self._supports_galleries.get(service_name, False)
 
     def get_max_concurrent_uploads(self, service_name: str) -> int:
         """
@@ -307,47 +572,71 @@ class ServiceRegistry:
         Returns:
             Max concurrent upload count
         """
-        metadata = self.get_service_metadata(service_name)
-        if metadata:
-            return metadata.get('max_concurrent_uploads', 3)
-        return 3
+        if service_name not in self._max_concurrent:
+            self._resolve(service_name)
+        return self._max_concurrent.get(service_name, 3)
 
     def reload_plugins(self):
         """Reload all plugins from disk."""
-        self.plugin_manager.unload_all_plugins()
-        self.plugin_manager.load_all_plugins()
+        # Pooled instances belong to the old plugin classes
+        self.close_plugin_instances()
+        with self._load_lock:
+            self.plugin_manager.unload_all_plugins()
+            self.plugin_manager.load_all_plugins()
+        self._invalidate_caches()
         logger.info("Reloaded all plugins")
 
+    def _invalidate_caches(self):
+        """Drop cached service listings after the plugin set changed."""
+        self._names_cache = None
+        self._all_services_cache = None
+        self._service_index = {}
+        self._reset_service_flags()
+        self._plugin_metadata_cached.cache_clear()
+        self._cred_fields_cache.clear()
+        self._options_cache.clear()
+        self._cred_fields_json.clear()
+        self._options_json.clear()
+        with self._validation_lock:
+            self._validation_cache.clear()
+
+    def _reset_service_flags(self):
+        """Reset the scheduling flag tables to the built-in services only."""
+        self._supports_galleries = {
+            name: meta['supports_galleries'] for name, meta in self._builtin_metadata.items()
+        }
+        self._max_concurrent = {
+            name: meta['max_concurrent_uploads'] for name, meta in self._builtin_metadata.items()
+        }
+
     def list_all_services(self) -> List[Dict]:
         """
         List all services with metadata.
 
         Returns:
-            List of service metadata dictionaries
+            List of service metadata dictionaries (cached; do not modify)
         """
-        services = []
-
-        # Add built-in services
-        for name in self.builtin_services:
-            services.append(self.get_service_metadata(name))
+        if self._all_services_cache is None:
+            self._all_services_cache = (
+                self._builtin_metadata_list + self.plugin_manager.list_plugins()
+            )
 
-        # Add plugin services
-        services.extend(self.plugin_manager.list_plugins())
-
-        return services
+        return self._all_services_cache
 
     def __len__(self):
         """Return total number of available services."""
-        return len(self.builtin_services) + len(self.plugin_manager)
+        return len(self.get_service_names())
 
     def __repr__(self):
         builtin_count = len(self.builtin_services)
-        plugin_count = len(self.plugin_manager)
-        return f"<ServiceRegistry: {builtin_count} built-in, {plugin_count} plugins>"
+        # len(plugin_manager) would load every pending plugin
+        plugin_count = len(self.plugin_manager.plugins)
+        return f"<ServiceRegistry: {builtin_count} built-in, {plugin_count} plugins loaded>"
 
 
 # Global service registry instance
 _service_registry: Optional[ServiceRegistry] = None
+_registry_lock = threading.Lock()
 
 
 def get_service_registry(plugin_dir: Path = None) -> ServiceRegistry:
@@ -363,11 +652,32 @@ def get_service_registry(plugin_dir: Path = None) -> ServiceRegistry:
     global _service_registry
 
     if _service_registry is None:
-        if plugin_dir is None:
-            # Default to plugins/ in project root
-            plugin_dir = Path(__file__).parent.parent / 'plugins'
+        # Double-checked so concurrent first callers build only one registry
+        with _registry_lock:
+            if _service_registry is None:
+                if plugin_dir is None:
+                    # Default to plugins/ in project root
+                    plugin_dir = Path(__file__).parent.parent / 'plugins'
+
+                _service_registry = ServiceRegistry(plugin_dir)
+                atexit.register(_service_registry.close_plugin_instances)
+                logger.opt(lazy=True).info("Initialized service registry: {}",
+                                           lambda: repr(_service_registry))
 
-        _service_registry = ServiceRegistry(plugin_dir)
-        logger.info(f"Initialized service registry: {_service_registry}")
+    return _service_registry
+
+
+def init_service_registry(plugin_dir: Path = None) -> ServiceRegistry:
+    """
+    Create the global service registry up front.
 
-    return _service_registry
\ No newline at end of file
+    Call this during application startup so plugin discovery happens there
+    rather than on whichever code path first asks for a service.
+
+    Args:
+        plugin_dir: Plugin directory (defaults to plugins/ in project root)
+
+    Returns:
+        ServiceRegistry instance
+    """
+    return get_service_registry(plugin_dir)
\ No newline at end of file
@@ -4,28 +4,133 @@ Plugin interface for custom image hosting services.
 This module provides the base class that all image hosting plugins must implement.
 """
 
+import asyncio
+import atexit
+import functools
+import mimetypes
+import os
+import sys
+import threading
+import types
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Tuple, Callable
+from typing import Any, Dict, Mapping, Optional, Tuple, Callable, TYPE_CHECKING
 from pathlib import Path
-import httpx
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    # Only needed for annotations; plugins import httpx themselves
+    import httpx
+
 
 class UploadException(Exception):
     """Exception raised when upload fails"""
     pass
 
 
-@dataclass
+# Shared, read-only metadata for results that carry none
+_EMPTY_METADATA: Mapping = types.MappingProxyType({})
+
+# dataclass(slots=True) needs Python 3.10+
+_RESULT_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_RESULT_SLOTS)
 class UploadResult:
-    """Result of an upload operation"""
+    """Result of an upload operation (immutable)"""
     image_url: str
     thumb_url: str
-    metadata: Dict = None
+    metadata: Optional[Mapping] = None
 
     def __post_init__(self):
         if self.metadata is None:
-            self.metadata = {}
+            object.__setattr__(self, 'metadata', _EMPTY_METADATA)
+
+
+# Process-wide HTTP client shared by plugins (see get_shared_client)
+_SHARED_CLIENT: Optional["httpx.Client"] = None
+_shared_client_lock = threading.Lock()
+_shared_client_atexit = False
+
+
+def get_shared_client() -> "httpx.Client":
+    """
+    Return the HTTP client shared by opted-in plugins, creating it on first use.
+
+    Sharing one connection pool lets plugins that hit the same hosts reuse
+    open connections and TLS sessions instead of each opening their own.
+    HTTP/2, pool limits and timeout come from the network config; the
+    client is closed at interpreter exit, and recreated if it was closed.
+
+    Returns:
+        Shared httpx.Client (must not be closed or customised by plugins)
+    """
+    global _SHARED_CLIENT, _shared_client_atexit
+
+    client = _SHARED_CLIENT
+    if client is None or client.is_closed:
+        with _shared_client_lock:
+            if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+                import httpx
+                from .config_loader import get_config_loader
+
+                net = get_config_loader().config.network
+                _SHARED_CLIENT = httpx.Client(
+                    http2=net.http2_enabled,
+                    limits=httpx.Limits(
+                        max_connections=net.max_connections,
+                        max_keepalive_connections=net.max_keepalive_connections,
+                        keepalive_expiry=net.keepalive_expiry_seconds
+                    ),
+                    timeout=httpx.Timeout(net.timeout_seconds, connect=10.0)
+                )
+                if not _shared_client_atexit:
+                    atexit.register(close_shared_client)
+                    _shared_client_atexit = True
+            client = _SHARED_CLIENT
+    return client
+
+
+def close_shared_client():
+    """Close the shared plugin HTTP client, if it was created."""
+    global _SHARED_CLIENT
+
+    with _shared_client_lock:
+        client, _SHARED_CLIENT = _SHARED_CLIENT, None
+    if client is not None:
+        client.close()
+
+
+class _ProgressReader:
+    """
+    File wrapper that reports bytes read to a progress callback.
+
+    httpx pulls multipart file fields through read() in small chunks, so
+    wrapping the file keeps uploads streaming while counting progress.
+    """
+
+    def __init__(self, file_obj, total: int, callback: Callable[[int, int], None]):
+        self._file = file_obj
+        self._total = total
+        self._callback = callback
+        self._sent = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file.read(size)
+        self._sent += len(chunk)
+        self._callback(self._sent, self._total)
+        return chunk
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        # httpx rewinds the file before sending; restart progress with it
+        pos = self._file.seek(offset, whence)
+        self._sent = pos
+        return pos
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def fileno(self) -> int:
+        return self._file.fileno()
 
 
 class ImageHostPlugin(ABC):
@@ -48,8 +153,14 @@ class ImageHostPlugin(ABC):
             def validate_credentials(self):
                 # Implementation
                 pass
+
+    Per-instance state lives in slots. Subclasses get a __dict__ unless they
+    declare their own __slots__; slotted subclasses must also set
+    allowed_formats as a class attribute.
     """
 
+    __slots__ = ('credentials', 'config', 'client', '_allowed_formats_set', '_max_size_bytes')
+
     # Required metadata - subclasses must define these
     name: str = ""
     version: str = "1.0.0"
@@ -67,6 +178,10 @@ class ImageHostPlugin(ABC):
     # Threading configuration
     max_concurrent_uploads: int = 3
 
+    # Opt in to the process-wide HTTP client (see get_shared_client); only for
+    # plugins that never close it or set headers, auth or cookies on it
+    use_shared_client: bool = False
+
     def __init__(self, credentials: Dict = None, config: Dict = None):
         """
         Initialize plugin with credentials and configuration.
@@ -77,12 +192,72 @@ class ImageHostPlugin(ABC):
         """
         self.credentials = credentials or {}
         self.config = config or {}
-        self.client: Optional[httpx.Client] = None
+        self.client: Optional["httpx.Client"] = (
+            get_shared_client() if self.use_shared_client else None
+        )
 
         # Set default allowed formats if not specified
         if self.allowed_formats is None:
             self.allowed_formats = ['jpg', 'jpeg', 'png', 'gif', 'webp', 'bmp']
 
+        # Precomputed for validate_file(), which runs once per file in a batch
+        self._allowed_formats_set = frozenset(map(str.lower, self.allowed_formats))
+        self._max_size_bytes = self.max_file_size_mb * 1024 * 1024
+
+    @classmethod
+    def class_metadata(cls) -> Dict:
+        """
+        Return plugin metadata from the class attributes.
+
+        Works on the class itself, so callers do not need an instance.
+
+        Returns:
+            Dictionary of plugin metadata
+        """
+        return {
+            'name': cls.name,
+            'version': cls.version,
+            'author': cls.author,
+            'description': cls.description,
+            'service_url': cls.service_url,
+            'supports_galleries': cls.supports_galleries,
+            'supports_private': cls.supports_private,
+            'requires_authentication': cls.requires_authentication,
+            'max_file_size_mb': cls.max_file_size_mb,
+            'allowed_formats': cls.allowed_formats or [],
+            'max_concurrent_uploads': cls.max_concurrent_uploads
+        }
+
+    @classmethod
+    def get_credential_fields_class(cls) -> Optional[Dict[str, Dict]]:
+        """
+        Return credential fields without creating an instance.
+
+        Override this instead of get_credential_fields() when the fields do
+        not depend on credentials or configuration; the UI can then build
+        its forms without instantiating the plugin.
+
+        Returns:
+            Credential field metadata (see get_credential_fields), or None
+            if the plugin only provides them through the instance method
+        """
+        if cls.get_credential_fields is not ImageHostPlugin.get_credential_fields:
+            return None
+        return {}
+
+    @classmethod
+    def get_upload_options_class(cls) -> Optional[Dict[str, Dict]]:
+        """
+        Return upload options without creating an instance.
+
+        Returns:
+            Upload option metadata (see get_upload_options), or None if the
+            plugin only provides them through the instance method
+        """
+        if cls.get_upload_options is not ImageHostPlugin.get_upload_options:
+            return None
+        return {}
+
     @abstractmethod
     def upload(
         self,
@@ -105,11 +280,11 @@ class ImageHostPlugin(ABC):
 
         Example:
             def upload(self, file_path, progress_callback=None):
-                with open(file_path, 'rb') as f:
-                    response = self.client.post(
-                        'https://api.example.com/upload',
-                        files={'image': f}
-                    )
+                response = self._stream_upload(
+                    'https://api.example.com/upload',
+                    file_path,
+                    progress_callback=progress_callback
+                )
 
                 data = response.json()
                 return UploadResult(
@@ -119,6 +294,33 @@ class ImageHostPlugin(ABC):
         """
         pass
 
+    async def upload_async(
+        self,
+        file_path: Path,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> UploadResult:
+        """
+        Upload an image without blocking the event loop.
+
+        The default implementation runs upload() in the loop's default
+        thread pool, so several uploads can wait on the network at once.
+        Plugins with a native async client can override this.
+
+        Args:
+            file_path: Path to the image file to upload
+            progress_callback: Optional callback function(bytes_sent, total_bytes)
+
+        Returns:
+            UploadResult containing image_url and thumb_url
+
+        Raises:
+            UploadException: If upload fails for any reason
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.upload, file_path, progress_callback)
+        )
+
     @abstractmethod
     def validate_credentials(self) -> bool:
         """
@@ -177,7 +379,7 @@ class ImageHostPlugin(ABC):
                     }
                 }
         """
-        return {}
+        return self.get_credential_fields_class() or {}
 
     def create_gallery(
         self,
@@ -232,18 +434,72 @@ class ImageHostPlugin(ABC):
             Default implementation checks file size and format.
             Subclasses can override for custom validation.
         """
-        # Check file exists
-        if not file_path.exists():
+        path = os.fspath(file_path)
+
+        # Check file exists (one stat serves the size check as well)
+        try:
+            st = os.stat(path)
+        except OSError:
             return False, "File does not exist"
 
+        return self._check_file(path, st.st_size)
+
+    def validate_files(self, file_paths) -> Dict[Path, Tuple[bool, Optional[str]]]:
+        """
+        Validate many files, listing each parent directory only once.
+
+        Files are looked up in a single os.scandir() pass per directory,
+        which saves round-trips when many files share a (network) folder.
+
+        Args:
+            file_paths: Iterable of paths to validate
+
+        Returns:
+            Dictionary mapping each path to (is_valid, error_message)
+        """
+        file_paths = list(file_paths)
+
+        # Respect custom validation in subclasses
+        if type(self).validate_file is not ImageHostPlugin.validate_file:
+            return {fp: self.validate_file(fp) for fp in file_paths}
+
+        by_dir: Dict[str, list] = {}
+        for fp in file_paths:
+            by_dir.setdefault(os.path.dirname(os.fspath(fp)), []).append(fp)
+
+        results = {}
+        for directory, paths in by_dir.items():
+            try:
+                with os.scandir(directory or '.') as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError:
+                entries = {}
+
+            for fp in paths:
+                path = os.fspath(fp)
+                entry = entries.get(os.path.basename(path))
+                try:
+                    size = entry.stat().st_size if entry is not None else None
+                except OSError:
+                    size = None
+
+                if size is None:
+                    results[fp] = (False, "File does not exist")
+                else:
+                    results[fp] = self._check_file(path, size)
+
+        return results
+
+    def _check_file(self, path: str, size: int) -> Tuple[bool, Optional[str]]:
+        """Check format and size for a file that is known to exist."""
         # Check file extension
-        ext = file_path.suffix.lower().lstrip('.')
-        if ext not in self.allowed_formats:
+        ext = os.path.splitext(path)[1][1:].lower()
+        if ext not in self._allowed_formats_set:
             return False, f"Format '{ext}' not supported. Allowed: {', '.join(self.allowed_formats)}"
 
         # Check file size
-        size_mb = file_path.stat().st_size / (1024 * 1024)
-        if size_mb > self.max_file_size_mb:
+        if size > self._max_size_bytes:
+            size_mb = size / (1024 * 1024)
             return False, f"File too large ({size_mb:.1f}MB). Max: {self.max_file_size_mb}MB"
 
         return True, None
@@ -281,7 +537,52 @@ class ImageHostPlugin(ABC):
                     }
                 }
         """
-        return {}
+        return self.get_upload_options_class() or {}
+
+    def _stream_upload(
+        self,
+        url: str,
+        file_path: Path,
+        field_name: str = 'image',
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        extra_fields: Optional[Dict[str, Any]] = None,
+        content_type: Optional[str] = None
+    ) -> "httpx.Response":
+        """
+        POST a file as multipart/form-data without loading it into memory.
+
+        The file is streamed from disk in chunks, so memory use stays flat
+        regardless of file size.
+
+        Args:
+            url: Upload endpoint
+            file_path: Path to the file to upload
+            field_name: Multipart field name for the file
+            progress_callback: Optional callback function(bytes_sent, total_bytes)
+            extra_fields: Optional extra form fields
+            content_type: File content type (guessed from the name if omitted)
+
+        Returns:
+            The httpx response
+
+        Raises:
+            UploadException: If the plugin has no HTTP client
+        """
+        if self.client is None:
+            raise UploadException(f"{self.name}: HTTP client not initialized")
+
+        if content_type is None:
+            content_type = mimetypes.guess_type(file_path.name)[0] or 'application/octet-stream'
+
+        with open(file_path, 'rb') as f:
+            body = f
+            if progress_callback:
+                body = _ProgressReader(f, os.fstat(f.fileno()).st_size, progress_callback)
+            return self.client.post(
+                url,
+                files={field_name: (file_path.name, body, content_type)},
+                data=extra_fields
+            )
 
     def cleanup(self):
         """
@@ -289,8 +590,9 @@ class ImageHostPlugin(ABC):
 
         Called when the plugin is being unloaded or app is closing.
         Subclasses should override to clean up any resources.
+        The shared client is left open for other plugins.
         """
-        if self.client:
+        if self.client and self.client is not _SHARED_CLIENT:
             try:
                 self.client.close()
             except:
@@ -6,9 +6,11 @@ and lifecycle management.
 """
 
 import importlib.util
-import inspect
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Type
+from typing import Dict, List, Optional, Set, Tuple, Type
 from loguru import logger
 
 from modules.plugin_interface import ImageHostPlugin
@@ -19,12 +21,84 @@ class PluginLoadError(Exception):
     pass
 
 
+# dataclass(slots=True) needs Python 3.10+
+_METADATA_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_METADATA_SLOTS)
+class PluginMetadata:
+    """Metadata of a registered plugin (immutable)"""
+    name: str
+    version: str
+    author: str
+    description: str
+    service_url: str
+    supports_galleries: bool
+    supports_private: bool
+    requires_authentication: bool
+    max_file_size_mb: int
+    allowed_formats: Tuple[str, ...]
+    max_concurrent_uploads: int
+    source_file: str
+
+    @classmethod
+    def from_class(cls, plugin_class: Type[ImageHostPlugin], source_file: Path) -> 'PluginMetadata':
+        """
+        Build metadata from a plugin class's attributes.
+
+        Args:
+            plugin_class: Plugin class to describe
+            source_file: File the class was loaded from
+
+        Returns:
+            PluginMetadata for the class
+        """
+        return cls(
+            name=plugin_class.name,
+            version=plugin_class.version,
+            author=plugin_class.author,
+            description=plugin_class.description,
+            service_url=plugin_class.service_url,
+            supports_galleries=plugin_class.supports_galleries,
+            supports_private=plugin_class.supports_private,
+            requires_authentication=plugin_class.requires_authentication,
+            max_file_size_mb=plugin_class.max_file_size_mb,
+            allowed_formats=tuple(plugin_class.allowed_formats or ()),
+            max_concurrent_uploads=plugin_class.max_concurrent_uploads,
+            source_file=str(source_file),
+        )
+
+    def to_dict(self) -> Dict:
+        """Return the metadata as a plain dictionary."""
+        return {
+            'name': self.name,
+            'version': self.version,
+            'author': self.author,
+            'description': self.description,
+            'service_url': self.service_url,
+            'supports_galleries': self.supports_galleries,
+            'supports_private': self.supports_private,
+            'requires_authentication': self.requires_authentication,
+            'max_file_size_mb': self.max_file_size_mb,
+            'allowed_formats': list(self.allowed_formats),
+            'max_concurrent_uploads': self.max_concurrent_uploads,
+            'source_file': self.source_file,
+        }
+
+
+# Loaded plugin classes by (path, mtime_ns, size), shared by all managers so
+# unchanged plugin files are only executed once per process
+_PLUGIN_CACHE: Dict[Tuple[str, int, int], Type[ImageHostPlugin]] = {}
+
+
 class PluginManager:
     """
     Manages plugin discovery, loading, and lifecycle.
 
     The PluginManager scans the plugins directory for Python files ending in
-    '_plugin.py' and automatically loads classes that inherit from ImageHostPlugin.
+    '_plugin.py' and loads classes that inherit from ImageHostPlugin. Files are
+    only executed when a plugin is first requested (or all at once with
+    auto_load=True / load_all_plugins()).
 
     Example:
         plugin_dir = Path('plugins')
@@ -39,58 +113,122 @@ class PluginManager:
         plugin_instance = ImgurPlugin(credentials={'client_id': '...'})
     """
 
-    def __init__(self, plugin_dir: Path, auto_load: bool = True):
+    def __init__(self, plugin_dir: Path, auto_load: bool = False):
         """
         Initialize plugin manager.
 
         Args:
             plugin_dir: Directory containing plugin files
-            auto_load: If True, automatically load plugins on initialization
+            auto_load: If True, load every plugin now; otherwise plugin files
+                are only discovered and load on first use
         """
         self.plugin_dir = Path(plugin_dir)
         self.plugins: Dict[str, Type[ImageHostPlugin]] = {}
-        self._plugin_metadata: Dict[str, Dict] = {}
+        self._plugin_metadata: Dict[str, PluginMetadata] = {}
+        # list_plugins() result, rebuilt after plugins are (un)registered
+        self._plugin_list: Optional[List[Dict]] = None
+        # Discovered but not yet executed plugin files, by lower-cased stem
+        # without the '_plugin' suffix (e.g. 'imgur' -> imgur_plugin.py)
+        self._pending: Dict[str, Path] = {}
+        # Capability indices: names of plugins with each flag set
+        self._idx_galleries: Set[str] = set()
+        self._idx_private: Set[str] = set()
+        self._idx_auth: Set[str] = set()
 
         if auto_load:
             self.load_all_plugins()
+        else:
+            self.discover_plugins()
 
-    def load_all_plugins(self):
+    def discover_plugins(self) -> int:
         """
-        Discover and load all plugins from the plugin directory.
+        Find plugin files in the plugin directory without loading them.
 
-        Scans for files matching '*_plugin.py' and loads any ImageHostPlugin
-        subclasses found within them.
+        Returns:
+            Number of plugin files waiting to be loaded
         """
         if not self.plugin_dir.exists():
             logger.warning(f"Plugin directory not found: {self.plugin_dir}")
             self.plugin_dir.mkdir(parents=True, exist_ok=True)
             logger.info(f"Created plugin directory: {self.plugin_dir}")
-            return
+            return 0
 
         if not self.plugin_dir.is_dir():
             logger.error(f"Plugin path is not a directory: {self.plugin_dir}")
+            return 0
+
+        loaded_files = {meta.source_file for meta in self._plugin_metadata.values()}
+        for plugin_file in self.plugin_dir.glob('*_plugin.py'):
+            if str(plugin_file) not in loaded_files:
+                self._pending[plugin_file.stem[:-len('_plugin')].lower()] = plugin_file
+
+        logger.info(f"Found {len(self._pending)} plugin files in {self.plugin_dir}")
+        return len(self._pending)
+
+    def load_all_plugins(self):
+        """
+        Discover and load all plugins from the plugin directory.
+
+        Scans for files matching '*_plugin.py' and loads any ImageHostPlugin
+        subclasses found within them.
+        """
+        self.discover_plugins()
+        self._load_pending()
+
+    def _load_pending(self):
+        """Load every discovered plugin file that has not been loaded yet."""
+        if not self._pending:
             return
 
-        plugin_files = list(self.plugin_dir.glob('*_plugin.py'))
-        logger.info(f"Scanning for plugins in {self.plugin_dir}...")
-        logger.info(f"Found {len(plugin_files)} potential plugin files")
+        plugin_files = list(self._pending.values())
+        self._pending.clear()
 
-        loaded_count = 0
-        for plugin_file in plugin_files:
-            try:
-                plugin_class = self._load_plugin_file(plugin_file)
-                if plugin_class:
-                    self._register_plugin(plugin_class, plugin_file)
-                    loaded_count += 1
-                    logger.info(
-                        f"✓ Loaded plugin: {plugin_class.name} v{plugin_class.version} "
-                        f"by {plugin_class.author or 'Unknown'}"
-                    )
-            except Exception as e:
-                logger.error(f"✗ Failed to load plugin from {plugin_file.name}: {e}")
+        if len(plugin_files) > 2:
+            # Overlap the stat/read/bytecode lookups of independent files;
+            # registration stays on this thread and in discovery order
+            with ThreadPoolExecutor(max_workers=min(8, len(plugin_files))) as executor:
+                plugin_classes = list(executor.map(self._try_load_plugin_file, plugin_files))
+        else:
+            plugin_classes = [self._try_load_plugin_file(f) for f in plugin_files]
 
+        loaded_count = 0
+        for plugin_class, plugin_file in zip(plugin_classes, plugin_files):
+            if plugin_class is not None:
+                self._register_loaded(plugin_class, plugin_file)
+                loaded_count += 1
         logger.info(f"Successfully loaded {loaded_count}/{len(plugin_files)} plugins")
 
+    def _load_and_register(self, plugin_file: Path) -> Optional[Type[ImageHostPlugin]]:
+        """
+        Load and register the plugin in one file, logging any failure.
+
+        Args:
+            plugin_file: Path to plugin Python file
+
+        Returns:
+            Plugin class if loaded, None otherwise
+        """
+        plugin_class = self._try_load_plugin_file(plugin_file)
+        if plugin_class is not None:
+            self._register_loaded(plugin_class, plugin_file)
+        return plugin_class
+
+    def _try_load_plugin_file(self, plugin_file: Path) -> Optional[Type[ImageHostPlugin]]:
+        """Load a plugin class from a file, logging failures instead of raising."""
+        try:
+            return self._load_plugin_file(plugin_file)
+        except Exception as e:
+            logger.error(f"✗ Failed to load plugin from {plugin_file.name}: {e}")
+            return None
+
+    def _register_loaded(self, plugin_class: Type[ImageHostPlugin], plugin_file: Path):
+        """Register a freshly loaded plugin class and log it."""
+        self._register_plugin(plugin_class, plugin_file)
+        logger.info(
+            f"✓ Loaded plugin: {plugin_class.name} v{plugin_class.version} "
+            f"by {plugin_class.author or 'Unknown'}"
+        )
+
     def _load_plugin_file(self, plugin_file: Path) -> Optional[Type[ImageHostPlugin]]:
         """
         Load a plugin class from a Python file.
@@ -107,13 +245,25 @@ class PluginManager:
         module_name = f"plugin_{plugin_file.stem}"
 
         try:
+            st = plugin_file.stat()
+            cache_key = (str(plugin_file), st.st_mtime_ns, st.st_size)
+            cached = _PLUGIN_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
             # Load module from file
             spec = importlib.util.spec_from_file_location(module_name, plugin_file)
             if spec is None or spec.loader is None:
                 raise PluginLoadError(f"Cannot load module spec from {plugin_file}")
 
             module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            # Registered before executing, as dataclasses and pickle expect
+            sys.modules[module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                sys.modules.pop(module_name, None)
+                raise
 
             # Find ImageHostPlugin subclass
             plugin_class = self._find_plugin_class(module)
@@ -127,11 +277,17 @@ class PluginManager:
             # Validate plugin class
             self._validate_plugin_class(plugin_class, plugin_file)
 
+            _PLUGIN_CACHE[cache_key] = plugin_class
             return plugin_class
 
         except Exception as e:
             raise PluginLoadError(f"Error loading {plugin_file.name}: {e}") from e
 
+    @staticmethod
+    def clear_cache():
+        """Forget previously loaded plugin files so they are executed again."""
+        _PLUGIN_CACHE.clear()
+
     def _find_plugin_class(self, module) -> Optional[Type[ImageHostPlugin]]:
         """
         Find ImageHostPlugin subclass in a module.
@@ -142,11 +298,14 @@ class PluginManager:
         Returns:
             Plugin class if found, None otherwise
         """
-        for name, obj in inspect.getmembers(module, inspect.isclass):
+        module_name = module.__name__
+        # Plain dict scan; cheapest checks first
+        for obj in vars(module).values():
             # Check if it's a subclass of ImageHostPlugin (but not the base class itself)
-            if (issubclass(obj, ImageHostPlugin) and
+            if (isinstance(obj, type) and
                 obj is not ImageHostPlugin and
-                obj.__module__ == module.__name__):
+                issubclass(obj, ImageHostPlugin) and
+                obj.__module__ == module_name):
                 return obj
 
         return None
@@ -208,21 +367,22 @@ class PluginManager:
         self.plugins[plugin_name] = plugin_class
 
         # Store metadata
-        self._plugin_metadata[plugin_name] = {
-            'class': plugin_class,
-            'source_file': str(source_file),
-            'name': plugin_class.name,
-            'version': plugin_class.version,
-            'author': plugin_class.author,
-            'description': plugin_class.description,
-            'service_url': plugin_class.service_url,
-            'supports_galleries': plugin_class.supports_galleries,
-            'supports_private': plugin_class.supports_private,
-            'requires_authentication': plugin_class.requires_authentication,
-            'max_file_size_mb': plugin_class.max_file_size_mb,
-            'allowed_formats': plugin_class.allowed_formats or [],
-            'max_concurrent_uploads': plugin_class.max_concurrent_uploads
-        }
+        self._plugin_metadata[plugin_name] = PluginMetadata.from_class(plugin_class, source_file)
+        self._plugin_list = None
+
+        self._discard_from_indices(plugin_name)
+        if plugin_class.supports_galleries:
+            self._idx_galleries.add(plugin_name)
+        if plugin_class.supports_private:
+            self._idx_private.add(plugin_name)
+        if plugin_class.requires_authentication:
+            self._idx_auth.add(plugin_name)
+
+    def _discard_from_indices(self, plugin_name: str):
+        """Remove a plugin from the capability indices."""
+        self._idx_galleries.discard(plugin_name)
+        self._idx_private.discard(plugin_name)
+        self._idx_auth.discard(plugin_name)
 
     def get_plugin(self, plugin_name: str) -> Optional[Type[ImageHostPlugin]]:
         """
@@ -239,6 +399,19 @@ class PluginManager:
             if ImgurPlugin:
                 instance = ImgurPlugin(credentials={'client_id': '...'})
         """
+        plugin_class = self.plugins.get(plugin_name)
+        if plugin_class is not None or not self._pending:
+            return plugin_class
+
+        # Try the file named after the plugin first
+        plugin_file = self._pending.pop(plugin_name.lower(), None)
+        if plugin_file is not None:
+            self._load_and_register(plugin_file)
+            if plugin_name in self.plugins:
+                return self.plugins[plugin_name]
+
+        # Plugin names need not match file names, so fall back to loading all
+        self._load_pending()
         return self.plugins.get(plugin_name)
 
     def has_plugin(self, plugin_name: str) -> bool:
@@ -249,36 +422,26 @@ class PluginManager:
             plugin_name: Name of the plugin
 
         Returns:
-            True if plugin is loaded, False otherwise
+            True if plugin is available, False otherwise
         """
-        return plugin_name in self.plugins
+        return self.get_plugin(plugin_name) is not None
 
     def list_plugins(self) -> List[Dict]:
         """
         List all loaded plugins with metadata.
 
         Returns:
-            List of plugin metadata dictionaries
+            List of plugin metadata dictionaries (shared between calls, so
+            treat them as read-only)
 
         Example:
             for plugin in manager.list_plugins():
                 print(f"{plugin['name']} - {plugin['description']}")
         """
-        return [
-            {
-                'name': meta['name'],
-                'version': meta['version'],
-                'author': meta['author'],
-                'description': meta['description'],
-                'service_url': meta['service_url'],
-                'supports_galleries': meta['supports_galleries'],
-                'supports_private': meta['supports_private'],
-                'requires_authentication': meta['requires_authentication'],
-                'max_file_size_mb': meta['max_file_size_mb'],
-                'max_concurrent_uploads': meta['max_concurrent_uploads']
-            }
-            for meta in self._plugin_metadata.values()
-        ]
+        self._load_pending()
+        if self._plugin_list is None:
+            self._plugin_list = [meta.to_dict() for meta in self._plugin_metadata.values()]
+        return list(self._plugin_list)
 
     def get_plugin_names(self) -> List[str]:
         """
@@ -291,6 +454,7 @@ class PluginManager:
             names = manager.get_plugin_names()
             # ['Imgur', 'Catbox', 'CustomService']
         """
+        self._load_pending()
         return list(self.plugins.keys())
 
     def get_plugin_metadata(self, plugin_name: str) -> Optional[Dict]:
@@ -303,6 +467,21 @@ class PluginManager:
         Returns:
             Plugin metadata dictionary if found, None otherwise
         """
+        metadata = self.get_plugin_info(plugin_name)
+        return metadata.to_dict() if metadata is not None else None
+
+    def get_plugin_info(self, plugin_name: str) -> Optional[PluginMetadata]:
+        """
+        Get the metadata record for a specific plugin.
+
+        Args:
+            plugin_name: Name of the plugin
+
+        Returns:
+            PluginMetadata if found, None otherwise
+        """
+        if plugin_name not in self._plugin_metadata:
+            self.get_plugin(plugin_name)
         return self._plugin_metadata.get(plugin_name)
 
     def reload_plugin(self, plugin_name: str) -> bool:
@@ -324,7 +503,7 @@ class PluginManager:
             logger.warning(f"Cannot reload unknown plugin: {plugin_name}")
             return False
 
-        source_file = Path(metadata['source_file'])
+        source_file = Path(metadata.source_file)
         if not source_file.exists():
             logger.error(f"Plugin source file not found: {source_file}")
             return False
@@ -358,11 +537,19 @@ class PluginManager:
 
         if plugin_name in self._plugin_metadata:
             del self._plugin_metadata[plugin_name]
+            self._plugin_list = None
+
+        self._discard_from_indices(plugin_name)
 
     def unload_all_plugins(self):
         """Unload all plugins."""
         self.plugins.clear()
         self._plugin_metadata.clear()
+        self._plugin_list = None
+        self._pending.clear()
+        self._idx_galleries.clear()
+        self._idx_private.clear()
+        self._idx_auth.clear()
 
     def get_plugins_by_capability(
         self,
@@ -387,35 +574,31 @@ class PluginManager:
                 supports_galleries=True
             )
         """
-        results = []
-
-        for plugin_name, meta in self._plugin_metadata.items():
-            matches = True
-
-            if supports_galleries is not None:
-                if meta['supports_galleries'] != supports_galleries:
-                    matches = False
-
-            if supports_private is not None:
-                if meta['supports_private'] != supports_private:
-                    matches = False
-
-            if requires_authentication is not None:
-                if meta['requires_authentication'] != requires_authentication:
-                    matches = False
-
-            if matches:
-                results.append(plugin_name)
-
-        return results
+        self._load_pending()
+        candidates = set(self.plugins)
+
+        for wanted, index in ((supports_galleries, self._idx_galleries),
+                              (supports_private, self._idx_private),
+                              (requires_authentication, self._idx_auth)):
+            if wanted is None:
+                continue
+            if wanted:
+                candidates &= index
+            else:
+                candidates -= index
+
+        # Keep registration order
+        return [name for name in self.plugins if name in candidates]
 
     def __len__(self):
-        """Return number of loaded plugins."""
+        """Return number of available plugins."""
+        self._load_pending()
         return len(self.plugins)
 
     def __contains__(self, plugin_name: str):
-        """Check if plugin is loaded."""
-        return plugin_name in self.plugins
+        """Check if plugin is available."""
+        return self.has_plugin(plugin_name)
 
     def __repr__(self):
-        return f"<PluginManager: {len(self.plugins)} plugins loaded>"
+        return (f"<PluginManager: {len(self.plugins)} plugins loaded, "
+                f"{len(self._pending)} pending>")
@@ -2,7 +2,12 @@
 """
 Retry utilities for handling transient network failures.
 """
+import asyncio
+import random
+import re
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Callable, Optional, Type, Tuple
 from functools import wraps
 from loguru import logger
@@ -15,17 +20,38 @@ class RetryConfig:
                  max_attempts: int = 3,
                  base_delay: float = 1.0,
                  max_delay: float = 30.0,
-                 exponential_base: float = 2.0):
+                 exponential_base: float = 2.0,
+                 jitter: bool = False):
         self.max_attempts = max_attempts
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.exponential_base = exponential_base
+        self.jitter = jitter
+        # Backoff per attempt is fixed by the config, so compute it once
+        self._delays = tuple(
+            self._backoff(attempt) for attempt in range(1, max_attempts + 1)
+        )
 
-    def get_delay(self, attempt: int) -> float:
-        """Calculate delay for given attempt number using exponential backoff"""
+    def _backoff(self, attempt: int) -> float:
         delay = self.base_delay * (self.exponential_base ** (attempt - 1))
         return min(delay, self.max_delay)
 
+    def get_delay(self, attempt: int) -> float:
+        """
+        Calculate delay for given attempt number using exponential backoff.
+
+        With jitter enabled the delay is scaled by a random factor in
+        [0.5, 1.5) so clients backing off from the same host don't retry
+        in lockstep.
+        """
+        if 1 <= attempt <= len(self._delays):
+            delay = self._delays[attempt - 1]
+        else:
+            delay = self._backoff(attempt)
+        if self.jitter:
+            delay = min(delay * random.uniform(0.5, 1.5), self.max_delay)
+        return delay
+
 
 # Network errors that should be retried
 RETRYABLE_EXCEPTIONS = (
@@ -41,13 +67,24 @@ RETRYABLE_EXCEPTIONS = (
 )
 
 # HTTP status codes that should be retried
-RETRYABLE_STATUS_CODES = (
+RETRYABLE_STATUS_CODES = frozenset({
     408,  # Request Timeout
     429,  # Too Many Requests
     500,  # Internal Server Error
     502,  # Bad Gateway
     503,  # Service Unavailable
     504,  # Gateway Timeout
+})
+
+# Message keywords for errors without a more specific type
+_RETRYABLE_RE = re.compile(
+    r"timeout|connection|network|temporary|unavailable|refused|reset",
+    re.IGNORECASE,
+)
+_NON_RETRYABLE_RE = re.compile(
+    r"not found|permission denied|unauthorized|forbidden"
+    r"|invalid credentials|authentication failed",
+    re.IGNORECASE,
 )
 
 
@@ -70,17 +107,38 @@ def is_retryable_error(error: Exception) -> bool:
         return error.response.status_code in RETRYABLE_STATUS_CODES
 
     # Check error message for network-related keywords
-    error_msg = str(error).lower()
-    retryable_keywords = [
-        'timeout',
-        'connection',
-        'network',
-        'temporary',
-        'unavailable',
-        'refused',
-        'reset'
-    ]
-    return any(keyword in error_msg for keyword in retryable_keywords)
+    return _RETRYABLE_RE.search(str(error)) is not None
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """
+    Get the server-requested retry delay from an HTTP error.
+
+    Args:
+        error: The exception that occurred
+
+    Returns:
+        Delay in seconds from the Retry-After header, or None if absent
+    """
+    response = getattr(error, 'response', None)
+    if response is None:
+        return None
+
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+
+    # Either delay-seconds or an HTTP-date
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
 
 
 def is_non_retryable_error(error: Exception) -> bool:
@@ -93,28 +151,160 @@ def is_non_retryable_error(error: Exception) -> bool:
     Returns:
         True if the error is permanent (authentication, file not found, etc.)
     """
-    # Authentication errors - don't retry
+    # Decide by type/status first; str() of an httpx error can be large
     if isinstance(error, httpx.HTTPStatusError):
-        if error.response.status_code in (401, 403):
+        status = error.response.status_code
+        if status in RETRYABLE_STATUS_CODES:
+            return False
+        # Auth and other client errors (4xx) - don't retry
+        if 400 <= status < 500:
             return True
+    elif isinstance(error, RETRYABLE_EXCEPTIONS):
+        return False
+
+    # File/path errors - don't retry
+    return _NON_RETRYABLE_RE.search(str(error)) is not None
+
 
-    # Client errors (4xx except retryable ones) - don't retry
+def classify_error(error: Exception) -> str:
+    """
+    Classify an error for the retry loop in a single pass.
+
+    Args:
+        error: The exception that occurred
+
+    Returns:
+        'retry' for transient errors, 'permanent' for errors that will not
+        go away on retry, 'unknown' for anything else
+    """
     if isinstance(error, httpx.HTTPStatusError):
         status = error.response.status_code
-        if 400 <= status < 500 and status not in RETRYABLE_STATUS_CODES:
-            return True
+        if status in RETRYABLE_STATUS_CODES:
+            return 'retry'
+        if 400 <= status < 500:
+            return 'permanent'
+        # Other statuses are never retried; only the message can make them permanent
+        if _NON_RETRYABLE_RE.search(str(error)):
+            return 'permanent'
+        return 'unknown'
+    if isinstance(error, RETRYABLE_EXCEPTIONS):
+        return 'retry'
 
-    # File/path errors - don't retry
-    error_msg = str(error).lower()
-    non_retryable_keywords = [
-        'not found',
-        'permission denied',
-        'unauthorized',
-        'forbidden',
-        'invalid credentials',
-        'authentication failed'
-    ]
-    return any(keyword in error_msg for keyword in non_retryable_keywords)
+    # Untyped errors: stringify once and check both keyword sets
+    error_msg = str(error)
+    if _NON_RETRYABLE_RE.search(error_msg):
+        return 'permanent'
+    if _RETRYABLE_RE.search(error_msg):
+        return 'retry'
+    return 'unknown'
+
+
+# Errors httpx.HTTPTransport(retries=N) already retries at the pool level
+_TRANSPORT_RETRIED = (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+def _next_delay(config: RetryConfig, name: str, error: Exception, attempt: int,
+                no_retry: Tuple[Type[BaseException], ...] = ()) -> Optional[float]:
+    """
+    Decide how to proceed after a failed attempt.
+
+    Args:
+        config: Retry settings
+        name: Label used in log messages
+        error: The exception raised by the attempt
+        attempt: 1-based number of the attempt that failed
+        no_retry: Exception types to re-raise without another attempt
+
+    Returns:
+        Seconds to wait before the next attempt, or None if none are left
+
+    Raises:
+        Exception: error itself, if it should not be retried
+    """
+    # Already retried further down the stack
+    if isinstance(error, no_retry):
+        logger.warning(f"{name}: Failed after transport retries: {error}")
+        raise error
+
+    kind = classify_error(error)
+
+    # Don't retry if it's a permanent error
+    if kind == 'permanent':
+        logger.warning(f"{name}: Non-retryable error: {error}")
+        raise error
+
+    # Don't retry if it's not a network error
+    if kind != 'retry':
+        logger.warning(f"{name}: Not a retryable error: {error}")
+        raise error
+
+    # Calculate delay and retry
+    if attempt < config.max_attempts:
+        delay = config.get_delay(attempt)
+        logger.info(
+            f"{name}: Attempt {attempt}/{config.max_attempts} failed: {error}. "
+            f"Retrying in {delay:.1f}s..."
+        )
+        return delay
+
+    logger.error(
+        f"{name}: All {config.max_attempts} attempts failed. "
+        f"Last error: {error}"
+    )
+    return None
+
+
+def _call_with_retry(config: RetryConfig, name: str, func: Callable, args: tuple, kwargs: dict,
+                     no_retry: Tuple[Type[BaseException], ...] = ()):
+    """
+    Run func(*args, **kwargs), retrying network errors per config.
+
+    Args:
+        config: Retry settings
+        name: Label used in log messages
+        func: Callable to invoke
+        args: Positional arguments for func
+        kwargs: Keyword arguments for func
+        no_retry: Exception types to re-raise without another attempt
+
+    Returns:
+        Whatever func returns on the first successful attempt
+    """
+    last_exception = None
+
+    for attempt in range(1, config.max_attempts + 1):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            last_exception = e
+            delay = _next_delay(config, name, e, attempt, no_retry)
+            if delay is not None:
+                time.sleep(delay)
+
+    # If we get here, all attempts failed
+    raise last_exception
+
+
+async def _call_with_retry_async(config: RetryConfig, name: str, func: Callable, args: tuple,
+                                 kwargs: dict, no_retry: Tuple[Type[BaseException], ...] = ()):
+    """
+    Async counterpart of _call_with_retry(); func must return an awaitable.
+
+    Waits between attempts with asyncio.sleep() so the event loop stays free.
+    """
+    last_exception = None
+
+    for attempt in range(1, config.max_attempts + 1):
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            last_exception = e
+            delay = _next_delay(config, name, e, attempt, no_retry)
+            if delay is not None:
+                await asyncio.sleep(delay)
+
+    # If we get here, all attempts failed
+    raise last_exception
 
 
 def retry_on_network_error(config: Optional[RetryConfig] = None):
@@ -136,54 +326,100 @@ def retry_on_network_error(config: Optional[RetryConfig] = None):
     def decorator(func: Callable):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-
-            for attempt in range(1, config.max_attempts + 1):
-                try:
-                    return func(*args, **kwargs)
-
-                except Exception as e:
-                    last_exception = e
-
-                    # Don't retry if it's a permanent error
-                    if is_non_retryable_error(e):
-                        logger.warning(f"{func.__name__}: Non-retryable error: {e}")
-                        raise
-
-                    # Don't retry if it's not a network error
-                    if not is_retryable_error(e):
-                        logger.warning(f"{func.__name__}: Not a retryable error: {e}")
-                        raise
-
-                    # Calculate delay and retry
-                    if attempt < config.max_attempts:
-                        delay = config.get_delay(attempt)
-                        logger.info(
-                            f"{func.__name__}: Attempt {attempt}/{config.max_attempts} failed: {e}. "
-                            f"Retrying in {delay:.1f}s..."
-                        )
-                        time.sleep(delay)
-                    else:
-                        logger.error(
-                            f"{func.__name__}: All {config.max_attempts} attempts failed. "
-                            f"Last error: {e}"
-                        )
-
-            # If we get here, all attempts failed
-            raise last_exception
+            return _call_with_retry(config, func.__name__, func, args, kwargs)
 
         return wrapper
     return decorator
 
 
+def retry_on_network_error_async(config: Optional[RetryConfig] = None):
+    """
+    Decorator to retry a coroutine function on network errors.
+
+    Same policy as retry_on_network_error(), but backs off with
+    asyncio.sleep() instead of blocking a thread.
+
+    Args:
+        config: RetryConfig instance, or None to use defaults
+
+    Example:
+        @retry_on_network_error_async(RetryConfig(max_attempts=5))
+        async def upload_file(client, file_path):
+            # Upload logic that might fail
+            pass
+    """
+    if config is None:
+        config = RetryConfig()
+
+    def decorator(func: Callable):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await _call_with_retry_async(config, func.__name__, func, args, kwargs)
+
+        return wrapper
+    return decorator
+
+
+# httpx.Client options that only take effect on the transport it builds itself;
+# they are ignored when transport= is passed, so create() forwards them
+_TRANSPORT_OPTIONS = ('verify', 'cert', 'http1', 'http2', 'limits', 'trust_env')
+
+
+def _split_transport_kwargs(client_kwargs: dict) -> Tuple[dict, dict]:
+    """
+    Split httpx client arguments into transport and client arguments.
+
+    Args:
+        client_kwargs: Arguments meant for httpx.Client()/AsyncClient()
+
+    Returns:
+        (transport kwargs, remaining client kwargs); trust_env goes to both,
+        since the client also uses it for proxy and netrc lookup
+    """
+    transport_kwargs = {k: client_kwargs[k] for k in _TRANSPORT_OPTIONS if k in client_kwargs}
+    rest = {k: v for k, v in client_kwargs.items() if k not in transport_kwargs or k == 'trust_env'}
+    return transport_kwargs, rest
+
+
 class RetryableHTTPClient:
     """
     Wrapper around httpx.Client that automatically retries network errors.
     """
 
-    def __init__(self, client: httpx.Client, config: Optional[RetryConfig] = None):
+    def __init__(self, client: httpx.Client, config: Optional[RetryConfig] = None,
+                 transport_retries: bool = False):
+        """
+        Args:
+            client: Client to send requests with
+            config: RetryConfig instance, or None to use defaults
+            transport_retries: True if the client's transport already
+                retries connection errors (see create())
+        """
         self.client = client
         self.config = config or RetryConfig()
+        self._no_retry = _TRANSPORT_RETRIED if transport_retries else ()
+
+    @classmethod
+    def create(cls, config: Optional[RetryConfig] = None, **client_kwargs) -> 'RetryableHTTPClient':
+        """
+        Build a client whose transport retries connection errors itself.
+
+        Connect failures are retried inside httpx's connection pool; the
+        Python-level loop only handles the remaining retryable errors.
+
+        Args:
+            config: RetryConfig instance, or None to use defaults
+            **client_kwargs: Additional arguments for httpx.Client(); transport
+                options such as http2, verify and limits are applied to the
+                retrying transport
+
+        Returns:
+            RetryableHTTPClient wrapping the new httpx.Client
+        """
+        config = config or RetryConfig()
+        transport_kwargs, client_kwargs = _split_transport_kwargs(client_kwargs)
+        transport = httpx.HTTPTransport(retries=max(0, config.max_attempts - 1), **transport_kwargs)
+        return cls(httpx.Client(transport=transport, **client_kwargs), config, transport_retries=True)
 
     def request(self, method: str, url: str, **kwargs) -> httpx.Response:
         """
@@ -200,11 +436,10 @@ class RetryableHTTPClient:
         Raises:
             Exception: If all retry attempts fail
         """
-        @retry_on_network_error(self.config)
-        def _make_request():
-            return self.client.request(method, url, **kwargs)
-
-        return _make_request()
+        return _call_with_retry(
+            self.config, f"{method} request", self.client.request, (method, url), kwargs,
+            no_retry=self._no_retry,
+        )
 
     def get(self, url: str, **kwargs) -> httpx.Response:
         """GET request with retry"""
@@ -231,3 +466,90 @@ class RetryableHTTPClient:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+
+class AsyncRetryableHTTPClient:
+    """
+    Wrapper around httpx.AsyncClient that automatically retries network errors.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, config: Optional[RetryConfig] = None,
+                 transport_retries: bool = False):
+        """
+        Args:
+            client: Async client to send requests with
+            config: RetryConfig instance, or None to use defaults
+            transport_retries: True if the client's transport already
+                retries connection errors (see create())
+        """
+        self.client = client
+        self.config = config or RetryConfig()
+        # Connect errors are retried by the transport when it was built with retries
+        self._no_retry = _TRANSPORT_RETRIED if transport_retries else ()
+
+    @classmethod
+    def create(cls, config: Optional[RetryConfig] = None, **client_kwargs) -> 'AsyncRetryableHTTPClient':
+        """
+        Build an async client whose transport retries connection errors itself.
+
+        Args:
+            config: RetryConfig instance, or None to use defaults
+            **client_kwargs: Additional arguments for httpx.AsyncClient();
+                transport options such as http2, verify and limits are
+                applied to the retrying transport
+
+        Returns:
+            AsyncRetryableHTTPClient wrapping the new httpx.AsyncClient
+        """
+        config = config or RetryConfig()
+        transport_kwargs, client_kwargs = _split_transport_kwargs(client_kwargs)
+        transport = httpx.AsyncHTTPTransport(retries=max(0, config.max_attempts - 1),
+                                             **transport_kwargs)
+        return cls(httpx.AsyncClient(transport=transport, **client_kwargs), config,
+                   transport_retries=True)
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Make an HTTP request with automatic retry on network errors.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Request URL
+            **kwargs: Additional arguments to pass to httpx.AsyncClient.request()
+
+        Returns:
+            httpx.Response object
+
+        Raises:
+            Exception: If all retry attempts fail
+        """
+        return await _call_with_retry_async(
+            self.config, f"{method} request", self.client.request, (method, url), kwargs,
+            no_retry=self._no_retry,
+        )
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """GET request with retry"""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        """POST request with retry"""
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> httpx.Response:
+        """PUT request with retry"""
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> httpx.Response:
+        """DELETE request with retry"""
+        return await self.request("DELETE", url, **kwargs)
+
+    async def aclose(self):
+        """Close the underlying HTTP client"""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
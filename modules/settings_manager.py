@@ -1,8 +1,8 @@
 # settings_manager.py
-import json
-import os
+from pathlib import Path
 from loguru import logger
 from . import config
+from . import _json_io
 
 class SettingsManager:
     def __init__(self):
@@ -29,21 +29,25 @@ class SettingsManager:
             "output_format": "BBCode",
             "auto_copy": False
         }
+        self._last_serialized = None  # payload of the last successful save
 
     def load(self):
-        if not os.path.exists(self.filepath):
-            return self.defaults
+        # Just try the read; a missing file is the rare case
         try:
-            with open(self.filepath, 'r') as f:
-                data = json.load(f)
-                # Merge loaded data with defaults to ensure new keys exist
-                return {**self.defaults, **data}
-        except Exception:
+            data = _json_io.loads(Path(self.filepath).read_bytes())
+        except (OSError, ValueError):
+            return self.defaults
+        if not isinstance(data, dict):
             return self.defaults
+        # Merge loaded data with defaults to ensure new keys exist
+        return {**self.defaults, **data}
 
     def save(self, data):
         try:
-            with open(self.filepath, 'w') as f:
-                json.dump(data, f, indent=4)
+            payload = _json_io.dumps(data)
+            if payload == self._last_serialized:
+                return
+            _json_io.write_atomic(self.filepath, payload)
+            self._last_serialized = payload
         except Exception as e:
             logger.error(f"Failed to save settings: {e}")
\ No newline at end of file
@@ -1,6 +1,6 @@
 # modules/template_manager.py
+import functools
 import re
-import json
 import os
 import customtkinter as ctk
 import tkinter as tk
@@ -12,12 +12,130 @@ from loguru import logger
 
 # Local imports
 from . import config
+from . import _json_io
 from .widgets import MouseWheelComboBox
 
 # ==========================================
 # PART 1: THE LOGIC (TemplateManager)
 # ==========================================
 
+# Conditional tags: a well-formed [if key] / [if key=value] opener, a [/if]
+# closer, or any other "[if" text (which keeps enclosing blocks from matching)
+_COND_TAG_RE = re.compile(r'\[if\s+(\w+)(?:=([^\]]+))?\]|\[/if\]|\[if', re.IGNORECASE)
+
+
+def _make_cond_node(key, expected, children):
+    """Build an [if] node, splitting its children at the first [else]."""
+    for i, part in enumerate(children):
+        if not isinstance(part, str):
+            continue
+        before, sep, after = part.partition('[else]')
+        if sep:
+            return (key, expected, tuple(children[:i]) + (before,), (after,) + tuple(children[i + 1:]))
+    return (key, expected, tuple(children), ())
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_conditionals(template):
+    """
+    Parse a template into literal strings and (key, expected, true, false) nodes.
+
+    Blocks nest; innermost blocks bind first, unclosed or malformed blocks stay
+    literal text. Cached per template string since templates rarely change.
+    """
+    root = []
+    stack = []  # open blocks: [opener text, key, expected, children, poisoned]
+    out = root
+    pos = 0
+    for match in _COND_TAG_RE.finditer(template):
+        if match.start() > pos:
+            out.append(template[pos:match.start()])
+        pos = match.end()
+        tag = match.group(0)
+
+        if match.group(1) is not None:
+            frame = [tag, match.group(1), match.group(2), [], False]
+            stack.append(frame)
+            out = frame[3]
+        elif tag[1] == '/':
+            if not stack:
+                out.append(tag)
+                continue
+            opener, key, expected, children, poisoned = stack.pop()
+            out = stack[-1][3] if stack else root
+            if poisoned:
+                out.append(opener)
+                out.extend(children)
+                out.append(tag)
+            else:
+                out.append(_make_cond_node(key, expected, children))
+        else:
+            # Stray "[if": no enclosing block can match any more
+            for frame in stack:
+                frame[4] = True
+            out.append(tag)
+
+    if pos < len(template):
+        out.append(template[pos:])
+
+    # Unclosed blocks stay as literal text
+    while stack:
+        opener, _key, _expected, children, _poisoned = stack.pop()
+        out = stack[-1][3] if stack else root
+        out.append(opener)
+        out.extend(children)
+
+    return tuple(root)
+
+
+# #key# placeholders (names must not start with a digit, see _to_format_string)
+_PLACEHOLDER_RE = re.compile(r'#([^\W\d]\w*)#')
+
+
+@functools.lru_cache(maxsize=64)
+def _to_format_string(text, keys):
+    """
+    Turn #key# placeholders for the given keys into str.format fields.
+
+    Literal braces are escaped and other #word# text is left alone, so the
+    result renders like replacing each #key# in turn.
+    """
+    escaped = text.replace('{', '{{').replace('}', '}}')
+    parts = []
+    pos = 0
+    match = _PLACEHOLDER_RE.search(escaped)
+    while match:
+        if match.group(1) in keys:
+            parts.append(escaped[pos:match.start()])
+            parts.append('{' + match.group(1) + '}')
+            pos = match.end()
+            match = _PLACEHOLDER_RE.search(escaped, pos)
+        else:
+            # The closing '#' may open the next placeholder
+            match = _PLACEHOLDER_RE.search(escaped, match.end() - 1)
+    parts.append(escaped[pos:])
+    return ''.join(parts)
+
+
+_IMAGE_KEYS = frozenset({'image_url', 'thumb_url'})
+
+
+def _render_conditionals(tokens, data, out):
+    """Append the rendered tokens to out, choosing branches from data."""
+    for token in tokens:
+        if token.__class__ is str:
+            out.append(token)
+            continue
+
+        key, expected, true_part, false_part = token
+        actual_val = str(data.get(key, '')).strip()
+        if expected is not None:
+            condition_met = (actual_val == expected.strip())
+        else:
+            condition_met = bool(actual_val)
+        _render_conditionals(true_part if condition_met else false_part, data, out)
+
+
 class TemplateManager:
     def __init__(self):
         # 1. Standard Defaults
@@ -45,25 +163,36 @@ class TemplateManager:
             "HTML": "<a href=\"#image_url#\"><img src=\"#thumb_url#\"></a>"
         }
         
+        # The same formats as str.format strings, for apply()
+        self._img_format_str = {
+            k: _to_format_string(v, _IMAGE_KEYS) for k, v in self.image_formats.items()
+        }
+
         self.if_pattern = re.compile(r'\[if\s+(\w+)(?:=([^\]]+))?\]((?:(?!\[if).)*?)\[/if\]', re.IGNORECASE | re.DOTALL)
         
         self.templates = self.defaults.copy()
+        self._all_keys_cache = None  # ordered template names, see get_all_keys()
         self.filepath = "user_templates.json"
+        self._last_serialized = None  # payload of the last successful save
         self.load()
 
     def load(self):
         if os.path.exists(self.filepath):
             try:
-                with open(self.filepath, 'r') as f:
-                    saved = json.load(f)
-                    self.templates.update(saved)
+                with open(self.filepath, 'rb') as f:
+                    saved = _json_io.loads(f.read())
+                self.templates.update(saved)
+                self._all_keys_cache = None
             except Exception as e:
                 logger.warning(f"Error loading templates: {e}")
 
     def save(self):
         try:
-            with open(self.filepath, 'w') as f:
-                json.dump(self.templates, f, indent=4)
+            payload = _json_io.dumps(self.templates)
+            if payload == self._last_serialized:
+                return
+            _json_io.write_atomic(self.filepath, payload)
+            self._last_serialized = payload
         except Exception as e:
             logger.error(f"Error saving templates: {e}")
 
@@ -71,10 +200,19 @@ class TemplateManager:
         return self.templates.get(fmt, self.defaults.get(fmt, ""))
 
     def set_template(self, fmt, content):
+        if fmt not in self.templates:
+            self._all_keys_cache = None
         self.templates[fmt] = content
         self.save()
         
     def get_all_keys(self):
+        # The order only changes when templates are added; return a copy
+        # since callers hand the list to widgets
+        if self._all_keys_cache is None:
+            self._all_keys_cache = self._ordered_keys()
+        return list(self._all_keys_cache)
+
+    def _ordered_keys(self):
         keys = list(self.templates.keys())
         standards = ["BBCode", "Markdown", "HTML"]
         others = sorted([k for k in keys if k not in standards])
@@ -91,61 +229,48 @@ class TemplateManager:
         return final_list
 
     def process_conditionals(self, template_content, data):
-        max_iterations = 1000 
-        iteration = 0
-        
-        while iteration < max_iterations:
-            match = self.if_pattern.search(template_content)
-            if not match: break
+        # Templates are parsed once and rendered in a single pass
+        out = []
+        _render_conditionals(_compile_conditionals(template_content), data, out)
+        return "".join(out)
 
-            key = match.group(1)
-            expected_val = match.group(2)
-            block = match.group(3)
-            actual_val = data.get(key, '')
-
-            if expected_val is not None:
-                condition_met = (str(actual_val).strip() == expected_val.strip())
-            else:
-                condition_met = bool(str(actual_val).strip())
-
-            if '[else]' in block:
-                parts = block.split('[else]', 1)
-                true_block = parts[0]
-                false_block = parts[1]
-            else:
-                true_block = block
-                false_block = ''
-
-            replacement = true_block if condition_met else false_block
-            start_idx, end_idx = match.span()
-            template_content = template_content[:start_idx] + replacement + template_content[end_idx:]
-            iteration += 1
-            
-        return template_content
+    @staticmethod
+    def _format_one_image(img_fmt, img):
+        img_url = img[0] if len(img) > 0 else ""
+        thumb_url = img[1] if len(img) > 1 else img_url
+        return img_fmt.format(image_url=img_url, thumb_url=thumb_url)
 
     def apply(self, format_mode, data, images):
-        img_fmt = self.image_formats.get(format_mode, self.image_formats["BBCode"])
-        processed_images = []
-        for img in images:
-            img_url = img[0] if len(img) > 0 else ""
-            thumb_url = img[1] if len(img) > 1 else img_url
-            img_data = {"image_url": img_url, "thumb_url": thumb_url}
-            item_str = img_fmt
-            for k, v in img_data.items():
-                item_str = item_str.replace(f"#{k}#", str(v))
-            processed_images.append(item_str)
-            
-        data['all_images'] = " ".join(processed_images)
+        img_fmt = self._img_format_str.get(format_mode, self._img_format_str["BBCode"])
+        # A list (not a generator): str.join builds one from a generator anyway
+        data['all_images'] = " ".join([self._format_one_image(img_fmt, img) for img in images])
         template = self.get_template(format_mode)
         content = self.process_conditionals(template, data)
-        for k, v in data.items():
-            content = content.replace(f"#{k}#", str(v))
-        return content
+        # One pass over the text fills every #key#
+        values = {k: str(v) for k, v in data.items()}
+        return _to_format_string(content, frozenset(values)).format_map(values)
 
 # ==========================================
 # PART 2: THE UI (TemplateEditor)
 # ==========================================
 
+# BBCode -> HTML rules for the preview, compiled once
+_PREVIEW_TAG_RULES = (
+    (re.compile(r'\[color=(.*?)\](.*?)\[/color\]', re.IGNORECASE), r'<span style="color:\1">\2</span>'),
+    (re.compile(r'\[size=(.*?)\](.*?)\[/size\]', re.IGNORECASE), r'<span style="font-size:\1px">\2</span>'),
+    (re.compile(r'\[font=(.*?)\](.*?)\[/font\]', re.IGNORECASE), r'<span style="font-family:\1">\2</span>'),
+)
+_PREVIEW_IMG_RE = re.compile(r'\[img\](.*?)\[/img\]', re.IGNORECASE)
+_PREVIEW_URL_RE = re.compile(r'\[url=(.*?)\]', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=8)
+def _preview_img_repl(thumb_size):
+    """Replacement for [img] tags, which depends on the thumbnail size."""
+    img_style = f'max-width: {thumb_size}px; border: 1px solid #ccc; margin: 2px;'
+    return f'<img src="\\1" style="{img_style}">'
+
+
 class TemplateEditor(ctk.CTkToplevel):
     def __init__(self, parent, template_mgr, current_mode="BBCode", data_callback=None, update_callback=None):
         super().__init__(parent)
@@ -390,13 +515,11 @@ class TemplateEditor(ctk.CTkToplevel):
             converted = converted.replace("[i]", "<i>").replace("[/i]", "</i>")
             converted = converted.replace("[u]", "<u>").replace("[/u]", "</u>")
             
-            converted = re.sub(r'\[color=(.*?)\](.*?)\[/color\]', r'<span style="color:\1">\2</span>', converted, flags=re.IGNORECASE)
-            converted = re.sub(r'\[size=(.*?)\](.*?)\[/size\]', r'<span style="font-size:\1px">\2</span>', converted, flags=re.IGNORECASE)
-            converted = re.sub(r'\[font=(.*?)\](.*?)\[/font\]', r'<span style="font-family:\1">\2</span>', converted, flags=re.IGNORECASE)
+            for pattern, repl in _PREVIEW_TAG_RULES:
+                converted = pattern.sub(repl, converted)
             
-            img_style = f'max-width: {thumb_size}px; border: 1px solid #ccc; margin: 2px;'
-            converted = re.sub(r'\[img\](.*?)\[/img\]', f'<img src="\\1" style="{img_style}">', converted, flags=re.IGNORECASE)
-            converted = re.sub(r'\[url=(.*?)\]', r'<a href="\1" target="_blank">', converted, flags=re.IGNORECASE)
+            converted = _PREVIEW_IMG_RE.sub(_preview_img_repl(thumb_size), converted)
+            converted = _PREVIEW_URL_RE.sub(r'<a href="\1" target="_blank">', converted)
             converted = converted.replace("[/url]", "</a>")
 
             html_content = f"""<html><body style='font-family: sans-serif; padding: 20px; background: #f0f0f0;'>
@@ -8,13 +8,27 @@ Uses LRU eviction strategy and file modification time tracking.
 
 import os
 import hashlib
-import pickle
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Tuple, Any
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 from collections import OrderedDict
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, features
 from loguru import logger
 
+try:
+    import xxhash
+except ImportError:  # optional speedup
+    xxhash = None
+
+# Disk entries are encoded images (~8 KB as WebP) rather than pickled pixel
+# data; PNG is the fallback for Pillow builds without WebP support
+if features.check('webp'):
+    _DISK_SAVE_OPTIONS = {'format': 'WEBP', 'quality': 85, 'method': 0}
+else:
+    _DISK_SAVE_OPTIONS = {'format': 'PNG', 'compress_level': 1}
+
 
 class ThumbnailCache:
     """
@@ -30,17 +44,26 @@ class ThumbnailCache:
     - Automatically invalidates cache when file is modified
     """
 
-    def __init__(self, max_memory_items: int = 1000, disk_cache_dir: Optional[str] = None):
+    def __init__(self, max_memory_items: int = 1000, disk_cache_dir: Optional[str] = None,
+                 mtime_ttl: float = 0.0):
         """
         Initialize thumbnail cache.
 
         Args:
             max_memory_items: Maximum thumbnails to keep in memory (LRU eviction)
             disk_cache_dir: Optional directory for persistent disk cache
+            mtime_ttl: Seconds to reuse a file's stat result across lookups
+                (0 stats on every call, so changes are seen immediately)
         """
         self.max_memory_items = max_memory_items
         self.disk_cache_dir = disk_cache_dir
-        self.memory_cache: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
+        self.mtime_ttl = mtime_ttl
+        # path -> (mtime, time.monotonic() when it was read)
+        self._mtime_cache: Dict[str, Tuple[float, float]] = {}
+        # Guards memory_cache and the hit/miss counters across threads
+        self._lock = threading.Lock()
+        # Keyed by (file path, mtime)
+        self.memory_cache: OrderedDict[Tuple[str, float], Any] = OrderedDict()
         self.hits = 0
         self.misses = 0
 
@@ -48,7 +71,32 @@ class ThumbnailCache:
         if disk_cache_dir:
             Path(disk_cache_dir).mkdir(parents=True, exist_ok=True)
 
-    def _get_cache_key(self, file_path: str, mtime: float) -> str:
+    def _fast_mtime(self, file_path: str) -> float:
+        """
+        Return the file's mtime, reusing a recent stat result when allowed.
+
+        Args:
+            file_path: Path to image file
+
+        Returns:
+            File modification time
+        """
+        if self.mtime_ttl <= 0:
+            return os.path.getmtime(file_path)
+
+        now = time.monotonic()
+        entry = self._mtime_cache.get(file_path)
+        if entry is not None and now - entry[1] < self.mtime_ttl:
+            return entry[0]
+
+        mtime = os.path.getmtime(file_path)
+        if len(self._mtime_cache) >= self.max_memory_items:
+            # Entries expire quickly anyway; just start over
+            self._mtime_cache.clear()
+        self._mtime_cache[file_path] = (mtime, now)
+        return mtime
+
+    def _get_cache_key(self, file_path: str, mtime: float) -> int:
         """
         Generate cache key from file path and modification time.
 
@@ -57,17 +105,18 @@ class ThumbnailCache:
             mtime: File modification time
 
         Returns:
-            Cache key string
+            64-bit cache key (not cryptographic, only needs to be stable)
         """
-        # Use hash of path + mtime for shorter keys
-        key_data = f"{file_path}:{mtime}"
-        return hashlib.sha256(key_data.encode()).hexdigest()[:16]
+        key_data = f"{file_path}:{mtime}".encode()
+        if xxhash is not None:
+            return xxhash.xxh3_64_intdigest(key_data)
+        return int.from_bytes(hashlib.blake2b(key_data, digest_size=8).digest(), 'big')
 
-    def _get_disk_cache_path(self, cache_key: str) -> Optional[Path]:
+    def _get_disk_cache_path(self, cache_key: int) -> Optional[Path]:
         """Get disk cache file path for a cache key."""
         if not self.disk_cache_dir:
             return None
-        return Path(self.disk_cache_dir) / f"{cache_key}.thumb"
+        return Path(self.disk_cache_dir) / f"{cache_key:016x}.thumb"
 
     def get(self, file_path: str, thumbnail_size: Tuple[int, int]) -> Optional[Any]:
         """
@@ -82,45 +131,45 @@ class ThumbnailCache:
         """
         try:
             # Get file modification time
-            mtime = os.path.getmtime(file_path)
-            cache_key = self._get_cache_key(file_path, mtime)
+            mtime = self._fast_mtime(file_path)
+            # The mtime is part of the key, so a modified file simply misses
+            memory_key = (file_path, mtime)
 
             # Try memory cache first (fast path)
-            if cache_key in self.memory_cache:
-                pil_image, cached_mtime = self.memory_cache[cache_key]
-
-                # Verify mtime hasn't changed
-                if cached_mtime == mtime:
+            with self._lock:
+                pil_image = self.memory_cache.get(memory_key)
+                if pil_image is not None:
                     # Move to end (mark as recently used)
-                    self.memory_cache.move_to_end(cache_key)
+                    self.memory_cache.move_to_end(memory_key)
                     self.hits += 1
-                    logger.debug(f"Thumbnail cache HIT (memory): {file_path}")
-                    return pil_image
-                else:
-                    # File changed, invalidate cache entry
-                    del self.memory_cache[cache_key]
+            if pil_image is not None:
+                logger.debug(f"Thumbnail cache HIT (memory): {file_path}")
+                return pil_image
 
             # Try disk cache (slower path)
             if self.disk_cache_dir:
-                disk_path = self._get_disk_cache_path(cache_key)
-                if disk_path and disk_path.exists():
-                    try:
-                        with open(disk_path, 'rb') as f:
-                            pil_image = pickle.load(f)
-
-                        # Store in memory cache for next access
-                        self._store_in_memory(cache_key, pil_image, mtime)
-
-                        self.hits += 1
-                        logger.debug(f"Thumbnail cache HIT (disk): {file_path}")
-                        return pil_image
-                    except Exception as e:
-                        logger.warning(f"Failed to load disk cache for {file_path}: {e}")
-                        # Remove corrupted cache file
-                        disk_path.unlink(missing_ok=True)
+                disk_path = self._get_disk_cache_path(self._get_cache_key(file_path, mtime))
+                # Just open it; a missing entry is the common miss
+                try:
+                    with Image.open(disk_path) as disk_image:
+                        disk_image.load()
+                        pil_image = disk_image.copy()
+
+                    # Store in memory cache for next access
+                    self._store_in_memory(memory_key, pil_image, hit=True)
+
+                    logger.debug(f"Thumbnail cache HIT (disk): {file_path}")
+                    return pil_image
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    logger.warning(f"Failed to load disk cache for {file_path}: {e}")
+                    # Remove corrupted (or legacy pickled) cache file
+                    disk_path.unlink(missing_ok=True)
 
             # Cache miss
-            self.misses += 1
+            with self._lock:
+                self.misses += 1
             logger.debug(f"Thumbnail cache MISS: {file_path}")
             return None
 
@@ -138,18 +187,20 @@ class ThumbnailCache:
             thumbnail_size: Size of thumbnail (for metadata)
         """
         try:
-            mtime = os.path.getmtime(file_path)
-            cache_key = self._get_cache_key(file_path, mtime)
+            mtime = self._fast_mtime(file_path)
 
             # Store in memory
-            self._store_in_memory(cache_key, pil_image, mtime)
+            self._store_in_memory((file_path, mtime), pil_image)
 
             # Store on disk if enabled
             if self.disk_cache_dir:
                 try:
-                    disk_path = self._get_disk_cache_path(cache_key)
+                    disk_path = self._get_disk_cache_path(self._get_cache_key(file_path, mtime))
+                    disk_image = pil_image
+                    if disk_image.mode not in ('RGB', 'RGBA'):
+                        disk_image = disk_image.convert('RGBA')
                     with open(disk_path, 'wb') as f:
-                        pickle.dump(pil_image, f, protocol=pickle.HIGHEST_PROTOCOL)
+                        disk_image.save(f, **_DISK_SAVE_OPTIONS)
                     logger.debug(f"Thumbnail cached to disk: {file_path}")
                 except Exception as e:
                     logger.warning(f"Failed to write disk cache for {file_path}: {e}")
@@ -157,20 +208,75 @@ class ThumbnailCache:
         except Exception as e:
             logger.error(f"Error storing thumbnail in cache for {file_path}: {e}")
 
-    def _store_in_memory(self, cache_key: str, pil_image: Any, mtime: float):
+    def _store_in_memory(self, memory_key: Tuple[str, float], pil_image: Any, hit: bool = False):
         """Store thumbnail in memory cache with LRU eviction."""
-        # Add to cache
-        self.memory_cache[cache_key] = (pil_image, mtime)
-        self.memory_cache.move_to_end(cache_key)
+        with self._lock:
+            # Add to cache
+            self.memory_cache[memory_key] = pil_image
+            self.memory_cache.move_to_end(memory_key)
+            if hit:
+                self.hits += 1
+
+            # Evict oldest if over limit (LRU)
+            while len(self.memory_cache) > self.max_memory_items:
+                oldest_key, _ = self.memory_cache.popitem(last=False)
+                logger.debug(f"Evicted thumbnail from memory cache: {oldest_key}")
+
+    def get_many(self, file_paths: Iterable[str], thumbnail_size: Tuple[int, int],
+                 generator: Callable[[str], Any],
+                 max_workers: Optional[int] = None) -> Dict[str, Optional[Any]]:
+        """
+        Look up many thumbnails, generating the misses in parallel.
 
-        # Evict oldest if over limit (LRU)
-        while len(self.memory_cache) > self.max_memory_items:
-            oldest_key, _ = self.memory_cache.popitem(last=False)
-            logger.debug(f"Evicted thumbnail from memory cache: {oldest_key}")
+        PIL releases the GIL while decoding, so misses are handed to a thread
+        pool; generated thumbnails are then stored like put() would.
+
+        Args:
+            file_paths: Paths to image files
+            thumbnail_size: Thumbnail size (for validation)
+            generator: Called with a path to build its thumbnail; may return
+                None or raise for files that cannot be thumbnailed
+            max_workers: Thread count for generation (defaults to CPU count)
+
+        Returns:
+            Dictionary of path to PIL Image, or None where none could be made
+        """
+        results: Dict[str, Optional[Any]] = {}
+        misses = []
+        for file_path in file_paths:
+            if file_path in results:
+                continue
+            pil_image = self.get(file_path, thumbnail_size)
+            results[file_path] = pil_image
+            if pil_image is None:
+                misses.append(file_path)
+
+        if not misses:
+            return results
+
+        def generate(file_path):
+            try:
+                return generator(file_path)
+            except Exception as e:
+                logger.debug(f"Failed to create thumbnail for {file_path}: {e}")
+                return None
+
+        workers = min(max_workers or os.cpu_count() or 1, len(misses))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            generated = list(executor.map(generate, misses))
+
+        for file_path, pil_image in zip(misses, generated):
+            results[file_path] = pil_image
+            if pil_image is not None:
+                self.put(file_path, pil_image, thumbnail_size)
+
+        return results
 
     def clear(self):
         """Clear all cached thumbnails from memory."""
-        self.memory_cache.clear()
+        with self._lock:
+            self.memory_cache.clear()
+            self._mtime_cache.clear()
         logger.info("Thumbnail cache cleared")
 
     def clear_disk_cache(self):
@@ -241,7 +347,9 @@ def get_thumbnail_cache() -> ThumbnailCache:
 
         _thumbnail_cache = ThumbnailCache(
             max_memory_items=1000,
-            disk_cache_dir=disk_cache_dir
+            disk_cache_dir=disk_cache_dir,
+            # get() and put() for the same file during one refresh share a stat
+            mtime_ttl=0.5
         )
     return _thumbnail_cache
 
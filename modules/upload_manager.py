@@ -86,9 +86,10 @@ class UploadManager:
                         pass 
 
                     # Submit files to pool
+                    first = group.files[0] if group.files else None
                     for fp in files:
                         if self.cancel_event.is_set(): break
-                        is_first = (fp == group.files[0])
+                        is_first = (fp == first)
                         executor.submit(
                             self._upload_task, 
                             fp, is_first, current_cfg, current_pix_data, 
@@ -139,16 +140,7 @@ class UploadManager:
 
             # Execute Upload with retry logic
             if uploader:
-                url, data, headers = uploader.get_request_params()
-
-                def read_monitor_chunks(monitor):
-                    while True:
-                        chunk = monitor.read(_app_config.network.chunk_size)
-                        if not chunk: break
-                        yield chunk
-
-                if 'Content-Length' not in headers and hasattr(data, 'len'):
-                    headers['Content-Length'] = str(data.len)
+                url, body, headers = uploader.get_request_params()
 
                 # Wrap upload in retry decorator with custom config
                 retry_config = RetryConfig(
@@ -165,7 +157,8 @@ class UploadManager:
                     return client.post(
                         url,
                         headers=headers,
-                        content=read_monitor_chunks(data),
+                        data=body.get('data'),
+                        files=body.get('files'),
                         timeout=_app_config.network.upload_timeout_seconds
                     )
 
@@ -177,7 +170,7 @@ class UploadManager:
                         handle_network_error(retry_error, "Upload", service)
                     raise
 
-                resp = r.text if service == 'vipr.im' else r.json()
+                resp = r.text if service == 'vipr.im' else api.fast_json(r)
                 img, thumb = uploader.parse_response(resp)
                 
                 # Success
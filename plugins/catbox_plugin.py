@@ -81,23 +81,23 @@ class CatboxPlugin(ImageHostPlugin):
             logger.debug(f"Uploading {file_path.name} to Catbox")
 
             # Prepare upload data
-            with open(file_path, 'rb') as f:
-                files = {'fileToUpload': (file_path.name, f, 'image/*')}
-
-                data = {
-                    'reqtype': 'fileupload',
-                }
+            data = {
+                'reqtype': 'fileupload',
+            }
 
-                # Add user hash if available (for authenticated uploads)
-                if self.user_hash:
-                    data['userhash'] = self.user_hash
+            # Add user hash if available (for authenticated uploads)
+            if self.user_hash:
+                data['userhash'] = self.user_hash
 
-                # Upload
-                response = self.client.post(
-                    self.UPLOAD_URL,
-                    files=files,
-                    data=data
-                )
+            # Upload
+            response = self._stream_upload(
+                self.UPLOAD_URL,
+                file_path,
+                field_name='fileToUpload',
+                progress_callback=progress_callback,
+                extra_fields=data,
+                content_type='image/*'
+            )
 
             # Check response
             if response.status_code != 200:
@@ -187,7 +187,8 @@ class CatboxPlugin(ImageHostPlugin):
             logger.error(f"Error deleting Catbox file: {e}")
             return False
 
-    def get_credential_fields(self) -> dict:
+    @classmethod
+    def get_credential_fields_class(cls) -> dict:
         """
         Return credential fields for UI.
 
@@ -209,7 +210,8 @@ class CatboxPlugin(ImageHostPlugin):
             }
         }
 
-    def get_upload_options(self) -> dict:
+    @classmethod
+    def get_upload_options_class(cls) -> dict:
         """
         Return upload options for UI.
 
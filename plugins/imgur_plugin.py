@@ -92,17 +92,15 @@ class ImgurPlugin(ImageHostPlugin):
             raise UploadException(error)
 
         try:
-            # Read file
-            with open(file_path, 'rb') as f:
-                image_data = f.read()
+            logger.debug(f"Uploading {file_path.name} to Imgur")
 
-            logger.debug(f"Uploading {file_path.name} to Imgur ({len(image_data)} bytes)")
-
-            # Upload to Imgur
-            response = self.client.post(
+            # Upload to Imgur (streamed from disk)
+            response = self._stream_upload(
                 f"{self.API_BASE}/image",
-                files={'image': (file_path.name, image_data)},
-                data={
+                file_path,
+                field_name='image',
+                progress_callback=progress_callback,
+                extra_fields={
                     'type': 'file',
                     'name': file_path.stem,
                     'title': file_path.stem
@@ -289,7 +287,8 @@ class ImgurPlugin(ImageHostPlugin):
             logger.error(f"Error deleting Imgur image: {e}")
             return False
 
-    def get_credential_fields(self) -> dict:
+    @classmethod
+    def get_credential_fields_class(cls) -> dict:
         """
         Return credential fields for UI.
 
@@ -310,7 +309,8 @@ class ImgurPlugin(ImageHostPlugin):
             }
         }
 
-    def get_upload_options(self) -> dict:
+    @classmethod
+    def get_upload_options_class(cls) -> dict:
         """
         Return upload options for UI.
 
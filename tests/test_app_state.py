@@ -0,0 +1,54 @@
+"""
+Unit tests for app_state.py - Application State
+
+Tests queue draining and upload counting.
+"""
+
+import queue
+
+import pytest
+
+from modules.app_state import UploadState, drain_queue
+
+
+class TestDrainQueue:
+    """Test suite for drain_queue."""
+
+    def test_returns_items_in_order(self):
+        """Test that every queued item is returned and the queue is empty."""
+        q = queue.Queue()
+        for i in range(3):
+            q.put(i)
+
+        assert drain_queue(q) == [0, 1, 2]
+        assert q.empty()
+
+    def test_keeps_other_consumers_tasks(self):
+        """Test that items taken by other consumers still block join()."""
+        q = queue.Queue()
+        for i in range(3):
+            q.put(i)
+        q.get()  # taken by another consumer, not yet task_done()
+
+        drain_queue(q)
+        assert q.unfinished_tasks == 1
+
+        q.task_done()
+        q.join()
+
+
+class TestUploadState:
+    """Test suite for UploadState counting."""
+
+    def test_increment_follows_direct_updates(self):
+        """Test that increment_count continues from a value set by the UI."""
+        state = UploadState(upload_total=10)
+        state.increment_count()
+        state.upload_count = 5
+        state.increment_count()
+
+        assert state.upload_count == 6
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
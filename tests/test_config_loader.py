@@ -7,7 +7,7 @@ Tests YAML loading, merging, validation, and defaults.
 import pytest
 import yaml
 from pathlib import Path
-from modules.config_loader import ConfigLoader, AppConfig, NetworkConfig, UIConfig
+from modules.config_loader import ConfigLoader, AppConfig, NetworkConfig, UIConfig, reload_config
 
 
 class TestConfigLoader:
@@ -228,8 +228,10 @@ class TestConfigDataclasses:
         assert config.timeout_seconds == 60.0
         assert config.retry_count == 3
         assert config.upload_timeout_seconds == 300.0
-        assert config.chunk_size == 8192
+        assert config.chunk_size == 2 * 1024 * 1024
         assert config.http2_enabled is True
+        assert config.max_connections == 100
+        assert config.max_keepalive_connections == 20
 
     def test_ui_config_defaults(self):
         """Test UIConfig default values."""
@@ -323,6 +325,34 @@ class TestConfigLoaderEdgeCases:
 
         assert config.network.timeout_seconds == 60.0
 
+    def test_reload_picks_up_new_config_file(self, tmp_path, monkeypatch):
+        """Test that reload_config re-resolves a previously missing config file."""
+        import modules.config_loader as config_loader_module
+        # Restore the global loader afterwards
+        monkeypatch.setattr(config_loader_module, '_config_loader', config_loader_module._config_loader)
+
+        config_file = tmp_path / "late.yaml"
+        ConfigLoader(config_path=str(config_file))  # resolved while missing
+
+        config_file.write_text("network:\n  retry_count: 7\n")
+        loader = reload_config(str(config_file))
+
+        assert loader.config.network.retry_count == 7
+
+    def test_default_path_resolved_per_directory(self, tmp_path, monkeypatch):
+        """Test that the cached config lookup follows the working directory."""
+        with_config = tmp_path / "with_config"
+        without_config = tmp_path / "without_config"
+        with_config.mkdir()
+        without_config.mkdir()
+        (with_config / ConfigLoader.DEFAULT_CONFIG_PATH).write_text("network:\n  retry_count: 4\n")
+
+        monkeypatch.chdir(without_config)
+        assert ConfigLoader().config.network.retry_count != 4
+
+        monkeypatch.chdir(with_config)
+        assert ConfigLoader().config.network.retry_count == 4
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
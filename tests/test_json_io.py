@@ -0,0 +1,98 @@
+"""
+Unit tests for _json_io.py - Shared JSON I/O
+
+Tests JSON encoding and atomic writes of the settings and template files.
+"""
+
+import importlib
+import os
+import stat
+import sys
+
+import pytest
+
+from modules import _json_io
+
+
+class TestEncoding:
+    """Test suite for loads/dumps."""
+
+    def test_round_trip(self):
+        """Test that both encoders produce JSON that loads back unchanged."""
+        data = {'a': [1, 2], 'b': 'é'}
+        assert _json_io.loads(_json_io.dumps(data)) == data
+        assert _json_io.loads(_json_io.dumps_compact(data)) == data
+
+    def test_fallback_matches_orjson(self, monkeypatch):
+        """Test that the stdlib fallback writes the same bytes as orjson."""
+        pytest.importorskip("orjson")
+        data = {'name': 'Größe', 'items': [1, {'a': None}], 'empty': {}}
+        fast = (_json_io.dumps(data), _json_io.dumps_compact(data))
+
+        monkeypatch.setitem(sys.modules, 'orjson', None)
+        try:
+            fallback = importlib.reload(_json_io)
+            assert fallback.orjson is None
+            assert (fallback.dumps(data), fallback.dumps_compact(data)) == fast
+        finally:
+            monkeypatch.undo()
+            importlib.reload(_json_io)
+
+    def test_compact_has_no_whitespace(self):
+        """Test that dumps_compact emits no separator whitespace."""
+        assert _json_io.dumps_compact({'a': [1, 2]}) == b'{"a":[1,2]}'
+
+
+class TestWriteAtomic:
+    """Test suite for write_atomic."""
+
+    def test_writes_payload(self, tmp_path):
+        """Test that the payload replaces the target and no temp file is left."""
+        target = tmp_path / "settings.json"
+        target.write_bytes(b"old")
+
+        _json_io.write_atomic(target, b"new")
+
+        assert target.read_bytes() == b"new"
+        assert os.listdir(tmp_path) == ["settings.json"]
+
+    @pytest.mark.skipif(os.name == 'nt', reason="POSIX permission bits")
+    def test_keeps_existing_mode(self, tmp_path):
+        """Test that the permissions of an existing target are preserved."""
+        target = tmp_path / "settings.json"
+        target.write_bytes(b"{}")
+        target.chmod(0o600)
+
+        _json_io.write_atomic(target, b"{}")
+
+        assert stat.S_IMODE(target.stat().st_mode) == 0o600
+
+    @pytest.mark.skipif(os.name == 'nt', reason="POSIX permission bits")
+    def test_new_file_honours_umask(self, tmp_path):
+        """Test that a new file gets the same mode open() would give it."""
+        reference = tmp_path / "reference.json"
+        reference.write_bytes(b"{}")
+        target = tmp_path / "settings.json"
+
+        _json_io.write_atomic(target, b"{}")
+
+        assert stat.S_IMODE(target.stat().st_mode) == stat.S_IMODE(reference.stat().st_mode)
+
+    def test_failure_leaves_target_intact(self, tmp_path, monkeypatch):
+        """Test that a failed write keeps the old file and removes the temp file."""
+        target = tmp_path / "settings.json"
+        target.write_bytes(b"old")
+
+        def fail(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(_json_io.os, "replace", fail)
+        with pytest.raises(OSError):
+            _json_io.write_atomic(target, b"new")
+
+        assert target.read_bytes() == b"old"
+        assert os.listdir(tmp_path) == ["settings.json"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -101,6 +101,12 @@ class TestPathValidator:
             with pytest.raises(PathValidationError, match="Access to system directories is forbidden"):
                 PathValidator.validate_input_path(path, must_exist=False)
 
+    def test_forbidden_windows_prefix_any_case(self):
+        """Test that Windows system directories are matched case-insensitively."""
+        assert PathValidator._is_forbidden_path("C:\\Windows\\System32")
+        assert PathValidator._is_forbidden_path("c:\\windows\\system32")
+        assert not PathValidator._is_forbidden_path("D:\\Photos\\Windows")
+
     def test_symlink_attack_prevention(self, tmp_path):
         """Test that symlinks to allowed directories are accepted (but logged)."""
         # Create a regular target (not forbidden)
@@ -213,6 +219,14 @@ class TestPathValidator:
         images_recursive = PathValidator.scan_directory_for_images(str(tmp_path), recursive=True)
         assert len(images_recursive) == 3
 
+    def test_scan_directory_max_files(self, tmp_path):
+        """Test that scanning stops once max_files images were found."""
+        for i in range(5):
+            (tmp_path / f"image{i}.jpg").write_bytes(b"img")
+
+        images = PathValidator.scan_directory_for_images(str(tmp_path), max_files=2)
+        assert len(images) == 2
+
     def test_normalize_path(self, tmp_path):
         """Test that validate_input_path normalizes paths to absolute."""
         test_file = tmp_path / "test.jpg"
@@ -222,6 +236,18 @@ class TestPathValidator:
         result = PathValidator.validate_input_path(str(test_file))
         assert result.is_absolute()
 
+    def test_validation_cache_clear(self, tmp_path):
+        """Test that cached validations are dropped by clear_cache()."""
+        test_file = tmp_path / "cached.jpg"
+        test_file.write_bytes(b"img")
+        PathValidator.validate_input_path(str(test_file))
+
+        test_file.unlink()
+        PathValidator.clear_cache()
+
+        with pytest.raises(PathValidationError):
+            PathValidator.validate_input_path(str(test_file))
+
     def test_empty_path_rejection(self):
         """Test that empty paths are rejected."""
         with pytest.raises(PathValidationError, match="Path must be a non-empty string"):
@@ -11,7 +11,7 @@ import tempfile
 import shutil
 
 from modules.plugin_interface import ImageHostPlugin, UploadResult, UploadException
-from modules.plugin_manager import PluginManager, PluginLoadError
+from modules.plugin_manager import PluginManager, PluginLoadError, PluginMetadata
 from modules.plugin_adapter import ServiceRegistry
 
 
@@ -123,6 +123,155 @@ class TestPluginInterface:
         assert is_valid
         assert error is None
 
+    def test_plugin_validate_files_batch(self, tmp_path):
+        """Test batch validation matches per-file validation"""
+        class TestPlugin(ImageHostPlugin):
+            name = "Test"
+            allowed_formats = ['jpg', 'png']
+            max_file_size_mb = 1
+
+            def upload(self, file_path, progress_callback=None):
+                pass
+
+            def validate_credentials(self):
+                return True
+
+        plugin = TestPlugin()
+        good = tmp_path / "good.JPG"
+        good.write_bytes(b'img')
+        wrong_format = tmp_path / "image.bmp"
+        wrong_format.write_bytes(b'img')
+        too_large = tmp_path / "large.png"
+        too_large.write_bytes(b'x' * (2 * 1024 * 1024))
+        missing = tmp_path / "missing.jpg"
+
+        paths = [good, wrong_format, too_large, missing]
+        results = plugin.validate_files(paths)
+
+        assert results == {p: plugin.validate_file(p) for p in paths}
+        assert results[good] == (True, None)
+        assert not results[missing][0]
+
+    def test_plugin_stream_upload_reports_progress(self, tmp_path):
+        """Test that _stream_upload sends the file and reports progress"""
+        import httpx
+
+        class TestPlugin(ImageHostPlugin):
+            name = "Test"
+
+            def upload(self, file_path, progress_callback=None):
+                pass
+
+            def validate_credentials(self):
+                return True
+
+        received = {}
+
+        def handler(request):
+            received['body'] = request.read()
+            return httpx.Response(200, text="ok")
+
+        plugin = TestPlugin()
+        plugin.client = httpx.Client(transport=httpx.MockTransport(handler))
+        test_file = tmp_path / "test.jpg"
+        test_file.write_bytes(b'x' * 200000)
+
+        progress = []
+        response = plugin._stream_upload(
+            "https://example.com/upload",
+            test_file,
+            progress_callback=lambda sent, total: progress.append((sent, total)),
+            extra_fields={'key': 'value'}
+        )
+
+        assert response.text == "ok"
+        assert b'x' * 200000 in received['body']
+        assert progress[-1] == (200000, 200000)
+
+    def test_plugins_share_http_client(self):
+        """Test that opted-in plugins share one client that cleanup() leaves open"""
+        class TestPlugin(ImageHostPlugin):
+            name = "Test"
+            use_shared_client = True
+
+            def upload(self, file_path, progress_callback=None):
+                pass
+
+            def validate_credentials(self):
+                return True
+
+        class OwnClientPlugin(TestPlugin):
+            use_shared_client = False
+
+        first, second = TestPlugin(), TestPlugin()
+        assert first.client is second.client
+        assert OwnClientPlugin().client is None
+
+        first.cleanup()
+        assert not second.client.is_closed
+
+    def test_closed_shared_client_is_recreated(self):
+        """Test that get_shared_client replaces a client closed by a plugin"""
+        from modules import plugin_interface
+
+        closed = plugin_interface.get_shared_client()
+        closed.close()
+
+        client = plugin_interface.get_shared_client()
+        assert client is not closed
+        assert not client.is_closed
+
+    def test_shared_client_uses_network_config(self, monkeypatch):
+        """Test that the shared client is built from the network config"""
+        from modules import plugin_interface
+        from modules.config_loader import get_config_loader
+
+        net = get_config_loader().config.network
+        monkeypatch.setattr(net, 'timeout_seconds', 12.0)
+        monkeypatch.setattr(net, 'http2_enabled', False)
+
+        plugin_interface.close_shared_client()
+        try:
+            client = plugin_interface.get_shared_client()
+            assert client.timeout.read == 12.0
+        finally:
+            plugin_interface.close_shared_client()
+        assert client.is_closed
+
+    def test_plugin_class_level_schemas(self):
+        """Test that schemas and metadata are available from the class"""
+        class ClassSchemaPlugin(ImageHostPlugin):
+            name = "ClassSchema"
+            supports_galleries = True
+
+            @classmethod
+            def get_credential_fields_class(cls):
+                return {'api_key': {'label': 'API Key', 'type': 'password', 'required': True}}
+
+            def upload(self, file_path, progress_callback=None):
+                pass
+
+            def validate_credentials(self):
+                return True
+
+        class InstanceSchemaPlugin(ImageHostPlugin):
+            name = "InstanceSchema"
+
+            def get_credential_fields(self):
+                return {}
+
+            def upload(self, file_path, progress_callback=None):
+                pass
+
+            def validate_credentials(self):
+                return True
+
+        assert 'api_key' in ClassSchemaPlugin.get_credential_fields_class()
+        assert 'api_key' in ClassSchemaPlugin().get_credential_fields()
+        assert ClassSchemaPlugin.get_upload_options_class() == {}
+        assert InstanceSchemaPlugin.get_credential_fields_class() is None
+        assert ClassSchemaPlugin.class_metadata()['supports_galleries'] is True
+
 
 class TestPluginManager:
     """Test the plugin manager"""
@@ -175,6 +324,41 @@ class SamplePlugin(ImageHostPlugin):
         assert "Sample" in manager
         assert manager.has_plugin("Sample")
 
+    def test_plugin_manager_lazy_load(self, plugin_dir, sample_plugin_code):
+        """Test that plugin files are only executed when first requested"""
+        plugin_file = plugin_dir / "sample_plugin.py"
+        plugin_file.write_text(sample_plugin_code)
+
+        manager = PluginManager(plugin_dir)
+        assert manager.plugins == {}
+
+        assert manager.get_plugin("Sample") is not None
+        assert "Sample" in manager.plugins
+
+    def test_plugin_manager_loads_many_files(self, plugin_dir, sample_plugin_code):
+        """Test that a larger plugin directory loads completely in parallel"""
+        for i in range(5):
+            code = sample_plugin_code.replace('"Sample"', f'"Sample{i}"')
+            (plugin_dir / f"sample{i}_plugin.py").write_text(code)
+        (plugin_dir / "broken_plugin.py").write_text("raise RuntimeError('boom')")
+
+        manager = PluginManager(plugin_dir, auto_load=True)
+
+        assert sorted(manager.get_plugin_names()) == [f"Sample{i}" for i in range(5)]
+
+    def test_plugin_manager_caches_loaded_files(self, plugin_dir, sample_plugin_code):
+        """Test that unchanged plugin files are not executed twice"""
+        plugin_file = plugin_dir / "sample_plugin.py"
+        plugin_file.write_text(sample_plugin_code)
+
+        first = PluginManager(plugin_dir, auto_load=True).get_plugin("Sample")
+        second = PluginManager(plugin_dir, auto_load=True).get_plugin("Sample")
+        assert first is second
+
+        PluginManager.clear_cache()
+        third = PluginManager(plugin_dir, auto_load=True).get_plugin("Sample")
+        assert third is not first
+
     def test_plugin_manager_get_plugin(self, plugin_dir, sample_plugin_code):
         """Test getting a plugin class"""
         plugin_file = plugin_dir / "sample_plugin.py"
@@ -212,6 +396,40 @@ class SamplePlugin(ImageHostPlugin):
         assert len(plugins) == 1
         assert plugins[0]['name'] == "Sample"
 
+    def test_plugin_manager_plugin_info(self, plugin_dir, sample_plugin_code):
+        """Test metadata records and list_plugins cache invalidation"""
+        plugin_file = plugin_dir / "sample_plugin.py"
+        plugin_file.write_text(sample_plugin_code)
+
+        manager = PluginManager(plugin_dir, auto_load=True)
+        info = manager.get_plugin_info("Sample")
+
+        assert isinstance(info, PluginMetadata)
+        assert info.source_file == str(plugin_file)
+        with pytest.raises(AttributeError):
+            info.name = "Other"
+
+        assert manager.list_plugins() == [info.to_dict()]
+        manager.unload_plugin("Sample")
+        assert manager.list_plugins() == []
+
+    def test_plugin_manager_get_plugins_by_capability(self, plugin_dir, sample_plugin_code):
+        """Test capability filtering and index cleanup on unload"""
+        plugin_file = plugin_dir / "sample_plugin.py"
+        plugin_file.write_text(sample_plugin_code)
+
+        manager = PluginManager(plugin_dir, auto_load=True)
+        sample = manager.get_plugin("Sample")
+
+        assert manager.get_plugins_by_capability() == ["Sample"]
+        assert (manager.get_plugins_by_capability(supports_galleries=sample.supports_galleries)
+                == ["Sample"])
+        assert manager.get_plugins_by_capability(
+            supports_galleries=not sample.supports_galleries) == []
+
+        manager.unload_plugin("Sample")
+        assert manager.get_plugins_by_capability(supports_galleries=True) == []
+
     def test_plugin_manager_invalid_plugin_missing_method(self, plugin_dir):
         """Test loading plugin with missing required method"""
         invalid_plugin = '''
@@ -337,6 +555,30 @@ class TestServiceRegistry:
         assert 'imx.to' in names
         assert 'pixhost.to' in names
 
+    def test_registry_resolves_plugins_lazily(self, plugin_dir):
+        """Test that plugins are imported one name at a time, and never for built-ins"""
+        code = (
+            "from modules.plugin_interface import ImageHostPlugin\n"
+            "class {0}Plugin(ImageHostPlugin):\n"
+            "    name = '{0}'\n"
+            "    def upload(self, file_path, progress_callback=None):\n"
+            "        pass\n"
+            "    def validate_credentials(self):\n"
+            "        return True\n"
+        )
+        for name in ("Alpha", "Beta"):
+            (plugin_dir / f"{name.lower()}_plugin.py").write_text(code.format(name))
+
+        registry = ServiceRegistry(plugin_dir)
+        assert not registry.is_plugin_service('imx.to')
+        assert registry.supports_galleries('imx.to')
+        assert registry.plugin_manager.plugins == {}
+
+        assert registry.is_plugin_service('Alpha')
+        assert list(registry.plugin_manager.plugins) == ['Alpha']
+
+        assert sorted(registry.get_service_names()[4:]) == ['Alpha', 'Beta']
+
 
 class TestPluginIntegration:
     """Integration tests for the complete plugin system"""
@@ -416,6 +658,51 @@ class MockService(ImageHostPlugin):
         assert result.thumb_url == "https://mock.com/thumb_test.jpg"
         assert result.metadata['uploaded'] is True
 
+    def test_upload_many_via_plugin(self, plugin_dir, mock_plugin_code, tmp_path):
+        """Test concurrent batch upload returns results in input order"""
+        import asyncio
+
+        plugin_file = plugin_dir / "mock_plugin.py"
+        plugin_file.write_text(mock_plugin_code)
+
+        registry = ServiceRegistry(plugin_dir)
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"img{i}.jpg"
+            path.write_bytes(b'fake image data')
+            paths.append(path)
+
+        results = asyncio.run(registry.upload_many_via_plugin(
+            "MockService", paths, credentials={'api_key': 'valid_key'}, concurrency=2
+        ))
+
+        assert [r.image_url for r in results] == [f"https://mock.com/img{i}.jpg" for i in range(5)]
+
+    def test_async_manager_plugin_upload_sends_no_request(self, plugin_dir, mock_plugin_code, tmp_path):
+        """Test that plugin uploads in the batch manager bypass the shared HTTP client"""
+        import asyncio
+        import httpx
+        from modules.async_upload_manager import AsyncUploadManager, PluginUploaderAdapter
+
+        (plugin_dir / "mock_plugin.py").write_text(mock_plugin_code)
+        registry = ServiceRegistry(plugin_dir)
+        test_image = tmp_path / "test.jpg"
+        test_image.write_bytes(b'fake image data')
+
+        requests = []
+        transport = httpx.MockTransport(lambda request: requests.append(request) or httpx.Response(200))
+        manager = AsyncUploadManager(Mock(), Mock(), Mock())
+        plugin = registry.get_plugin_instance("MockService", credentials={'api_key': 'valid_key'})
+        uploader = PluginUploaderAdapter(plugin, test_image, None)
+
+        async def run():
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await manager._perform_async_upload(
+                    uploader, str(test_image), {'service': "MockService"}, client, asyncio.Event())
+
+        assert asyncio.run(run()) == ("https://mock.com/test.jpg", "https://mock.com/thumb_test.jpg")
+        assert requests == []
+
     def test_plugin_credential_validation(self, plugin_dir, mock_plugin_code):
         """Test plugin credential validation"""
         plugin_file = plugin_dir / "mock_plugin.py"
@@ -435,6 +722,53 @@ class MockService(ImageHostPlugin):
             {'api_key': 'wrong_key'}
         )
 
+    def test_plugin_credential_validation_cached(self, plugin_dir, mock_plugin_code):
+        """Test that validation results are reused until plugins are reloaded"""
+        plugin_file = plugin_dir / "mock_plugin.py"
+        plugin_file.write_text(mock_plugin_code)
+
+        registry = ServiceRegistry(plugin_dir)
+        credentials = {'api_key': 'valid_key'}
+        assert registry.validate_credentials("MockService", credentials)
+
+        plugin, pooled = registry.acquire_plugin("MockService", credentials)
+        assert pooled
+        with patch.object(plugin, 'validate_credentials', return_value=False) as check:
+            assert registry.validate_credentials("MockService", credentials)
+            check.assert_not_called()
+
+        registry.reload_plugins()
+        assert not registry._validation_cache
+
+    def test_plugin_credential_validation_failure_not_cached(self, plugin_dir, mock_plugin_code):
+        """Test that a failed validation is checked again next time"""
+        plugin_file = plugin_dir / "mock_plugin.py"
+        plugin_file.write_text(mock_plugin_code)
+
+        registry = ServiceRegistry(plugin_dir)
+        credentials = {'api_key': 'valid_key'}
+        plugin, _pooled = registry.acquire_plugin("MockService", credentials)
+
+        with patch.object(plugin, 'validate_credentials', return_value=False):
+            assert not registry.validate_credentials("MockService", credentials)
+        assert registry.validate_credentials("MockService", credentials)
+
+    def test_unpooled_plugin_cleaned_up(self, plugin_dir, mock_plugin_code):
+        """Test that one-off instances for unhashable credentials are cleaned up"""
+        plugin_file = plugin_dir / "mock_plugin.py"
+        plugin_file.write_text(mock_plugin_code)
+
+        registry = ServiceRegistry(plugin_dir)
+        plugin_class = registry.plugin_manager.get_plugin("MockService")
+        credentials = {'api_key': ['unhashable']}
+
+        with patch.object(plugin_class, 'cleanup') as cleanup:
+            registry.validate_credentials("MockService", credentials)
+            registry.create_gallery("MockService", "Gallery", [], credentials)
+
+        assert cleanup.call_count == 2
+        assert not registry._plugin_pool
+
     def test_plugin_gallery_creation(self, plugin_dir, mock_plugin_code):
         """Test plugin gallery creation"""
         plugin_file = plugin_dir / "mock_plugin.py"
@@ -451,6 +785,60 @@ class MockService(ImageHostPlugin):
 
         assert gallery_url == "https://mock.com/gallery/Test Gallery"
 
+    def test_plugin_instances_pooled_per_credentials(self, plugin_dir, mock_plugin_code, tmp_path):
+        """Test that plugin instances are reused for the same credentials"""
+        plugin_file = plugin_dir / "mock_plugin.py"
+        plugin_file.write_text(mock_plugin_code)
+
+        registry = ServiceRegistry(plugin_dir)
+        test_image = tmp_path / "test.jpg"
+        test_image.write_bytes(b'fake image data')
+
+        registry.upload_via_plugin("MockService", test_image, credentials={'api_key': 'valid_key'})
+        registry.upload_via_plugin("MockService", test_image, credentials={'api_key': 'valid_key'})
+        assert len(registry._plugin_pool) == 1
+
+        registry.validate_credentials("MockService", {'api_key': 'other_key'})
+        assert len(registry._plugin_pool) == 2
+
+        registry.close_plugin_instances()
+        assert not registry._plugin_pool
+
+    def test_plugin_pool_replaced_on_config_change(self, plugin_dir, mock_plugin_code):
+        """Test that a pooled instance is reused only with the same config"""
+        (plugin_dir / "mock_plugin.py").write_text(mock_plugin_code)
+        registry = ServiceRegistry(plugin_dir)
+        credentials = {'api_key': 'valid_key'}
+
+        first, _pooled = registry.acquire_plugin("MockService", credentials, {'threads': 1})
+        again, _pooled = registry.acquire_plugin("MockService", credentials, {'threads': 1})
+        changed, pooled = registry.acquire_plugin("MockService", credentials, {'threads': 2})
+
+        assert again is first
+        assert changed is not first and pooled
+        with patch.object(first, 'cleanup') as cleanup:
+            registry.close_plugin_instances()
+        cleanup.assert_called_once()
+
+    def test_async_manager_reuses_pooled_plugin(self, plugin_dir, mock_plugin_code, tmp_path):
+        """Test that the batch uploader shares one plugin instance across files"""
+        from modules.async_upload_manager import AsyncUploadManager
+
+        (plugin_dir / "mock_plugin.py").write_text(mock_plugin_code)
+        registry = ServiceRegistry(plugin_dir)
+        manager = AsyncUploadManager(Mock(), Mock(), Mock())
+        manager.service_registry = registry
+        cfg = {'service': "MockService", 'plugin_credentials': {'MockService': {'api_key': 'valid_key'}}}
+
+        first = manager._create_plugin_uploader("MockService", str(tmp_path / "a.jpg"), cfg, None)
+        second = manager._create_plugin_uploader("MockService", str(tmp_path / "b.jpg"), cfg, None)
+        assert first.plugin is second.plugin
+
+        with patch.object(first.plugin, 'cleanup') as cleanup:
+            first.close()
+            second.close()
+        cleanup.assert_not_called()
+
     def test_plugin_get_credential_fields(self, plugin_dir, mock_plugin_code):
         """Test retrieving credential fields from plugin"""
         plugin_file = plugin_dir / "mock_plugin.py"
@@ -464,6 +852,20 @@ class MockService(ImageHostPlugin):
         assert fields['api_key']['type'] == 'password'
         assert fields['api_key']['required'] is True
 
+    def test_plugin_credential_fields_json(self, plugin_dir, mock_plugin_code):
+        """Test JSON-encoded credential fields match the dict form"""
+        import json
+
+        plugin_file = plugin_dir / "mock_plugin.py"
+        plugin_file.write_text(mock_plugin_code)
+
+        registry = ServiceRegistry(plugin_dir)
+        encoded = registry.get_credential_fields_json("MockService")
+
+        assert json.loads(encoded) == registry.get_credential_fields("MockService")
+        assert registry.get_credential_fields_json("MockService") is encoded
+        assert json.loads(registry.get_upload_options_json("imx.to")) == {}
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,206 @@
+"""
+Unit tests for retry_utils.py - Network Retry Module
+
+Tests error classification, the sync and async retry decorators, and the
+retrying HTTP client wrappers (using httpx.MockTransport, no network).
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from modules.retry_utils import (
+    AsyncRetryableHTTPClient,
+    RetryConfig,
+    RetryableHTTPClient,
+    classify_error,
+    retry_on_network_error,
+    retry_on_network_error_async,
+    _split_transport_kwargs,
+)
+
+
+NO_DELAY = RetryConfig(max_attempts=3, base_delay=0.0)
+
+
+def status_error(status_code):
+    """Build an HTTPStatusError for the given status code."""
+    request = httpx.Request("GET", "https://example.com/")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+def counting_transport(responses, calls):
+    """MockTransport that replays status codes (or raises ConnectError for None)."""
+    def handler(request):
+        status = responses[min(len(calls), len(responses) - 1)]
+        calls.append(request)
+        if status is None:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(status)
+
+    return httpx.MockTransport(handler)
+
+
+class TestClassifyError:
+    """Test suite for classify_error."""
+
+    def test_retryable_status(self):
+        """Test that 429/5xx status errors are retried."""
+        assert classify_error(status_error(503)) == 'retry'
+        assert classify_error(status_error(429)) == 'retry'
+
+    def test_client_errors_are_permanent(self):
+        """Test that auth and other 4xx errors are not retried."""
+        assert classify_error(status_error(401)) == 'permanent'
+        assert classify_error(status_error(404)) == 'permanent'
+
+    def test_network_exception(self):
+        """Test that typed network errors are retried."""
+        assert classify_error(httpx.ConnectError("boom")) == 'retry'
+        assert classify_error(TimeoutError()) == 'retry'
+
+    def test_message_keywords(self):
+        """Test classification of untyped errors by message."""
+        assert classify_error(Exception("Connection RESET by peer")) == 'retry'
+        assert classify_error(Exception("File not found")) == 'permanent'
+        assert classify_error(Exception("something else")) == 'unknown'
+
+
+class TestRetryDecorators:
+    """Test suite for retry_on_network_error and its async variant."""
+
+    def test_retries_on_503(self):
+        """Test that a 503 response is retried until it succeeds."""
+        calls = []
+        client = httpx.Client(transport=counting_transport([503, 200], calls))
+
+        @retry_on_network_error(NO_DELAY)
+        def fetch():
+            return client.get("https://example.com/").raise_for_status()
+
+        assert fetch().status_code == 200
+        assert len(calls) == 2
+
+    def test_no_retry_on_401(self):
+        """Test that a 401 response is raised immediately."""
+        calls = []
+        client = httpx.Client(transport=counting_transport([401], calls))
+
+        @retry_on_network_error(NO_DELAY)
+        def fetch():
+            return client.get("https://example.com/").raise_for_status()
+
+        with pytest.raises(httpx.HTTPStatusError):
+            fetch()
+        assert len(calls) == 1
+
+    def test_async_retries_on_503(self):
+        """Test that the async decorator retries a 503 response."""
+        calls = []
+
+        async def main():
+            async with httpx.AsyncClient(transport=counting_transport([503, 503, 200], calls)) as client:
+                @retry_on_network_error_async(NO_DELAY)
+                async def fetch():
+                    return (await client.get("https://example.com/")).raise_for_status()
+
+                return await fetch()
+
+        assert asyncio.run(main()).status_code == 200
+        assert len(calls) == 3
+
+    def test_async_no_retry_on_401(self):
+        """Test that the async decorator raises a 401 response immediately."""
+        calls = []
+
+        async def main():
+            async with httpx.AsyncClient(transport=counting_transport([401], calls)) as client:
+                @retry_on_network_error_async(NO_DELAY)
+                async def fetch():
+                    return (await client.get("https://example.com/")).raise_for_status()
+
+                return await fetch()
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(main())
+        assert len(calls) == 1
+
+
+class TestRetryableHTTPClients:
+    """Test suite for RetryableHTTPClient and AsyncRetryableHTTPClient."""
+
+    def test_connect_error_retried(self):
+        """Test that connect errors are retried by the Python loop."""
+        calls = []
+        client = RetryableHTTPClient(
+            httpx.Client(transport=counting_transport([None, 200], calls)), NO_DELAY)
+
+        assert client.get("https://example.com/").status_code == 200
+        assert len(calls) == 2
+
+    def test_connect_error_reraised_with_transport_retries(self):
+        """Test that connect errors are not retried again above a retrying transport."""
+        calls = []
+        client = RetryableHTTPClient(
+            httpx.Client(transport=counting_transport([None, 200], calls)), NO_DELAY,
+            transport_retries=True)
+
+        with pytest.raises(httpx.ConnectError):
+            client.get("https://example.com/")
+        assert len(calls) == 1
+
+    def test_async_connect_error_reraised_with_transport_retries(self):
+        """Test the async client re-raises connect errors above a retrying transport."""
+        calls = []
+
+        async def main():
+            client = AsyncRetryableHTTPClient(
+                httpx.AsyncClient(transport=counting_transport([None, 200], calls)), NO_DELAY,
+                transport_retries=True)
+            async with client:
+                return await client.get("https://example.com/")
+
+        with pytest.raises(httpx.ConnectError):
+            asyncio.run(main())
+        assert len(calls) == 1
+
+    def test_async_connect_error_retried(self):
+        """Test the async client retries connect errors without transport retries."""
+        calls = []
+
+        async def main():
+            client = AsyncRetryableHTTPClient(
+                httpx.AsyncClient(transport=counting_transport([None, None, 200], calls)), NO_DELAY)
+            async with client:
+                return await client.get("https://example.com/")
+
+        assert asyncio.run(main()).status_code == 200
+        assert len(calls) == 3
+
+    def test_split_transport_kwargs(self):
+        """Test that transport options are routed to the transport."""
+        limits = httpx.Limits(max_connections=3)
+        transport_kwargs, client_kwargs = _split_transport_kwargs(
+            {'http2': True, 'verify': False, 'limits': limits, 'trust_env': False, 'timeout': 5})
+
+        assert transport_kwargs == {'http2': True, 'verify': False, 'limits': limits, 'trust_env': False}
+        assert client_kwargs == {'trust_env': False, 'timeout': 5}
+
+    def test_create_marks_transport_retries(self):
+        """Test that create() builds clients that rely on transport retries."""
+        client = RetryableHTTPClient.create(NO_DELAY, timeout=5)
+        try:
+            assert client._no_retry
+            assert client.client.timeout == httpx.Timeout(5)
+        finally:
+            client.close()
+
+        async_client = AsyncRetryableHTTPClient.create(NO_DELAY)
+        assert async_client._no_retry
+        asyncio.run(async_client.aclose())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
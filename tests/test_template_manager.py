@@ -0,0 +1,114 @@
+"""
+Unit tests for template_manager.py - Output Templates
+
+Tests [if]/[else] conditional rendering and #key# placeholder substitution.
+"""
+
+import pytest
+
+pytest.importorskip("customtkinter")
+
+from modules.template_manager import (  # noqa: E402
+    TemplateManager,
+    _compile_conditionals,
+    _render_conditionals,
+    _to_format_string,
+)
+
+
+def render(template, data):
+    """Render the conditionals of a template against data."""
+    out = []
+    _render_conditionals(_compile_conditionals(template), data, out)
+    return "".join(out)
+
+
+def fill(text, values):
+    """Substitute #key# placeholders for the given values."""
+    return _to_format_string(text, frozenset(values)).format_map(values)
+
+
+class TestConditionals:
+    """Test suite for [if] blocks."""
+
+    def test_truthy_key(self):
+        """Test that a block renders only when its key has a value."""
+        assert render("[if a]yes[/if]", {'a': '1'}) == "yes"
+        assert render("[if a]yes[/if]", {'a': '  '}) == ""
+        assert render("[if a]yes[/if]", {}) == ""
+
+    def test_else_branch(self):
+        """Test that [else] splits the true and false branches."""
+        assert render("[if a]Y[else]N[/if]", {'a': 'x'}) == "Y"
+        assert render("[if a]Y[else]N[/if]", {'a': ''}) == "N"
+
+    def test_only_first_else_splits(self):
+        """Test that a second [else] stays in the false branch."""
+        assert render("[if a]1[else]2[else]3[/if]", {'a': ''}) == "2[else]3"
+
+    def test_key_value(self):
+        """Test [if key=value] comparison, ignoring surrounding whitespace."""
+        template = "[if b=2]two[else]other[/if]"
+        assert render(template, {'b': '2'}) == "two"
+        assert render(template, {'b': ' 2 '}) == "two"
+        assert render(template, {'b': '3'}) == "other"
+        assert render("[if b= 2 ]two[/if]", {'b': 2}) == "two"
+
+    def test_case_insensitive_tags(self):
+        """Test that tags match regardless of case."""
+        assert render("[IF a]x[/If]", {'a': '1'}) == "x"
+
+    def test_nesting(self):
+        """Test that blocks nest with innermost binding first."""
+        template = "[if a]A[if b]B[else]notB[/if][else]notA[/if]"
+        assert render(template, {'a': '1', 'b': '1'}) == "AB"
+        assert render(template, {'a': '1', 'b': ''}) == "AnotB"
+        assert render(template, {'a': '', 'b': '1'}) == "notA"
+
+    def test_unclosed_block_is_literal(self):
+        """Test that an [if] without [/if] is left as text."""
+        assert render("[if a]x", {'a': '1'}) == "[if a]x"
+        assert render("pre [if a]x [if b]y[/if]", {'a': '1', 'b': '1'}) == "pre [if a]x y"
+
+    def test_stray_if_text_is_literal(self):
+        """Test that malformed "[if" text keeps enclosing blocks literal."""
+        template = "[if a]x [if y[/if]"
+        assert render(template, {'a': '1'}) == template
+
+    def test_stray_closer_is_literal(self):
+        """Test that a [/if] without an opener is left as text."""
+        assert render("x[/if]", {}) == "x[/if]"
+
+
+class TestPlaceholders:
+    """Test suite for #key# substitution."""
+
+    def test_known_keys(self):
+        """Test that known placeholders are replaced."""
+        assert fill("#a# and #b#", {'a': 'A', 'b': 'B'}) == "A and B"
+
+    def test_literal_braces(self):
+        """Test that braces in templates and values are kept as-is."""
+        assert fill("{#a#} {}", {'a': '{x}'}) == "{{x}} {}"
+
+    def test_unknown_tokens_kept(self):
+        """Test that #word# text without a value is left alone."""
+        assert fill("#b# #a# #1#", {'a': 'A'}) == "#b# A #1#"
+
+    def test_overlapping_tokens(self):
+        """Test that overlapping #a#b# text is replaced left to right."""
+        assert fill("#a#b#", {'a': 'A', 'b': 'B'}) == "Ab#"
+        assert fill("#x#a#", {'a': 'A'}) == "#xA"
+
+    def test_values_not_rescanned(self, tmp_path, monkeypatch):
+        """Test that a value containing #key# is not substituted again."""
+        monkeypatch.chdir(tmp_path)
+        mgr = TemplateManager()
+        mgr.set_template("Plain", "[if gallery_name]#gallery_name#: [/if]#gallery_link#")
+
+        output = mgr.apply("Plain", {'gallery_name': '#gallery_link#', 'gallery_link': 'L'}, [])
+        assert output == "#gallery_link#: L"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -94,6 +94,49 @@ class TestThumbnailCache:
         assert result is None
         assert cache.misses == 1
 
+    def test_mtime_ttl_reuses_stat(self, test_image, monkeypatch):
+        """Test that mtime_ttl reuses a recent stat and clear() forgets it."""
+        cache = ThumbnailCache(max_memory_items=5, mtime_ttl=60)
+        calls = []
+        real_getmtime = os.path.getmtime
+
+        def counting_getmtime(path):
+            calls.append(path)
+            return real_getmtime(path)
+
+        monkeypatch.setattr(os.path, "getmtime", counting_getmtime)
+
+        cache.get(test_image, (50, 50))
+        cache.get(test_image, (50, 50))
+        assert len(calls) == 1
+
+        cache.clear()
+        cache.get(test_image, (50, 50))
+        assert len(calls) == 2
+
+    def test_get_many_generates_misses(self, cache, tmp_path, test_image):
+        """Test that get_many returns hits, generates misses and caches them."""
+        other = tmp_path / "other.jpg"
+        Image.new('RGB', (100, 100), color='green').save(other)
+        broken = tmp_path / "broken.jpg"
+        broken.write_bytes(b"not an image")
+
+        img = Image.open(test_image)
+        img.thumbnail((50, 50))
+        cache.put(test_image, img.copy(), (50, 50))
+
+        def generator(path):
+            with Image.open(path) as src:
+                src.thumbnail((50, 50))
+                return src.copy()
+
+        results = cache.get_many([test_image, str(other), str(broken)], (50, 50), generator)
+
+        assert results[test_image] is not None
+        assert results[str(other)] is not None
+        assert results[str(broken)] is None
+        assert cache.get(str(other), (50, 50)) is not None
+
     def test_cache_stats_accuracy(self, cache, test_image):
         """Test that cache statistics are accurate."""
         img = Image.open(test_image)
@@ -227,6 +270,18 @@ class TestThumbnailCacheDiskPersistence:
         result = cache2.get(test_image, (50, 50))
         assert result is not None
 
+    def test_legacy_pickle_entry_purged(self, cache_with_disk, test_image):
+        """Test that old pickled disk entries are treated as misses and removed."""
+        import pickle
+
+        mtime = os.path.getmtime(test_image)
+        disk_path = cache_with_disk._get_disk_cache_path(
+            cache_with_disk._get_cache_key(test_image, mtime))
+        disk_path.write_bytes(pickle.dumps({'not': 'an image'}))
+
+        assert cache_with_disk.get(test_image, (50, 50)) is None
+        assert not disk_path.exists()
+
     def test_clear_disk_cache(self, cache_with_disk, test_image):
         """Test that disk cache can be cleared."""
         img = Image.open(test_image)